@@ -0,0 +1,56 @@
+"""
+Benchmark for argument parsing in discord.ext.commands.
+
+Parses the same invocation through Command._parse_arguments for a few
+common signatures and reports the time per invocation. Run it on two
+revisions to compare them.
+
+Usage, from the repository root: PYTHONPATH=. python benchmarks/bench_commands.py
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Literal, Optional, Union
+
+from discord.ext import commands
+from discord.ext.commands.view import StringView
+
+
+async def simple(ctx, a: int, b: float, c: str):
+    ...
+
+
+async def typed(ctx, number: Union[int, float], mode: Literal['on', 'off'], flag: Optional[bool] = None, *, rest: str):
+    ...
+
+
+async def greedy(ctx, numbers: commands.Greedy[int], *words: str):
+    ...
+
+
+CASES = [
+    ('int, float, str', commands.Command(simple), '1 2.5 hello'),
+    ('union, literal, optional', commands.Command(typed), '1.5 off yes the rest of it'),
+    ('greedy, varargs', commands.Command(greedy), '1 2 3 4 5 a b c'),
+]
+
+
+async def measure(command, content, number=20000):
+    message = SimpleNamespace(content=content, attachments=[], _state=None)
+    start = time.perf_counter()
+    for _ in range(number):
+        ctx = commands.Context(prefix='!', view=StringView(content), bot=None, message=message)
+        await command._parse_arguments(ctx)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+async def main():
+    print(f'{"signature":<28}{"us/invocation":>16}{"invocations/s":>16}')
+    for name, command, content in CASES:
+        elapsed = min([await measure(command, content) for _ in range(3)])
+        print(f'{name:<28}{elapsed:>16.2f}{1e6 / elapsed:>16.0f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
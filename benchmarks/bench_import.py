@@ -0,0 +1,45 @@
+"""
+Import-time benchmark for the discord package.
+
+Each case runs in a fresh interpreter, so nothing is cached between runs.
+``import discord`` only sets up the lazy names; the other cases show the
+cost of first touching a model, the client, and the whole package.
+
+Usage: python benchmarks/bench_import.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+CASES = [
+    ('import discord', 'import discord'),
+    ('discord.Embed', 'import discord; discord.Embed'),
+    ('discord.Client', 'import discord; discord.Client'),
+    ('from discord import *', 'from discord import *'),
+]
+
+TEMPLATE = '''
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(code, runs=7):
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', TEMPLATE.format(code)], text=True)
+        timings.append(float(output) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    print(f'{"case":<26}{"median (ms)":>12}')
+    for name, code in CASES:
+        print(f'{name:<26}{measure(code):>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
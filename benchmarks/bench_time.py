@@ -0,0 +1,58 @@
+"""
+Microbenchmark for the timestamp helpers in discord.utils.
+
+Compares the current helpers against the previous implementations,
+which went through keyword arguments and attribute lookups on every call.
+
+Usage, from the repository root: PYTHONPATH=. python benchmarks/bench_time.py
+"""
+
+import datetime
+import timeit
+
+from discord import utils
+
+TIMESTAMP = '2021-05-03T12:34:56.789000+00:00'
+SNOWFLAKE = 1000000000000000000
+
+
+def legacy_parse_time(timestamp):
+    if timestamp:
+        return datetime.datetime.fromisoformat(timestamp)
+    return None
+
+
+def legacy_snowflake_time(id):
+    timestamp = ((id >> 22) + utils.DISCORD_EPOCH) / 1000
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+
+
+def legacy_utcnow():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+CASES = [
+    ('parse_time', lambda: legacy_parse_time(TIMESTAMP), lambda: utils.parse_time(TIMESTAMP)),
+    ('snowflake_time', lambda: legacy_snowflake_time(SNOWFLAKE), lambda: utils.snowflake_time(SNOWFLAKE)),
+    (
+        'snowflake_time (epoch ms)',
+        lambda: int(legacy_snowflake_time(SNOWFLAKE).timestamp() * 1000),
+        lambda: utils.snowflake_timestamp(SNOWFLAKE),
+    ),
+    ('utcnow', legacy_utcnow, utils.utcnow),
+]
+
+
+def measure(func, number=200000, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def main():
+    print(f'{"case":<28}{"before (ns)":>14}{"after (ns)":>14}{"speedup":>10}')
+    for name, before, after in CASES:
+        old, new = measure(before), measure(after)
+        print(f'{name:<28}{old:>14.0f}{new:>14.0f}{old / new:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -16,74 +16,237 @@ __version__ = '2.1.0b'
 
 __path__ = __import__('pkgutil').extend_path(__path__, __name__)
 
+import importlib
 import logging
-from typing import Literal, NamedTuple
-
-from . import abc as abc, opus as opus, utils as utils
-from .activity import *
-from .affinity import *
-from .application import *
-from .asset import *
-from .audit_logs import *
-from .automod import *
-from .billing import *
-from .calls import *
-from .channel import *
-from .client import *
-from .colour import *
-from .commands import *
-from .components import *
-from .connections import *
-from .directory import *
-from .embeds import *
-from .emoji import *
-from .entitlements import *
-from .enums import *
-from .errors import *
-from .experiment import *
-from .file import *
-from .flags import *
-from .guild import *
-from .guild_premium import *
-from .integrations import *
-from .interactions import *
-from .invite import *
-from .library import *
-from .member import *
-from .mentions import *
-from .message import *
-from .metadata import *
-from .modal import *
-from .object import *
-from .oauth2 import *
-from .partial_emoji import *
-from .payments import *
-from .permissions import *
-from .player import *
-from .poll import *
-from .primary_guild import *
-from .profile import *
-from .promotions import *
-from .raw_models import *
-from .read_state import *
-from .reaction import *
-from .relationship import *
-from .role import *
-from .scheduled_event import *
-from .settings import *
-from .stage_instance import *
-from .sticker import *
-from .store import *
-from .subscriptions import *
-from .team import *
-from .template import *
-from .threads import *
-from .tutorial import *
-from .user import *
-from .voice_client import *
-from .webhook import *
-from .welcome_screen import *
-from .widget import *
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, NamedTuple, Tuple
+
+if TYPE_CHECKING:
+    from . import abc as abc, opus as opus, utils as utils
+    from .activity import *
+    from .affinity import *
+    from .application import *
+    from .asset import *
+    from .audit_logs import *
+    from .automod import *
+    from .billing import *
+    from .cache import *
+    from .calls import *
+    from .channel import *
+    from .client import *
+    from .colour import *
+    from .commands import *
+    from .components import *
+    from .connections import *
+    from .directory import *
+    from .embeds import *
+    from .emoji import *
+    from .entitlements import *
+    from .enums import *
+    from .errors import *
+    from .experiment import *
+    from .file import *
+    from .flags import *
+    from .guild import *
+    from .guild_premium import *
+    from .integrations import *
+    from .interactions import *
+    from .invite import *
+    from .library import *
+    from .member import *
+    from .mentions import *
+    from .message import *
+    from .metadata import *
+    from .modal import *
+    from .object import *
+    from .oauth2 import *
+    from .partial_emoji import *
+    from .payments import *
+    from .permissions import *
+    from .player import *
+    from .poll import *
+    from .primary_guild import *
+    from .profile import *
+    from .promotions import *
+    from .raw_models import *
+    from .read_state import *
+    from .reaction import *
+    from .relationship import *
+    from .role import *
+    from .scheduled_event import *
+    from .settings import *
+    from .stage_instance import *
+    from .sticker import *
+    from .store import *
+    from .subscriptions import *
+    from .team import *
+    from .template import *
+    from .threads import *
+    from .tutorial import *
+    from .user import *
+    from .voice_client import *
+    from .webhook import *
+    from .welcome_screen import *
+    from .widget import *
+
+# Public names are imported from their module on first access instead of with the package,
+# so ``import discord`` doesn't pull in the whole library (and its dependencies) up front
+# fmt: off
+_lazy_exports: Dict[str, Tuple[str, ...]] = {
+    'activity': ('BaseActivity', 'Activity', 'Streaming', 'Game', 'Spotify', 'CustomActivity', 'Session'),
+    'affinity': ('UserAffinity', 'GuildAffinity', 'ChannelAffinity'),
+    'application': (
+        'Company', 'EULA', 'ThirdPartySKU', 'EmbeddedActivityPlatformConfig', 'EmbeddedActivityConfig', 'ApplicationBot',
+        'ApplicationExecutable', 'ApplicationInstallParams', 'ApplicationAsset', 'ApplicationActivityStatistics',
+        'ManifestLabel', 'Manifest', 'ApplicationBuild', 'ApplicationBranch', 'ApplicationTester', 'PartialApplication',
+        'Application', 'IntegrationApplication', 'DetectableApplication', 'UnverifiedApplication',
+    ),
+    'asset': ('Asset',),
+    'audit_logs': ('AuditLogDiff', 'AuditLogChanges', 'AuditLogEntry'),
+    'automod': ('AutoModRuleAction', 'AutoModTrigger', 'AutoModRule', 'AutoModAction'),
+    'billing': ('BillingAddress', 'PaymentSource', 'PremiumUsage'),
+    'cache': ('CachePolicy',),
+    'calls': ('CallMessage', 'PrivateCall', 'GroupCall'),
+    'channel': (
+        'TextChannel', 'VoiceChannel', 'StageChannel', 'CategoryChannel', 'ForumTag', 'ForumChannel', 'DirectoryChannel',
+        'DMChannel', 'GroupChannel', 'PartialMessageable',
+    ),
+    'client': ('Client',),
+    'colour': ('Colour', 'Color'),
+    'commands': ('BaseCommand', 'UserCommand', 'MessageCommand', 'SlashCommand', 'SubCommand', 'Option', 'OptionChoice'),
+    'components': ('Component', 'ActionRow', 'Button', 'SelectMenu', 'SelectOption', 'TextInput'),
+    'connections': ('PartialConnection', 'Connection'),
+    'directory': ('DirectoryEntry',),
+    'embeds': ('Embed',),
+    'emoji': ('Emoji',),
+    'entitlements': ('Entitlement', 'Gift', 'GiftBatch'),
+    'enums': (
+        'Enum', 'ChannelType', 'MessageType', 'SpeakingState', 'VerificationLevel', 'ContentFilter', 'Status',
+        'DefaultAvatar', 'AuditLogAction', 'AuditLogActionCategory', 'UserFlags', 'NameFont', 'NameEffect', 'ActivityType',
+        'NotificationLevel', 'HighlightLevel', 'ApplicationMembershipState', 'PayoutAccountStatus', 'PayoutStatus',
+        'PayoutReportType', 'WebhookType', 'ExpireBehaviour', 'ExpireBehavior', 'StickerType', 'StickerFormatType',
+        'InviteTarget', 'VideoQualityMode', 'ComponentType', 'ButtonStyle', 'TextStyle', 'GiftStyle', 'PrivacyLevel',
+        'InteractionType', 'NSFWLevel', 'MFALevel', 'Locale', 'EntityType', 'EventStatus', 'ApplicationCommandType',
+        'AppCommandType', 'ApplicationCommandOptionType', 'AppCommandOptionType', 'RelationshipType',
+        'FriendSuggestionReasonType', 'HypeSquadHouse', 'PremiumType', 'UserContentFilter', 'Theme',
+        'StickerAnimationOptions', 'SpoilerRenderOptions', 'InboxTab', 'EmojiPickerSection', 'StickerPickerSection',
+        'RequiredActionType', 'ReportType', 'ApplicationVerificationState', 'StoreApplicationState', 'RPCApplicationState',
+        'ApplicationDiscoverabilityState', 'InviteType', 'ScheduledEventStatus', 'ScheduledEventEntityType',
+        'ApplicationType', 'EmbeddedActivityPlatform', 'EmbeddedActivityOrientation', 'EmbeddedActivityLabelType',
+        'EmbeddedActivityReleasePhase', 'ConnectionType', 'ClientType', 'PaymentSourceType', 'PaymentGateway',
+        'SubscriptionType', 'SubscriptionStatus', 'SubscriptionInvoiceStatus', 'SubscriptionDiscountType',
+        'SubscriptionInterval', 'SubscriptionPlanPurchaseType', 'PaymentStatus', 'ApplicationAssetType', 'SKUType',
+        'SKUAccessLevel', 'SKUProductLine', 'SKUFeature', 'SKUGenre', 'OperatingSystem', 'ContentRatingAgency',
+        'Distributor', 'EntitlementType', 'RefundReason', 'RefundDisqualificationReason', 'AutoModRuleTriggerType',
+        'AutoModRuleEventType', 'AutoModRuleActionType', 'ForumLayoutType', 'ForumOrderType', 'ReadStateType',
+        'DirectoryEntryType', 'DirectoryCategory', 'HubType', 'NetworkConnectionType', 'NetworkConnectionSpeed',
+        'PollLayoutType', 'MessageReferenceType',
+    ),
+    'errors': (
+        'DiscordException', 'ClientException', 'GatewayNotFound', 'HTTPException', 'RateLimited', 'Forbidden', 'NotFound',
+        'DiscordServerError', 'InvalidData', 'AuthFailure', 'LoginFailure', 'ConnectionClosed', 'CaptchaRequired',
+    ),
+    'experiment': (
+        'ExperimentRollout', 'ExperimentFilters', 'ExperimentPopulation', 'ExperimentOverride', 'HoldoutExperiment',
+        'GuildExperiment', 'UserExperiment',
+    ),
+    'file': ('File', 'CloudFile'),
+    'flags': (
+        'Capabilities', 'SystemChannelFlags', 'MessageFlags', 'PublicUserFlags', 'PrivateUserFlags', 'MemberCacheFlags',
+        'ApplicationFlags', 'ChannelFlags', 'PremiumUsageFlags', 'PurchasedFlags', 'PaymentSourceFlags', 'SKUFlags',
+        'PaymentFlags', 'PromotionFlags', 'GiftFlags', 'LibraryApplicationFlags', 'ApplicationDiscoveryFlags',
+        'OverlayMethodFlags', 'FriendSourceFlags', 'FriendDiscoveryFlags', 'HubProgressFlags', 'OnboardingProgressFlags',
+        'AutoModPresets', 'MemberFlags', 'ReadStateFlags', 'InviteFlags', 'AttachmentFlags', 'EmbedFlags', 'RoleFlags',
+    ),
+    'guild': ('Guild', 'UserGuild', 'BanEntry'),
+    'guild_premium': ('PremiumGuildSubscription', 'PremiumGuildSubscriptionSlot', 'PremiumGuildSubscriptionCooldown'),
+    'integrations': ('IntegrationAccount', 'Integration', 'StreamIntegration', 'BotIntegration'),
+    'interactions': ('Interaction',),
+    'invite': ('PartialInviteChannel', 'PartialInviteGuild', 'Invite'),
+    'library': ('LibrarySKU', 'LibraryApplication'),
+    'member': ('VoiceState', 'Member'),
+    'mentions': ('AllowedMentions',),
+    'message': (
+        'Attachment', 'Message', 'PartialMessage', 'MessageReference', 'MessageSnapshot', 'DeletedReferencedMessage',
+        'RoleSubscriptionInfo', 'GuildProductPurchase', 'PurchaseNotification',
+    ),
+    'metadata': ('Metadata',),
+    'modal': ('Modal',),
+    'object': ('Object',),
+    'oauth2': ('OAuth2Token', 'OAuth2Authorization'),
+    'partial_emoji': ('PartialEmoji',),
+    'payments': ('Payment', 'BRAINTREE_KEY', 'STRIPE_KEY', 'ADYEN_KEY'),
+    'permissions': ('Permissions', 'PermissionOverwrite'),
+    'player': ('AudioSource', 'PCMAudio', 'FFmpegAudio', 'FFmpegPCMAudio', 'FFmpegOpusAudio', 'PCMVolumeTransformer'),
+    'poll': ('Poll', 'PollAnswer', 'PollMedia'),
+    'primary_guild': ('PrimaryGuild',),
+    'profile': ('ProfileMetadata', 'ApplicationProfile', 'MutualGuild', 'ProfileBadge', 'UserProfile', 'MemberProfile'),
+    'promotions': ('Promotion', 'UserOffer', 'TrialOffer', 'DiscountOffer', 'Discount', 'PricingPromotion'),
+    'raw_models': (
+        'RawMessageDeleteEvent', 'RawBulkMessageDeleteEvent', 'RawMessageUpdateEvent', 'RawReactionActionEvent',
+        'RawReactionClearEvent', 'RawReactionClearEmojiEvent', 'RawIntegrationDeleteEvent', 'RawThreadDeleteEvent',
+        'RawThreadMembersUpdate', 'RawMemberRemoveEvent', 'RawMessageAckEvent', 'RawUserFeatureAckEvent',
+        'RawGuildFeatureAckEvent', 'RawPollVoteActionEvent',
+    ),
+    'read_state': ('ReadState',),
+    'reaction': ('Reaction',),
+    'relationship': ('Relationship', 'FriendSuggestionReason', 'FriendSuggestion'),
+    'role': ('RoleTags', 'Role'),
+    'scheduled_event': ('ScheduledEvent',),
+    'settings': (
+        'UserSettings', 'GuildFolder', 'GuildProgress', 'AudioContext', 'LegacyUserSettings', 'MuteConfig',
+        'ChannelSettings', 'GuildSettings', 'TrackingSettings', 'EmailSettings',
+    ),
+    'stage_instance': ('StageInstance',),
+    'sticker': ('StickerPack', 'StickerItem', 'Sticker', 'StandardSticker', 'GuildSticker'),
+    'store': (
+        'StoreAsset', 'StoreNote', 'SystemRequirements', 'StoreListing', 'SKUPrice', 'ContentRating', 'SKU',
+        'SubscriptionPlanPrices', 'SubscriptionPlan',
+    ),
+    'subscriptions': (
+        'SubscriptionItem', 'SubscriptionDiscount', 'SubscriptionInvoiceItem', 'SubscriptionInvoice',
+        'SubscriptionRenewalMutations', 'Subscription', 'SubscriptionTrial',
+    ),
+    'team': ('Team', 'TeamMember', 'TeamPayout'),
+    'template': ('Template',),
+    'threads': ('Thread', 'ThreadMember'),
+    'tutorial': ('Tutorial',),
+    'user': ('User', 'ClientUser', 'RecentAvatar', 'DisplayNameStyle'),
+    'voice_client': ('VoiceProtocol', 'VoiceClient'),
+    'webhook': (
+        'Webhook', 'WebhookMessage', 'PartialWebhookChannel', 'PartialWebhookGuild', 'SyncWebhook', 'SyncWebhookMessage',
+    ),
+    'welcome_screen': ('WelcomeChannel', 'WelcomeScreen'),
+    'widget': ('WidgetChannel', 'WidgetMember', 'Widget'),
+}
+# fmt: on
+
+_lazy_names: Dict[str, str] = {name: module for module, names in _lazy_exports.items() for name in names}
+
+__all__ = (*_lazy_names, 'abc', 'opus', 'utils', 'version_info')
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _lazy_names[name]
+    except KeyError:
+        if name.startswith('__'):
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+        # Submodules such as discord.utils are loaded on access too
+        try:
+            return importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_lazy_names})
 
 
 class _VersionInfo(NamedTuple):
@@ -99,4 +262,4 @@ version_info: _VersionInfo = _VersionInfo(major=2, minor=1, micro=0, releaseleve
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 
-del logging, NamedTuple, Literal, _VersionInfo
+del logging, TYPE_CHECKING, Any, Dict, List, Literal, NamedTuple, Tuple, _VersionInfo
@@ -1109,7 +1109,7 @@ class GuildChannel:
             return Permissions.all()
 
         default = self.guild.default_role
-        base = Permissions(default.permissions.value)
+        base = default.permissions
 
         # Handle the role case first
         if isinstance(obj, Role):
@@ -1365,7 +1365,7 @@ class GuildChannel:
         obj = cls(state=self._state, guild=self.guild, data=data)
 
         # Temporarily add it to the cache
-        self.guild._channels[obj.id] = obj  # type: ignore # obj is a GuildChannel
+        self.guild._add_channel(obj)  # type: ignore # obj is a GuildChannel
         return obj
 
     async def clone(
@@ -0,0 +1,297 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import itertools
+import time
+from typing import (
+    Any,
+    Dict,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    ValuesView,
+)
+
+# fmt: off
+__all__ = (
+    'CachePolicy',
+)
+# fmt: on
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class CachePolicy:
+    """Represents how many entries an internal cache may hold and for how long.
+
+    This is passed to :class:`Client` through the ``cache_policies`` parameter to bound caches that
+    would otherwise grow for the lifetime of the session. Evicted entries are recreated from the
+    next gateway payload that contains them.
+
+    Subclasses may override :meth:`create_cache` to provide their own storage.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    max_size: Optional[:class:`int`]
+        The maximum number of entries to keep. When exceeded, the least recently
+        used entry is evicted. Defaults to ``None`` (unbounded).
+    ttl: Optional[:class:`float`]
+        The number of seconds an entry is kept for after it was last stored.
+        Defaults to ``None`` (entries never expire).
+    lru: :class:`bool`
+        Whether reading an entry counts as using it. If ``True``, the default, reads
+        move the entry to the back of the eviction order and renew its lifetime.
+        If ``False``, entries are evicted in the order they were stored.
+
+    Attributes
+    -----------
+    max_size: Optional[:class:`int`]
+        The maximum number of entries to keep.
+    ttl: Optional[:class:`float`]
+        The number of seconds an entry is kept for.
+    lru: :class:`bool`
+        Whether reading an entry counts as using it.
+    """
+
+    __slots__ = ('max_size', 'ttl', 'lru')
+
+    def __init__(self, *, max_size: Optional[int] = None, ttl: Optional[float] = None, lru: bool = True) -> None:
+        if max_size is not None and max_size <= 0:
+            raise ValueError('max_size must be greater than 0')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be greater than 0')
+
+        self.max_size: Optional[int] = max_size
+        self.ttl: Optional[float] = ttl
+        self.lru: bool = lru
+
+    def __repr__(self) -> str:
+        return f'<CachePolicy max_size={self.max_size} ttl={self.ttl} lru={self.lru}>'
+
+    def create_cache(self) -> MutableMapping[Any, Any]:
+        """Creates a new, empty cache that follows this policy.
+
+        Returns
+        --------
+        MutableMapping[Any, Any]
+            The new cache.
+        """
+        if self.max_size is None and self.ttl is None:
+            return {}
+        return BoundedCache(max_size=self.max_size, ttl=self.ttl, lru=self.lru)
+
+
+class BoundedCache(MutableMapping[K, V]):
+    # Entries are kept in eviction order, which is also expiry order since
+    # every write (and every read, for LRU) moves the entry to the back.
+    __slots__ = ('_data', '_deadlines', 'max_size', 'ttl', 'lru')
+
+    def __init__(self, *, max_size: Optional[int] = None, ttl: Optional[float] = None, lru: bool = True) -> None:
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._deadlines: Dict[K, float] = {}
+        self.max_size: Optional[int] = max_size
+        self.ttl: Optional[float] = ttl
+        self.lru: bool = lru
+
+    def __repr__(self) -> str:
+        return f'<BoundedCache entries={len(self._data)} max_size={self.max_size} ttl={self.ttl}>'
+
+    # Anything that exposes the entries as a whole drops the expired ones first.
+    # Views are live, so entries that expire after they were created still show up in them.
+
+    def __len__(self) -> int:
+        self.expire()
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        self.expire()
+        return iter(self._data)
+
+    def __reversed__(self) -> Iterator[K]:
+        self.expire()
+        return reversed(self._data)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._data.__sizeof__() + self._deadlines.__sizeof__()
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self._data:
+            return False
+        if self.ttl is not None and self._deadlines[key] <= time.monotonic():  # type: ignore
+            del self[key]  # type: ignore
+            return False
+        return True
+
+    def __getitem__(self, key: K) -> V:
+        value = self._data[key]
+        if self.ttl is not None:
+            now = time.monotonic()
+            if self._deadlines[key] <= now:
+                del self[key]
+                raise KeyError(key)
+            if self.lru:
+                self._deadlines[key] = now + self.ttl
+        if self.lru:
+            self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+
+        if self.ttl is not None:
+            now = time.monotonic()
+            self._deadlines[key] = now + self.ttl
+            self.expire(now)
+
+        if self.max_size is not None:
+            while len(data) > self.max_size:
+                evicted, _ = data.popitem(last=False)
+                self._deadlines.pop(evicted, None)
+
+    def __delitem__(self, key: K) -> None:
+        del self._data[key]
+        self._deadlines.pop(key, None)
+
+    def keys(self) -> KeysView[K]:
+        self.expire()
+        return self._data.keys()
+
+    def values(self) -> ValuesView[V]:
+        self.expire()
+        return self._data.values()
+
+    def items(self) -> ItemsView[K, V]:
+        self.expire()
+        return self._data.items()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._deadlines.clear()
+
+    def expire(self, now: Optional[float] = None) -> int:
+        if self.ttl is None:
+            return 0
+
+        now = time.monotonic() if now is None else now
+        data = self._data
+        deadlines = self._deadlines
+        expired = 0
+        while data:
+            key = next(iter(data))
+            if deadlines[key] > now:
+                break
+            del data[key]
+            del deadlines[key]
+            expired += 1
+        return expired
+
+
+class NameIndex:
+    # Maps the values of some string attributes to the IDs of the objects that
+    # have them. Nothing is updated automatically, so owners must call add()
+    # whenever one of the attributes changes and discard() when an object goes away.
+    # The IDs an object resolves to still have to be checked against the object,
+    # since IDs of objects that were dropped without a discard() are kept.
+    __slots__ = ('_names', '_keys', '_order', '_sequence')
+
+    def __init__(self, *attrs: str, objects: Iterable[Any] = ()) -> None:
+        self._names: Dict[str, Dict[str, Dict[int, None]]] = {attr: {} for attr in attrs}
+        self._keys: Dict[int, Tuple[Optional[str], ...]] = {}
+        # When each ID was first added, renames keep it so lookups follow the owner's order
+        self._order: Dict[int, int] = {}
+        self._sequence: Iterator[int] = itertools.count()
+        for obj in objects:
+            self.add(obj)
+
+    def __repr__(self) -> str:
+        return f'<NameIndex attrs={tuple(self._names)} entries={len(self._keys)}>'
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, obj_id: object) -> bool:
+        return obj_id in self._keys
+
+    def add(self, obj: Any) -> None:
+        obj_id = obj.id
+        keys = tuple(getattr(obj, attr) for attr in self._names)
+        old = self._keys.get(obj_id)
+        if old == keys:
+            return
+        if old is not None:
+            self._unlink(obj_id, old)
+        else:
+            self._order[obj_id] = next(self._sequence)
+
+        self._keys[obj_id] = keys
+        for names, key in zip(self._names.values(), keys):
+            if key is None:
+                continue
+            try:
+                names[key][obj_id] = None
+            except KeyError:
+                names[key] = {obj_id: None}
+
+    def discard(self, obj_id: int) -> None:
+        keys = self._keys.pop(obj_id, None)
+        if keys is not None:
+            self._unlink(obj_id, keys)
+            del self._order[obj_id]
+
+    def _unlink(self, obj_id: int, keys: Tuple[Optional[str], ...]) -> None:
+        for names, key in zip(self._names.values(), keys):
+            ids = names.get(key) if key is not None else None
+            if ids is not None:
+                ids.pop(obj_id, None)
+                if not ids:
+                    del names[key]  # type: ignore # key is not None here
+
+    def get(self, attr: str, name: str) -> Tuple[int, ...]:
+        ids = self._names[attr].get(name)
+        return tuple(ids) if ids else ()
+
+    def find(self, attrs: Iterable[str], name: str) -> List[int]:
+        # The IDs of the objects with any of the attributes set to name, in the order they were added
+        found: Dict[int, None] = {}
+        for attr in attrs:
+            ids = self._names[attr].get(name)
+            if ids:
+                found.update(ids)
+        if len(found) > 1:
+            return sorted(found, key=self._order.__getitem__)
+        return list(found)
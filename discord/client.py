@@ -67,7 +67,7 @@ from .gateway import ConnectionClosed
 from .activity import ActivityTypes, BaseActivity, Session, Spotify, create_activity
 from .voice_client import VoiceClient
 from .http import HTTPClient
-from .state import ConnectionState
+from .state import CacheStats, ConnectionState
 from . import utils
 from .utils import MISSING
 from .object import Object, OLDEST_OBJECT
@@ -112,6 +112,7 @@ if TYPE_CHECKING:
     from .member import Member
     from .voice_client import VoiceProtocol
     from .settings import GuildSettings
+    from .gateway import GatewayStats
     from .billing import BillingAddress
     from .enums import Distributor, OperatingSystem, PaymentGateway, RequiredActionType
     from .metadata import MetadataObject
@@ -195,6 +196,45 @@ class Client:
         If not given, defaults to cache as much as possible.
 
         .. versionadded:: 1.5
+    compact_member_threshold: Optional[:class:`int`]
+        The member count at which a guild's member cache switches to a compact, array-backed
+        representation. Member data is then stored in columns with roles and strings shared
+        between members, and :class:`Member` objects are created when accessed. This greatly
+        reduces memory usage for very large guilds at the cost of slower member access.
+        Passing ``0`` makes every guild compact. Defaults to ``None`` (disabled).
+
+        .. versionadded:: 2.1
+    defer_ready_sections: :class:`bool`
+        Whether to defer parsing the non-essential sections of the READY payload (experiments,
+        guild experiments, consents and the tutorial) until they are first accessed. This
+        shortens the time spent processing READY on large accounts. Defaults to ``False``.
+
+        .. versionadded:: 2.1
+    reconcile_ready: :class:`bool`
+        Whether a READY received after a failed RESUME of the same account is reconciled
+        against the existing cache instead of clearing it. Guilds are then updated in place
+        and the user and message caches are kept, so existing references stay valid and
+        there is less to rebuild. The trade-off is that objects whose removal happened while
+        disconnected, such as users no longer shared with any guild or messages deleted in
+        the meantime, stay cached until they are evicted. Defaults to ``False``, which clears
+        the cache on every READY.
+
+        .. versionadded:: 2.1
+    cache_stats_interval: Optional[:class:`float`]
+        The number of seconds between cache size reports. If given, :meth:`cache_stats`
+        is logged and :func:`on_cache_stats` is dispatched at this interval while the
+        client is running. Defaults to ``None`` (disabled).
+
+        .. versionadded:: 2.1
+    cache_policies: Dict[:class:`str`, :class:`CachePolicy`]
+        Bounds the size and lifetime of caches that otherwise grow for the whole session.
+        Supported keys are ``presences``, ``read_states``, ``call_messages`` and ``interactions``.
+        Presence policies apply to each guild's presences separately, and read state policies
+        to each read state type. Evicted entries are recreated from the next gateway payload
+        containing them; until then, evicted read states report their defaults.
+        Defaults to no bounds.
+
+        .. versionadded:: 2.1
     chunk_guilds_at_startup: :class:`bool`
         Indicates if :func:`.on_ready` should be delayed to chunk all guilds
         at start-up if necessary. This operation is incredibly slow for large
@@ -313,6 +353,55 @@ class Client:
         The timezone name to announce to Discord, in the format of `Region/City`.
         Defaults to system timezone.
 
+        .. versionadded:: 2.1
+    ratelimit_cache_path: Optional[:class:`str`]
+        A file path to persist learned rate limit buckets to. If given, the route to bucket
+        mapping and the state of each rate limit bucket are saved to this file when the client
+        closes and loaded back on startup, which avoids hitting rate limits that are already
+        known after a restart. Multiple processes may share the same file, as each save is merged
+        with the entries already in it. Defaults to ``None``.
+
+        .. versionadded:: 2.1
+    ratelimit_cache_ttl: :class:`float`
+        The maximum age in seconds of a persisted rate limit entry before it is discarded on load.
+        Only applies if ``ratelimit_cache_path`` is given. Defaults to one day.
+
+        .. versionadded:: 2.1
+    coalesce_requests: :class:`bool`
+        Whether to de-duplicate identical ``GET`` requests that are in flight at the same time.
+        If enabled, concurrent fetches of the same route with the same query parameters
+        share a single request (and therefore a single rate limit token). Defaults to ``False``.
+
+        .. versionadded:: 2.1
+    request_cache_ttl: :class:`float`
+        The number of seconds to keep the response of a coalesced ``GET`` request around
+        to serve identical requests made afterwards. Only applies if ``coalesce_requests`` is enabled.
+        Note that cached responses may be slightly out of date. Defaults to ``0`` (no caching).
+
+        .. versionadded:: 2.1
+    max_connections: Optional[:class:`int`]
+        The maximum number of HTTP connections. For API requests, this limits the whole
+        connection pool and the number of requests in flight at once, across all hosts.
+        For CDN requests and uploads, it limits the connections to each host. Defaults to
+        ``10`` for API requests and no limit for CDN requests and uploads.
+
+        .. versionadded:: 2.1
+    http2: :class:`bool`
+        Whether to negotiate HTTP/2 for API requests. When enabled, concurrent requests are
+        multiplexed over a single connection where possible instead of opening new connections.
+        Defaults to ``True``.
+
+        .. versionadded:: 2.1
+    dns_cache_ttl: :class:`int`
+        The number of seconds to cache DNS lookups for. Defaults to ``60``.
+
+        .. versionadded:: 2.1
+    keepalive_timeout: Optional[:class:`float`]
+        The number of seconds a connection is kept around for reuse. For API requests, this
+        is the maximum age of a connection that may be reused. Defaults to ``None``, which keeps
+        the HTTP libraries' own defaults (15 seconds of idling for CDN requests and uploads,
+        about two minutes for API requests).
+
         .. versionadded:: 2.1
 
     Attributes
@@ -343,6 +432,14 @@ class Client:
             rpc_proxy=options.pop('rpc_proxy', None),
             proxy_gateway=options.pop('proxy_gateway', True),
             timezone=options.pop('timezone', None) or None,
+            ratelimit_cache_path=options.pop('ratelimit_cache_path', None),
+            ratelimit_cache_ttl=options.pop('ratelimit_cache_ttl', 86400.0),
+            coalesce_requests=options.pop('coalesce_requests', False),
+            request_cache_ttl=options.pop('request_cache_ttl', 0.0),
+            max_connections=options.pop('max_connections', None),
+            http2=options.pop('http2', True),
+            dns_cache_ttl=options.pop('dns_cache_ttl', 60),
+            keepalive_timeout=options.pop('keepalive_timeout', None),
         )
 
         self._handlers: Dict[str, Callable[..., None]] = {
@@ -358,6 +455,8 @@ class Client:
         self._sync_presences: bool = options.pop('sync_presence', True)
         self._connection: ConnectionState = self._get_state(**options)
         self._closing_task: Optional[asyncio.Task[None]] = None
+        self._cache_stats_interval: Optional[float] = options.pop('cache_stats_interval', None)
+        self._cache_stats_task: Optional[asyncio.Task[None]] = None
         self._ready: asyncio.Event = MISSING
 
         if VoiceClient.warn_nacl:
@@ -431,6 +530,15 @@ class Client:
         ws = self.ws
         return float('nan') if not ws else ws.latency
 
+    @property
+    def gateway_stats(self) -> GatewayStats:
+        """:class:`~discord.gateway.GatewayStats`: Statistics on how gateway sessions were established,
+        resumed and replayed over the lifetime of the client.
+
+        .. versionadded:: 2.1
+        """
+        return self._connection.gateway_stats
+
     def is_ws_ratelimited(self) -> bool:
         """:class:`bool`: Whether the websocket is currently rate limited.
 
@@ -493,6 +601,55 @@ class Client:
         """
         return utils.SequenceProxy(self._connection._messages or [])
 
+    def cache_stats(self, guild: Optional[Snowflake] = None, *, sample: Optional[int] = 100) -> Dict[str, CacheStats]:
+        """Reports the number of objects and the approximate memory usage of the internal caches.
+
+        Sizes are shallow estimates in bytes: each object is counted along with the plain values
+        (strings, numbers, lists, ...) it holds directly, but not the other library objects it
+        references, as those are counted by their own cache. To keep this cheap for large caches,
+        only ``sample`` objects of each cache are measured and the result is extrapolated.
+
+        .. versionadded:: 2.1
+
+        Parameters
+        -----------
+        guild: Optional[:class:`~discord.abc.Snowflake`]
+            The guild to report on. If given, only that guild's member, channel, thread,
+            role, voice state and presence caches are reported.
+        sample: Optional[:class:`int`]
+            The maximum number of objects to measure per cache.
+            Passing ``None`` measures every object.
+
+        Raises
+        -------
+        ValueError
+            The guild is not cached.
+
+        Returns
+        --------
+        Dict[:class:`str`, :class:`~discord.state.CacheStats`]
+            A mapping of cache name to its :class:`~discord.state.CacheStats`,
+            with the ``count`` of cached objects and their approximate ``size`` in bytes.
+        """
+        state = self._connection
+        if guild is None:
+            return state.cache_stats(sample=sample)
+
+        cached = state._get_guild(guild.id)
+        if cached is None:
+            raise ValueError('Guild is not cached')
+        return state.guild_cache_stats(cached, sample=sample)
+
+    async def _report_cache_stats(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            stats = self.cache_stats()
+            _log.info(
+                'Cache report: %s.',
+                ', '.join(f'{name}={entry.count} ({entry.size / 1024:.1f} KiB)' for name, entry in stats.items()),
+            )
+            self.dispatch('cache_stats', stats)
+
     @property
     def connections(self) -> Sequence[Connection]:
         """Sequence[:class:`.Connection`]: The connections that the connected client has.
@@ -873,6 +1030,8 @@ class Client:
         await self._connection.async_setup()
 
         self._ready = asyncio.Event()
+        if self._cache_stats_interval and self._cache_stats_task is None:
+            self._cache_stats_task = loop.create_task(self._report_cache_stats(self._cache_stats_interval))
 
     async def setup_hook(self) -> None:
         """|coro|
@@ -1045,6 +1204,10 @@ class Client:
             return await self._closing_task
 
         async def _close():
+            if self._cache_stats_task is not None:
+                self._cache_stats_task.cancel()
+                self._cache_stats_task = None
+
             for voice in self.voice_clients:
                 try:
                     await voice.disconnect(force=True)
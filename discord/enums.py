@@ -1809,10 +1809,28 @@ class PromotionType(Enum):
     marketing_moment = 5
 
 
+# Unknown values are immutable, so the same one is handed out for repeated lookups
+# The cache is bounded in case Discord sends a large variety of unknown values
+_unknown_values: Dict[Tuple[Any, ...], Any] = {}
+_MAX_UNKNOWN_VALUES = 1024
+
+
 def create_unknown_value(cls: Type[E], val: Any) -> E:
+    key = (cls, val.__class__, val)
+    try:
+        return _unknown_values[key]
+    except (KeyError, TypeError):
+        pass
+
     value_cls = cls._enum_value_cls_  # type: ignore # This is narrowed below
     name = f'unknown_{val}'
-    return value_cls(name=name, value=val)
+    ret = value_cls(name=name, value=val)
+    if len(_unknown_values) < _MAX_UNKNOWN_VALUES:
+        try:
+            _unknown_values[key] = ret
+        except TypeError:
+            pass
+    return ret
 
 
 def try_enum(cls: Type[E], val: Any) -> E:
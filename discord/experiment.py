@@ -24,13 +24,17 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Final, Iterator, List, Optional, Sequence, Tuple, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Final, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+from .cache import BoundedCache
 from .enums import HubType, try_enum
 from .metadata import Metadata
 from .utils import SequenceProxy, SnowflakeList, cached_slot_property, murmurhash32, utcnow
 
 if TYPE_CHECKING:
+    import datetime
+
     from .abc import Snowflake
     from .guild import Guild
     from .state import ConnectionState
@@ -54,6 +58,13 @@ __all__ = (
 )
 
 
+@lru_cache(maxsize=32768)
+def _rollout_hash(key: str) -> int:
+    # The same (experiment, guild) keys are hashed over and over, and the
+    # pure-Python murmurhash fallback is slow enough for this to matter
+    return murmurhash32(key, signed=False)
+
+
 class ExperimentRollout:
     """Represents a rollout for an experiment population.
 
@@ -298,7 +309,7 @@ class ExperimentFilters:
         if range_by_hash is not None:
             # Guild must fulfill the additional population requirements
             hash_key, target = range_by_hash
-            result = murmurhash32(f'{hash_key}:{guild.id}', signed=False)
+            result = _rollout_hash(f'{hash_key}:{guild.id}')
             if result > 0:
                 result += result
             else:
@@ -584,6 +595,7 @@ class GuildExperiment:
         'holdout',
         'aa_mode',
         'trigger_debugging',
+        '_bucket_cache',
     )
 
     def __init__(self, *, state: ConnectionState, data: GuildExperimentPayload):
@@ -617,6 +629,8 @@ class GuildExperiment:
         )
         self.aa_mode: bool = aa_mode == 1
         self.trigger_debugging: bool = trigger_debugging == 1
+        # Bounded so that guilds the user left don't pin entries forever
+        self._bucket_cache: BoundedCache[Tuple[int, bool], Tuple[Tuple[Any, ...], int]] = BoundedCache(max_size=512)
 
     def __repr__(self) -> str:
         return f'<GuildExperiment hash={self.hash}{f" name={self._name!r}" if self._name else ""}>'
@@ -647,6 +661,7 @@ class GuildExperiment:
             raise ValueError('The name provided does not match the experiment hash')
         else:
             self._name = value
+        self._bucket_cache.clear()
 
     def result_for(self, guild: Snowflake, /) -> int:
         """Returns the calulated position of the guild within the experiment (0-9999).
@@ -669,12 +684,28 @@ class GuildExperiment:
         if not self.name:
             raise ValueError('The experiment name must be set to compute the result')
 
-        return murmurhash32(f'{self.name}:{guild.id}', signed=False) % 10000
+        return _rollout_hash(f'{self.name}:{guild.id}') % 10000
+
+    def _guild_signature(self, guild: Guild, now: datetime.datetime, /) -> Tuple[Any, ...]:
+        # Everything that filters and holdouts can depend on; a cached bucket is
+        # only reused while this is unchanged, so guild updates invalidate it
+        holdout = self.holdout
+        return (
+            tuple(guild.features),
+            guild.member_count,
+            guild.vanity_url_code,
+            guild.hub_type,
+            (now - guild.created_at).days,
+            holdout.experiment if holdout is not None else None,
+        )
 
     def bucket_for(self, guild: Guild, /, *, aa_mode: bool = False) -> int:
         """Returns the assigned experiment bucket for a guild.
         Defaults to None (-1) if the guild is not in the experiment.
 
+        The result is cached per guild until the guild's features, member count,
+        vanity URL or hub type change.
+
         Parameters
         -----------
         guild: :class:`Guild`
@@ -694,12 +725,33 @@ class GuildExperiment:
         :class:`int`
             The experiment bucket.
         """
+        name = self.name
+        return self._bucket_for(guild, aa_mode, utcnow(), f'{name}:' if name else None)
+
+    def _bucket_for(self, guild: Guild, aa_mode: bool, now: datetime.datetime, prefix: Optional[str], /) -> int:
+        key = (guild.id, aa_mode)
+        signature = self._guild_signature(guild, now)
+        try:
+            cached_signature, bucket = self._bucket_cache[key]
+        except KeyError:
+            pass
+        else:
+            if cached_signature == signature:
+                return bucket
+
+        bucket = self._compute_bucket(guild, aa_mode, prefix)
+        self._bucket_cache[key] = (signature, bucket)
+        return bucket
+
+    def _compute_bucket(self, guild: Guild, aa_mode: bool, prefix: Optional[str], /) -> int:
         # Overrides take precedence
         for override in self.overrides:
             if guild.id in override.ids:
                 return override.bucket
 
-        hash_result = self.result_for(guild)
+        if prefix is None:
+            raise ValueError('The experiment name must be set to compute the result')
+        hash_result = _rollout_hash(f'{prefix}{guild.id}') % 10000
         for overrides in self.overrides_formatted:
             for override in overrides:
                 if override.is_eligible(guild):
@@ -739,6 +791,34 @@ class GuildExperiment:
         """
         return [x for x in self._state.guilds if self.bucket_for(x) == bucket]
 
+    def buckets_for(self, guilds: Iterable[Guild], /, *, aa_mode: bool = False) -> Dict[int, int]:
+        """Returns the assigned experiment buckets for many guilds at once.
+
+        This is equivalent to calling :meth:`bucket_for` for each guild, but
+        the current time and the experiment's hash key are only computed once.
+
+        Parameters
+        -----------
+        guilds: Iterable[:class:`Guild`]
+            The guilds to compute experiment eligibility for.
+        aa_mode: :class:`bool`
+            Whether to return the buckets for A/A mode.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The experiment name is unset and a guild is not overridden.
+
+        Returns
+        -------
+        Dict[:class:`int`, :class:`int`]
+            A mapping of guild ID to experiment bucket.
+        """
+        name = self.name
+        now = utcnow()
+        prefix = f'{name}:' if name else None
+        return {guild.id: self._bucket_for(guild, aa_mode, now, prefix) for guild in guilds}
+
 
 class UserExperiment:
     """Represents a user's experiment assignment.
@@ -18,3 +18,4 @@ from .errors import *
 from .flags import *
 from .help import *
 from .parameters import *
+from .prefix import *
@@ -32,17 +32,20 @@ import inspect
 import importlib.util
 import sys
 import logging
+import time
 import types
 from typing import (
     Any,
     Callable,
     Mapping,
+    MutableMapping,
     List,
     Dict,
     TYPE_CHECKING,
     Optional,
     TypeVar,
     Type,
+    Tuple,
     Union,
     Iterable,
     Collection,
@@ -50,14 +53,16 @@ from typing import (
 )
 
 import discord
+from discord.cache import BoundedCache, CachePolicy
 from discord.utils import MISSING, _is_submodule
 
-from .core import GroupMixin
+from .core import GroupMixin, _first_failed_check
 from .view import StringView
 from .context import Context
 from . import errors
 from .help import HelpCommand, DefaultHelpCommand
 from .cog import Cog
+from .prefix import PrefixMatcher, _compile_prefix
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -65,7 +70,8 @@ if TYPE_CHECKING:
     import importlib.machinery
 
     from discord.message import Message
-    from discord.abc import User
+    from discord.abc import Snowflake, User
+    from .core import Command
     from ._types import (
         _Bot,
         BotT,
@@ -134,10 +140,15 @@ def when_mentioned_or(*prefixes: str) -> Callable[[_Bot, Message], List[str]]:
     :func:`.when_mentioned`
     """
 
+    composed: Dict[int, List[str]] = {}
+
     def inner(bot, msg):
-        r = list(prefixes)
-        r = when_mentioned(bot, msg) + r
-        return r
+        # bot.user will never be None when this is called
+        try:
+            r = composed[bot.user.id]
+        except KeyError:
+            r = composed[bot.user.id] = when_mentioned(bot, msg) + list(prefixes)
+        return r.copy()
 
     return inner
 
@@ -172,6 +183,18 @@ class BotBase(GroupMixin[None]):
         self.owner_id: Optional[int] = options.get('owner_id')
         self.owner_ids: Optional[Collection[int]] = options.get('owner_ids', set())
         self.strip_after_prefix: bool = options.get('strip_after_prefix', False)
+        self._concurrent_checks: bool = options.get('concurrent_checks', False)
+
+        prefix_cache: Optional[CachePolicy] = options.get('prefix_cache')
+        if prefix_cache is not None and not isinstance(prefix_cache, CachePolicy):
+            raise TypeError(f'prefix_cache must be a CachePolicy not {prefix_cache.__class__.__name__}')
+
+        # Matchers returned with a ttl are cached even if prefix_cache isn't given.
+        self._cache_prefixes: bool = prefix_cache is not None
+        # Entries are (matcher, deadline) with the deadline stamped when the matcher is stored.
+        self._prefix_cache: MutableMapping[int, Tuple[PrefixMatcher, Optional[float]]] = (
+            BoundedCache(max_size=1000) if prefix_cache is None else prefix_cache.create_cache()
+        )
 
         if self.owner_id and self.owner_ids:
             raise TypeError('Both owner_id and owner_ids are set')
@@ -381,6 +404,9 @@ class BotBase(GroupMixin[None]):
         if len(data) == 0:
             return True
 
+        if self._concurrent_checks:
+            return await _first_failed_check(data, ctx) == -1
+
         return await discord.utils.async_all(f(ctx) for f in data)  # type: ignore
 
     async def is_owner(self, user: User, /) -> bool:
@@ -975,6 +1001,17 @@ class BotBase(GroupMixin[None]):
 
     # help command stuff
 
+    def add_command(self, command: Command[Any, ..., Any], /) -> None:
+        super().add_command(command)
+        if self._help_command is not None:
+            self._help_command.clear_page_cache()
+
+    def remove_command(self, name: str, /) -> Optional[Command[Any, ..., Any]]:
+        command = super().remove_command(name)
+        if command is not None and self._help_command is not None:
+            self._help_command.clear_page_cache()
+        return command
+
     @property
     def help_command(self) -> Optional[HelpCommand]:
         return self._help_command
@@ -1015,7 +1052,8 @@ class BotBase(GroupMixin[None]):
         --------
         Union[List[:class:`str`], :class:`str`]
             A list of prefixes or a single prefix that the bot is
-            listening for.
+            listening for. A :class:`.PrefixMatcher` returned from
+            :attr:`.command_prefix` is returned as a list of its prefixes.
         """
         prefix = ret = self.command_prefix
 
@@ -1099,51 +1137,72 @@ class BotBase(GroupMixin[None]):
         if cls is MISSING:
             cls = Context  # type: ignore
 
-        view = StringView(message.content)
-        ctx = cls(prefix=None, view=view, bot=self, message=message)
-
         if self._skip_check(message.author.id, self.user.id):  # type: ignore
-            return ctx
+            return self._make_context(message, None, cls)
+
+        matcher = await self._get_prefix_matcher(message)
+        return self._make_context(message, matcher.match(message.content), cls)
+
+    async def _get_prefix_matcher(self, message: Message, /) -> PrefixMatcher:
+        if type(self).get_prefix is not BotBase.get_prefix:
+            return _compile_prefix(await self.get_prefix(message))
+
+        prefix = self.command_prefix
+        if not callable(prefix):
+            return _compile_prefix(prefix)
+
+        key = message.guild.id if message.guild is not None else message.channel.id
+        cache = self._prefix_cache
+        cached = cache.get(key)
+        if cached is not None:
+            matcher, deadline = cached
+            if deadline is None or deadline > time.monotonic():
+                return matcher
+            del cache[key]
+
+        # self will be a Bot or AutoShardedBot
+        ret = await discord.utils.maybe_coroutine(prefix, self, message)
+        matcher = _compile_prefix(ret)
+        if matcher.ttl is not None:
+            cache[key] = (matcher, time.monotonic() + matcher.ttl)
+        elif self._cache_prefixes:
+            cache[key] = (matcher, None)
+        return matcher
+
+    def invalidate_prefix(self, target: Optional[Snowflake] = None, /) -> None:
+        """Removes cached prefixes so that :attr:`.command_prefix` is called again.
 
-        prefix = await self.get_prefix(message)
-        invoked_prefix = prefix
+        This should be called whenever the prefixes a ``command_prefix`` callable
+        returns change, for example after a guild updated its prefix in a database.
 
-        if isinstance(prefix, str):
-            if not view.skip_string(prefix):
-                return ctx
+        .. versionadded:: 2.1
+
+        Parameters
+        -----------
+        target: Optional[:class:`~discord.abc.Snowflake`]
+            The guild or private channel to remove the cached prefixes of.
+            If not given, the cache is cleared entirely.
+        """
+        if target is None:
+            self._prefix_cache.clear()
         else:
-            try:
-                # if the context class' __init__ consumes something from the view this
-                # will be wrong.  That seems unreasonable though.
-                if message.content.startswith(tuple(prefix)):
-                    invoked_prefix = discord.utils.find(view.skip_string, prefix)
-                else:
-                    return ctx
+            self._prefix_cache.pop(target.id, None)
 
-            except TypeError:
-                if not isinstance(prefix, list):
-                    raise TypeError(
-                        "get_prefix must return either a string or a list of string, " f"not {prefix.__class__.__name__}"
-                    )
-
-                # It's possible a bad command_prefix got us here.
-                for value in prefix:
-                    if not isinstance(value, str):
-                        raise TypeError(
-                            "Iterable command_prefix or list returned from get_prefix must "
-                            f"contain only strings, not {value.__class__.__name__}"
-                        )
-
-                # Getting here shouldn't happen
-                raise
+    def _make_context(self, message: Message, prefix: Optional[str], cls: Type[ContextT]) -> ContextT:
+        view = StringView(message.content)
+        ctx = cls(prefix=None, view=view, bot=self, message=message)
+        if prefix is None:
+            return ctx
 
+        # if the context class' __init__ consumes something from the view this
+        # will be wrong.  That seems unreasonable though.
+        view.skip_string(prefix)
         if self.strip_after_prefix:
             view.skip_ws()
 
         invoker = view.get_word()
         ctx.invoked_with = invoker
-        # type-checker fails to narrow invoked_prefix type.
-        ctx.prefix = invoked_prefix  # type: ignore
+        ctx.prefix = prefix
         ctx.command = self.all_commands.get(invoker)
         return ctx
 
@@ -1206,7 +1265,20 @@ class BotBase(GroupMixin[None]):
         if message.author.bot:
             return
 
-        ctx = await self.get_context(message)
+        if type(self).get_context is not BotBase.get_context:
+            ctx = await self.get_context(message)
+        else:
+            # Reject messages that can't be commands before building a context for them.
+            if self._skip_check(message.author.id, self.user.id):  # type: ignore
+                return
+
+            matcher = await self._get_prefix_matcher(message)
+            prefix = matcher.match(message.content)
+            if prefix is None:
+                return
+
+            ctx = self._make_context(message, prefix, Context)
+
         # the type of the invocation context's bot attribute will be correct
         await self.invoke(ctx)  # type: ignore
 
@@ -1262,6 +1334,15 @@ class Bot(BotBase, discord.Client):
             matches messages starting with ``!?``. This is especially important
             when passing an empty string, it should always be last as no prefix
             after it will be matched.
+
+        The callable may also return a :class:`.PrefixMatcher`. If the matcher
+        has a :attr:`~.PrefixMatcher.ttl`, it is reused for messages in the same
+        guild or private channel until it expires, without calling the callable again.
+
+        .. versionchanged:: 2.1
+
+            Prefixes are compiled into a :class:`.PrefixMatcher` so messages
+            that aren't commands are rejected before a :class:`.Context` is created.
     case_insensitive: :class:`bool`
         Whether the commands should be case insensitive. Defaults to ``False``. This
         attribute does not carry over to groups. You must set it to every group if
@@ -1288,6 +1369,20 @@ class Bot(BotBase, discord.Client):
         the ``command_prefix`` is set to ``!``. Defaults to ``False``.
 
         .. versionadded:: 1.7
+    prefix_cache: Optional[:class:`~discord.CachePolicy`]
+        The policy of the cache that holds the prefixes a ``command_prefix`` callable
+        returned, per guild or private channel. When given, the callable is only called
+        again once the entry is evicted or :meth:`.invalidate_prefix` is called, so it is
+        best suited to prefixes that don't depend on the message's author or channel.
+        Defaults to ``None``, which calls the callable for every message.
+
+        .. versionadded:: 2.1
+    concurrent_checks: :class:`bool`
+        Whether the global, cog and command checks are awaited concurrently rather than
+        one after the other. Every check then runs even if an earlier one fails, but the
+        outcome is still that of the first failing check in order. Defaults to ``False``.
+
+        .. versionadded:: 2.1
     """
 
     pass
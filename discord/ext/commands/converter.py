@@ -25,10 +25,13 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import inspect
+from operator import attrgetter
 import re
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Coroutine,
     Dict,
     Generic,
     Iterable,
@@ -324,18 +327,7 @@ class UserConverter(IDConverter[discord.User]):
 
             return result  # type: ignore
 
-        username, _, discriminator = argument.rpartition('#')
-
-        # If # isn't found then "discriminator" actually has the username
-        if not username:
-            discriminator, username = username, discriminator
-
-        if discriminator == '0' or (len(discriminator) == 4 and discriminator.isdigit()):
-            predicate = lambda u: u.name == username and u.discriminator == discriminator
-        else:
-            predicate = lambda u: u.name == argument or u.global_name == argument
-
-        result = discord.utils.find(predicate, state._users.values())
+        result = state._get_user_named(argument)
         if result is None:
             raise UserNotFound(argument)
 
@@ -463,6 +455,16 @@ class GuildChannelConverter(IDConverter[discord.abc.GuildChannel]):
         )
         return link_regex.match(argument)
 
+    @staticmethod
+    def _get_channel_named(guild: discord.Guild, name: str, attribute: str, type: Type[CT]) -> Optional[CT]:
+        channels = [channel for channel in guild._get_channels_named(name) if isinstance(channel, type)]
+        if not channels:
+            return None
+        if attribute == 'channels':
+            return channels[0]  # type: ignore
+        # The per-type attributes are sorted like the channel list in the client
+        return min(channels, key=attrgetter('position', 'id'))  # type: ignore
+
     @staticmethod
     def _resolve_channel(ctx: Context[BotT], argument: str, attribute: str, type: Type[CT]) -> CT:
         bot = ctx.bot
@@ -478,14 +480,12 @@ class GuildChannelConverter(IDConverter[discord.abc.GuildChannel]):
         if match is None:
             # not a mention
             if guild:
-                iterable: Iterable[CT] = getattr(guild, attribute)
-                result: Optional[CT] = discord.utils.get(iterable, name=argument)
+                result = GuildChannelConverter._get_channel_named(guild, argument, attribute, type)
             else:
-
-                def check(c):
-                    return isinstance(c, type) and c.name == argument
-
-                result = discord.utils.find(check, bot.get_all_channels())  # type: ignore
+                for guild in bot.guilds:
+                    result = GuildChannelConverter._get_channel_named(guild, argument, 'channels', type)
+                    if result is not None:
+                        break
         else:
             channel_id = int(match.group(1))
             if guild:
@@ -730,7 +730,7 @@ class RoleConverter(IDConverter[discord.Role]):
         if match:
             result = guild.get_role(int(match.group(1)))
         else:
-            result = discord.utils.get(guild._roles.values(), name=argument)
+            result = guild._get_role_named(argument)
 
         if result is None:
             raise RoleNotFound(argument)
@@ -1255,9 +1255,18 @@ CONVERTER_MAPPING: Dict[type, Any] = {
 }
 
 
-async def _actual_conversion(ctx: Context[BotT], converter: Any, argument: str, param: inspect.Parameter):
+if TYPE_CHECKING:
+    _ConverterFunc = Callable[[Context[Any], str, Parameter], Coroutine[Any, Any, Any]]
+
+
+def _compile_actual_conversion(converter: Any) -> _ConverterFunc:
+    # Resolves which conversion applies to a converter once, up front.
     if converter is bool:
-        return _convert_to_bool(argument)
+
+        async def convert(ctx: Context[Any], argument: str, param: Parameter) -> Any:
+            return _convert_to_bool(argument)
+
+        return convert
 
     try:
         module = converter.__module__
@@ -1267,30 +1276,121 @@ async def _actual_conversion(ctx: Context[BotT], converter: Any, argument: str,
         if module is not None and (module.startswith('discord.') and not module.endswith('converter')):
             converter = CONVERTER_MAPPING.get(converter, converter)
 
-    try:
-        if inspect.isclass(converter) and issubclass(converter, Converter):
-            if inspect.ismethod(converter.convert):
-                return await converter.convert(ctx, argument)
-            else:
-                return await converter().convert(ctx, argument)
-        elif isinstance(converter, Converter):
-            return await converter.convert(ctx, argument)
-    except CommandError:
-        raise
-    except Exception as exc:
-        raise ConversionError(converter, exc) from exc  # type: ignore
-
-    try:
-        return converter(argument)
-    except CommandError:
-        raise
-    except Exception as exc:
+    if inspect.isclass(converter) and issubclass(converter, Converter):
+        if inspect.ismethod(converter.convert):
+            method = converter.convert
+        else:
+            # A new instance is created for every conversion
+            async def convert(ctx: Context[Any], argument: str, param: Parameter) -> Any:
+                try:
+                    return await converter().convert(ctx, argument)
+                except CommandError:
+                    raise
+                except Exception as exc:
+                    raise ConversionError(converter, exc) from exc  # type: ignore
+
+            return convert
+    elif isinstance(converter, Converter):
+        method = converter.convert
+    else:
         try:
             name = converter.__name__
         except AttributeError:
             name = converter.__class__.__name__
 
-        raise BadArgument(f'Converting to "{name}" failed for parameter "{param.name}".') from exc
+        async def convert(ctx: Context[Any], argument: str, param: Parameter) -> Any:
+            try:
+                return converter(argument)
+            except CommandError:
+                raise
+            except Exception as exc:
+                raise BadArgument(f'Converting to "{name}" failed for parameter "{param.name}".') from exc
+
+        return convert
+
+    async def convert(ctx: Context[Any], argument: str, param: Parameter) -> Any:
+        try:
+            return await method(ctx, argument)
+        except CommandError:
+            raise
+        except Exception as exc:
+            raise ConversionError(converter, exc) from exc  # type: ignore
+
+    return convert
+
+
+def _compile_converter(converter: Any) -> _ConverterFunc:
+    # Returns a coroutine function that runs the converters for an annotation, with
+    # the Union and Literal handling resolved ahead of time. Commands keep these per
+    # parameter, run_converters compiles one for every call.
+    origin = getattr(converter, '__origin__', None)
+
+    if origin is Union:
+        _NoneType = type(None)
+        union_args = converter.__args__
+        chain = tuple((conv is _NoneType, _compile_converter(conv)) for conv in union_args)
+
+        async def convert_union(ctx: Context[Any], argument: str, param: Parameter) -> Any:
+            errors = []
+            for is_none, conv in chain:
+                # if we got to this part in the code, then the previous conversions have failed
+                # so we should just undo the view, return the default, and allow parsing to continue
+                # with the other parameters
+                if is_none and param.kind != param.VAR_POSITIONAL:
+                    ctx.view.undo()
+                    return None if param.required else await param.get_default(ctx)
+
+                try:
+                    return await conv(ctx, argument, param)
+                except CommandError as exc:
+                    errors.append(exc)
+
+            # if we're here, then we failed all the converters
+            raise BadUnionArgument(param, union_args, errors)
+
+        return convert_union
+
+    if origin is Literal:
+        literal_args = converter.__args__
+        converters = {}
+        for literal in literal_args:
+            literal_type = type(literal)
+            if literal_type not in converters:
+                converters[literal_type] = _compile_actual_conversion(literal_type)
+        table = tuple((literal, type(literal), converters[type(literal)]) for literal in literal_args)
+
+        async def convert_literal(ctx: Context[Any], argument: str, param: Parameter) -> Any:
+            errors = []
+            conversions = {}
+            for literal, literal_type, conv in table:
+                try:
+                    value = conversions[literal_type]
+                except KeyError:
+                    try:
+                        value = await conv(ctx, argument, param)
+                    except CommandError as exc:
+                        errors.append(exc)
+                        conversions[literal_type] = object()
+                        continue
+                    else:
+                        conversions[literal_type] = value
+
+                if value == literal:
+                    return value
+
+            # if we're here, then we failed to match all the literals
+            raise BadLiteralArgument(param, literal_args, errors, argument)
+
+        return convert_literal
+
+    # This must be the last if-clause in the chain of origin checking
+    # Nearly every type is a generic type within the typing library
+    # So care must be taken to make sure a more specialised origin handle
+    # isn't overwritten by the widest if clause
+    if origin is not None and is_generic_type(converter):
+        converter = origin
+
+    return _compile_actual_conversion(converter)
 
 
 @overload
@@ -1335,59 +1435,4 @@ async def run_converters(ctx: Context[BotT], converter: Any, argument: str, para
     Any
         The resulting conversion.
     """
-    origin = getattr(converter, '__origin__', None)
-
-    if origin is Union:
-        errors = []
-        _NoneType = type(None)
-        union_args = converter.__args__
-        for conv in union_args:
-            # if we got to this part in the code, then the previous conversions have failed
-            # so we should just undo the view, return the default, and allow parsing to continue
-            # with the other parameters
-            if conv is _NoneType and param.kind != param.VAR_POSITIONAL:
-                ctx.view.undo()
-                return None if param.required else await param.get_default(ctx)
-
-            try:
-                value = await run_converters(ctx, conv, argument, param)
-            except CommandError as exc:
-                errors.append(exc)
-            else:
-                return value
-
-        # if we're here, then we failed all the converters
-        raise BadUnionArgument(param, union_args, errors)
-
-    if origin is Literal:
-        errors = []
-        conversions = {}
-        literal_args = converter.__args__
-        for literal in literal_args:
-            literal_type = type(literal)
-            try:
-                value = conversions[literal_type]
-            except KeyError:
-                try:
-                    value = await _actual_conversion(ctx, literal_type, argument, param)
-                except CommandError as exc:
-                    errors.append(exc)
-                    conversions[literal_type] = object()
-                    continue
-                else:
-                    conversions[literal_type] = value
-
-            if value == literal:
-                return value
-
-        # if we're here, then we failed to match all the literals
-        raise BadLiteralArgument(param, literal_args, errors, argument)
-
-    # This must be the last if-clause in the chain of origin checking
-    # Nearly every type is a generic type within the typing library
-    # So care must be taken to make sure a more specialised origin handle
-    # isn't overwritten by the widest if clause
-    if origin is not None and is_generic_type(converter):
-        converter = origin
-
-    return await _actual_conversion(ctx, converter, argument, param)
+    return await _compile_converter(converter)(ctx, argument, param)
@@ -25,11 +25,17 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 
-from typing import Any, Callable, Deque, Dict, Optional, Union, Generic, TypeVar, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union, Generic, TypeVar, TYPE_CHECKING
 from discord.enums import Enum
 from discord.abc import PrivateChannel
 import time
 import asyncio
+import contextlib
+import heapq
+import itertools
+import os
+import sqlite3
+import threading
 from collections import deque
 
 from .errors import MaxConcurrencyReached
@@ -46,10 +52,18 @@ __all__ = (
     'CooldownMapping',
     'DynamicCooldownMapping',
     'MaxConcurrency',
+    'CooldownStorage',
+    'ConcurrencyStorage',
+    'MemoryStorage',
+    'SQLiteStorage',
 )
 
+T = TypeVar('T')
 T_contra = TypeVar('T_contra', contravariant=True)
 
+# The window, tokens and last update time of a Cooldown
+CooldownState = Tuple[float, int, float]
+
 
 class BucketType(Enum):
     default = 0
@@ -201,22 +215,92 @@ class Cooldown:
         return f'<Cooldown rate: {self.rate} per: {self.per} window: {self._window} tokens: {self._tokens}>'
 
 
+def _storage_key(key: Any) -> str:
+    # Bucket keys are ids, objects with one or tuples of them (see BucketType.get_key),
+    # unlike their repr these stay the same between processes and library versions
+    if isinstance(key, tuple):
+        return ':'.join(_storage_key(part) for part in key)
+    return str(getattr(key, 'id', key))
+
+
+class _StoredCooldown(Cooldown):
+    # A cooldown whose state lives in a CooldownStorage rather than on the instance,
+    # the attributes only hold whatever was loaded last.
+    __slots__ = ('_storage', '_key')
+
+    def __init__(self, rate: float, per: float, storage: CooldownStorage, key: str) -> None:
+        super().__init__(rate, per)
+        self._storage: CooldownStorage = storage
+        self._key: str = key
+
+    def _load(self, state: Optional[CooldownState]) -> None:
+        if state is None:
+            self._window, self._tokens, self._last = 0.0, self.rate, 0.0
+        else:
+            self._window, self._tokens, self._last = state
+
+    def _updater(
+        self, current: float, tokens: int
+    ) -> Callable[[Optional[CooldownState]], Tuple[CooldownState, Tuple[CooldownState, Optional[float]]]]:
+        def apply(state: Optional[CooldownState]) -> Tuple[CooldownState, Tuple[CooldownState, Optional[float]]]:
+            # Storages may call this from another thread, so it works on a copy rather than on the handle
+            bucket = self.copy()
+            if state is not None:
+                bucket._window, bucket._tokens, bucket._last = state
+            retry_after = bucket.update_rate_limit(current, tokens=tokens)
+            new_state = (bucket._window, bucket._tokens, bucket._last)
+            return new_state, (new_state, retry_after)
+
+        return apply
+
+    def get_tokens(self, current: Optional[float] = None) -> int:
+        self._load(self._storage.get(self._key))
+        return super().get_tokens(current)
+
+    def update_rate_limit(self, current: Optional[float] = None, *, tokens: int = 1) -> Optional[float]:
+        state, retry_after = self._storage.update(self._key, self.per, self._updater(current or time.time(), tokens))
+        self._load(state)
+        return retry_after
+
+    async def _update_rate_limit_async(self, current: Optional[float] = None, *, tokens: int = 1) -> Optional[float]:
+        updater = self._updater(current or time.time(), tokens)
+        state, retry_after = await self._storage.update_async(self._key, self.per, updater)
+        self._load(state)
+        return retry_after
+
+    def reset(self) -> None:
+        self._storage.delete(self._key)
+        super().reset()
+
+    def copy(self) -> Cooldown:
+        return Cooldown(self.rate, self.per)
+
+
 class CooldownMapping(Generic[T_contra]):
     def __init__(
         self,
         original: Optional[Cooldown],
         type: Callable[[T_contra], Any],
+        *,
+        storage: Optional[CooldownStorage] = None,
     ) -> None:
         if not callable(type):
             raise TypeError('Cooldown type must be a BucketType or callable')
 
+        self._storage: Optional[CooldownStorage] = storage
         self._cache: Dict[Any, Cooldown] = {}
+        # A min-heap of (deadline, sequence, key) with at most one entry per key. The
+        # deadline may be older than the bucket's actual one, as buckets are updated
+        # outside of the mapping, so entries are checked again when they're popped.
+        self._expiry: List[Tuple[float, int, Any]] = []
+        self._sequence: itertools.count[int] = itertools.count()
         self._cooldown: Optional[Cooldown] = original
         self._type: Callable[[T_contra], Any] = type
 
     def copy(self) -> CooldownMapping[T_contra]:
-        ret = CooldownMapping(self._cooldown, self._type)
+        ret = CooldownMapping(self._cooldown, self._type, storage=self._storage)
         ret._cache = self._cache.copy()
+        ret._rebuild_expiry()
         return ret
 
     @property
@@ -228,26 +312,44 @@ class CooldownMapping(Generic[T_contra]):
         return self._type
 
     @classmethod
-    def from_cooldown(cls, rate: float, per: float, type: Callable[[T_contra], Any]) -> Self:
-        return cls(Cooldown(rate, per), type)
+    def from_cooldown(
+        cls, rate: float, per: float, type: Callable[[T_contra], Any], *, storage: Optional[CooldownStorage] = None
+    ) -> Self:
+        return cls(Cooldown(rate, per), type, storage=storage)
 
     def _bucket_key(self, msg: T_contra) -> Any:
         return self._type(msg)
 
+    def _rebuild_expiry(self) -> None:
+        sequence = self._sequence
+        self._expiry = [(bucket._last + bucket.per, next(sequence), key) for key, bucket in self._cache.items()]
+        heapq.heapify(self._expiry)
+
     def _verify_cache_integrity(self, current: Optional[float] = None) -> None:
         # we want to delete all cache objects that haven't been used
         # in a cooldown window. e.g. if we have a  command that has a
         # cooldown of 60s and it has not been used in 60s then that key should be deleted
         current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
+        cache = self._cache
+        expiry = self._expiry
+        while expiry and expiry[0][0] < current:
+            _, _, key = heapq.heappop(expiry)
+            bucket = cache.get(key)
+            if bucket is None:
+                continue
+
+            deadline = bucket._last + bucket.per
+            if current > deadline:
+                del cache[key]
+            else:
+                # used since it was pushed, check again once its new deadline passes
+                heapq.heappush(expiry, (deadline, next(self._sequence), key))
 
     def create_bucket(self, message: T_contra) -> Cooldown:
         return self._cooldown.copy()  # type: ignore
 
     def get_bucket(self, message: T_contra, current: Optional[float] = None) -> Optional[Cooldown]:
-        if self._type is BucketType.default:
+        if self._type is BucketType.default and self._storage is None:
             return self._cooldown
 
         self._verify_cache_integrity(current)
@@ -255,7 +357,11 @@ class CooldownMapping(Generic[T_contra]):
         if key not in self._cache:
             bucket = self.create_bucket(message)
             if bucket is not None:
+                if self._storage is not None:
+                    # Cached buckets are only handles, the state itself is shared through the storage
+                    bucket = _StoredCooldown(bucket.rate, bucket.per, self._storage, _storage_key(key))
                 self._cache[key] = bucket
+                heapq.heappush(self._expiry, (bucket._last + bucket.per, next(self._sequence), key))
         else:
             bucket = self._cache[key]
 
@@ -273,13 +379,16 @@ class DynamicCooldownMapping(CooldownMapping[T_contra]):
         self,
         factory: Callable[[T_contra], Optional[Cooldown]],
         type: Callable[[T_contra], Any],
+        *,
+        storage: Optional[CooldownStorage] = None,
     ) -> None:
-        super().__init__(None, type)
+        super().__init__(None, type, storage=storage)
         self._factory: Callable[[T_contra], Optional[Cooldown]] = factory
 
     def copy(self) -> DynamicCooldownMapping[T_contra]:
-        ret = DynamicCooldownMapping(self._factory, self._type)
+        ret = DynamicCooldownMapping(self._factory, self._type, storage=self._storage)
         ret._cache = self._cache.copy()
+        ret._rebuild_expiry()
         return ret
 
     @property
@@ -351,13 +460,14 @@ class _Semaphore:
 
 
 class MaxConcurrency:
-    __slots__ = ('number', 'per', 'wait', '_mapping')
+    __slots__ = ('number', 'per', 'wait', 'storage', '_mapping')
 
-    def __init__(self, number: int, *, per: BucketType, wait: bool) -> None:
+    def __init__(self, number: int, *, per: BucketType, wait: bool, storage: Optional[ConcurrencyStorage] = None) -> None:
         self._mapping: Dict[Any, _Semaphore] = {}
         self.per: BucketType = per
         self.number: int = number
         self.wait: bool = wait
+        self.storage: Optional[ConcurrencyStorage] = storage
 
         if number <= 0:
             raise ValueError('max_concurrency \'number\' cannot be less than 1')
@@ -366,7 +476,7 @@ class MaxConcurrency:
             raise TypeError(f'max_concurrency \'per\' must be of type BucketType not {type(per)!r}')
 
     def copy(self) -> Self:
-        return self.__class__(self.number, per=self.per, wait=self.wait)
+        return self.__class__(self.number, per=self.per, wait=self.wait, storage=self.storage)
 
     def __repr__(self) -> str:
         return f'<MaxConcurrency per={self.per!r} number={self.number} wait={self.wait}>'
@@ -377,6 +487,11 @@ class MaxConcurrency:
     async def acquire(self, message: Union[Message, Context[Any]]) -> None:
         key = self.get_key(message)
 
+        if self.storage is not None:
+            if not await self.storage.acquire(_storage_key(key), self.number, wait=self.wait):
+                raise MaxConcurrencyReached(self.number, self.per)
+            return
+
         try:
             sem = self._mapping[key]
         except KeyError:
@@ -391,6 +506,10 @@ class MaxConcurrency:
         # But it might be more useful in the future
         key = self.get_key(message)
 
+        if self.storage is not None:
+            await self.storage.release(_storage_key(key))
+            return
+
         try:
             sem = self._mapping[key]
         except KeyError:
@@ -401,3 +520,459 @@ class MaxConcurrency:
 
         if sem.value >= self.number and not sem.is_active():
             del self._mapping[key]
+
+
+class CooldownStorage:
+    """The base class of storages that cooldown buckets keep their state in.
+
+    By default, the state of a :class:`.Cooldown` is kept on the bucket itself.
+    Passing a storage to :func:`.cooldown` or :func:`.dynamic_cooldown` instead keeps
+    it in the storage, so that it can be shared, for example between processes.
+
+    Keys are built from the ids in the bucket's key, so a storage should only be
+    used by a single command unless the commands are meant to share a cooldown.
+    Keys returned by a custom bucket type should be ids, strings or tuples of them.
+
+    .. versionadded:: 2.1
+    """
+
+    def get(self, key: str) -> Optional[CooldownState]:
+        """Returns the ``(window, tokens, last)`` state of a bucket, or ``None`` if there is none.
+
+        This is called on the event loop, so it should not block. The state may be
+        one cached from this storage's last update of the bucket.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the bucket.
+        """
+        raise NotImplementedError
+
+    def update(self, key: str, per: float, func: Callable[[Optional[CooldownState]], Tuple[CooldownState, T]]) -> T:
+        """Atomically updates the state of a bucket.
+
+        ``func`` is called with the current state, or ``None``, and returns the new state
+        along with the value to return. The state may be discarded once ``per`` seconds
+        have passed since its last update.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the bucket.
+        per: :class:`float`
+            The length of the bucket's cooldown period in seconds.
+        func: Callable
+            The function computing the new state.
+        """
+        raise NotImplementedError
+
+    async def update_async(
+        self, key: str, per: float, func: Callable[[Optional[CooldownState]], Tuple[CooldownState, T]]
+    ) -> T:
+        """|coro|
+
+        Atomically updates the state of a bucket, like :meth:`update`.
+
+        This is what command cooldown checks use. By default it calls :meth:`update`,
+        storages that would block the event loop should override it. ``func`` may be
+        called from another thread.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the bucket.
+        per: :class:`float`
+            The length of the bucket's cooldown period in seconds.
+        func: Callable
+            The function computing the new state.
+        """
+        return self.update(key, per, func)
+
+    def delete(self, key: str) -> None:
+        """Removes the state of a bucket, resetting it.
+
+        This is called on the event loop, so it should not block.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the bucket.
+        """
+        raise NotImplementedError
+
+
+class ConcurrencyStorage:
+    """The base class of storages that :func:`.max_concurrency` keeps its counters in.
+
+    .. versionadded:: 2.1
+    """
+
+    async def acquire(self, key: str, number: int, *, wait: bool) -> bool:
+        """|coro|
+
+        Acquires one of the ``number`` slots of ``key``.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the bucket.
+        number: :class:`int`
+            The maximum number of slots.
+        wait: :class:`bool`
+            Whether to wait for a slot to be released if there are none left.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether a slot was acquired.
+        """
+        raise NotImplementedError
+
+    async def release(self, key: str) -> None:
+        """|coro|
+
+        Releases a slot of ``key`` that this storage acquired.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the bucket.
+        """
+        raise NotImplementedError
+
+
+class MemoryStorage(CooldownStorage, ConcurrencyStorage):
+    """A storage that keeps cooldowns and concurrency counters in memory.
+
+    Unlike the default, one instance can be shared between several commands.
+    Commands sharing a concurrency key must use the same limit, acquiring a key
+    with a different limit while it is in use raises :exc:`ValueError`.
+
+    .. versionadded:: 2.1
+    """
+
+    # Expired cooldowns are removed in batches after this many updates
+    PURGE_INTERVAL = 1000
+
+    def __init__(self) -> None:
+        self._cooldowns: Dict[str, Tuple[CooldownState, float]] = {}
+        self._semaphores: Dict[str, Tuple[int, _Semaphore]] = {}
+        self._updates: int = 0
+
+    def get(self, key: str) -> Optional[CooldownState]:
+        try:
+            state, expires = self._cooldowns[key]
+        except KeyError:
+            return None
+        return state
+
+    def update(self, key: str, per: float, func: Callable[[Optional[CooldownState]], Tuple[CooldownState, T]]) -> T:
+        state, result = func(self.get(key))
+        self._cooldowns[key] = (state, state[2] + per)
+
+        self._updates += 1
+        if self._updates % self.PURGE_INTERVAL == 0:
+            now = time.time()
+            self._cooldowns = {k: v for k, v in self._cooldowns.items() if v[1] >= now}
+        return result
+
+    def delete(self, key: str) -> None:
+        self._cooldowns.pop(key, None)
+
+    async def acquire(self, key: str, number: int, *, wait: bool) -> bool:
+        try:
+            limit, sem = self._semaphores[key]
+        except KeyError:
+            limit, sem = self._semaphores[key] = (number, _Semaphore(number))
+        else:
+            if limit != number:
+                raise ValueError(f'{key} is already limited to {limit} concurrent uses, not {number}')
+        return await sem.acquire(wait=wait)
+
+    async def release(self, key: str) -> None:
+        try:
+            number, sem = self._semaphores[key]
+        except KeyError:
+            return
+        sem.release()
+
+        # Idle semaphores are dropped like in MaxConcurrency, so per-user keys don't pile up
+        if sem.value >= number and not sem.is_active():
+            del self._semaphores[key]
+
+
+class SQLiteStorage(CooldownStorage, ConcurrencyStorage):
+    """A storage that keeps cooldowns and concurrency counters in an SQLite database.
+
+    Processes on the same machine that open the same database file share their
+    cooldowns and concurrency limits.
+
+    Cooldown checks of commands are written in batches: the checks made while a
+    batch is being written are queued and then written together in one transaction,
+    in a separate thread. Concurrency slots are also acquired and released in a
+    separate thread, so neither blocks the event loop.
+
+    .. warning::
+
+        :meth:`.Cooldown.get_tokens` and :meth:`.Command.is_on_cooldown` only see the
+        state left by the last check made through this instance, not by other processes.
+        Calling :meth:`.Cooldown.update_rate_limit` directly runs its transaction synchronously,
+        blocking the event loop for up to ``timeout`` seconds while the database is locked.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The path of the database file. It is created if it doesn't exist.
+    namespace: :class:`str`
+        A prefix for the keys stored by this instance, so that several commands
+        can use the same database without sharing their buckets.
+    lease: :class:`float`
+        The number of seconds after which a concurrency slot is considered released,
+        in case the process holding it exited without releasing it. Slots held by
+        this instance are renewed while they are held, so a slot is only lost if the
+        process stops renewing it for this long. Defaults to 600.
+    poll_interval: :class:`float`
+        The number of seconds to wait between attempts to acquire a concurrency slot
+        when waiting for one. Defaults to 0.25.
+    timeout: :class:`float`
+        The number of seconds to wait for the database to be unlocked. Defaults to 0.1.
+    """
+
+    # Expired cooldowns are removed in batches after this many updates
+    PURGE_INTERVAL = 1000
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        namespace: str = '',
+        lease: float = 600.0,
+        poll_interval: float = 0.25,
+        timeout: float = 0.1,
+    ) -> None:
+        self.namespace: str = namespace
+        self.lease: float = lease
+        self.poll_interval: float = poll_interval
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS cooldowns '
+            '(key TEXT PRIMARY KEY, window REAL NOT NULL, tokens INTEGER NOT NULL, last REAL NOT NULL, expires REAL NOT NULL)'
+        )
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS concurrency (holder TEXT PRIMARY KEY, key TEXT NOT NULL, acquired REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS concurrency_key ON concurrency (key)')
+        # The connection is shared with the threads that acquire and release slots
+        self._lock: threading.Lock = threading.Lock()
+        self._updates: int = 0
+        # The states written by this instance, so that reads don't need to touch the database
+        self._states: Dict[str, Tuple[CooldownState, float]] = {}
+        self._remembered: int = 0
+        # Queued (key, per, func, future) writes, a func of None deletes the key
+        self._pending: List[
+            Tuple[str, float, Optional[Callable[[Optional[CooldownState]], Any]], Optional[asyncio.Future[Any]]]
+        ] = []
+        self._flush_task: Optional[asyncio.Task[None]] = None
+        self._holders: Dict[str, List[str]] = {}
+        self._holder_ids: Iterator[int] = itertools.count()
+        self._renewal: Optional[asyncio.Task[None]] = None
+
+    def __repr__(self) -> str:
+        return f'<SQLiteStorage namespace={self.namespace!r}>'
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        if self._renewal is not None:
+            self._renewal.cancel()
+            self._renewal = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        for *_, future in self._pending:
+            if future is not None:
+                future.cancel()
+        self._pending = []
+        with self._lock:
+            self._connection.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            connection = self._connection
+            # IMMEDIATE takes the write lock up front so read-modify-write is atomic across processes
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield connection
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            else:
+                connection.execute('COMMIT')
+
+    def _remember(self, key: str, state: CooldownState, per: float) -> None:
+        self._states[key] = (state, state[2] + per)
+
+        self._remembered += 1
+        if self._remembered % self.PURGE_INTERVAL == 0:
+            now = time.time()
+            self._states = {k: v for k, v in self._states.items() if v[1] >= now}
+
+    def _write(
+        self,
+        connection: sqlite3.Connection,
+        key: str,
+        per: float,
+        func: Callable[[Optional[CooldownState]], Tuple[CooldownState, T]],
+    ) -> Tuple[CooldownState, T]:
+        row = connection.execute('SELECT window, tokens, last FROM cooldowns WHERE key = ?', (key,)).fetchone()
+        state, result = func(row)
+        connection.execute(
+            'INSERT OR REPLACE INTO cooldowns (key, window, tokens, last, expires) VALUES (?, ?, ?, ?, ?)',
+            (key, *state, state[2] + per),
+        )
+
+        self._updates += 1
+        if self._updates % self.PURGE_INTERVAL == 0:
+            connection.execute('DELETE FROM cooldowns WHERE expires < ?', (time.time(),))
+        return state, result
+
+    def _write_batch(self, batch: List[Tuple[str, float, Any, Any]]) -> List[Optional[Tuple[CooldownState, Any]]]:
+        written = []
+        with self._transaction() as connection:
+            for key, per, func, _ in batch:
+                if func is None:
+                    connection.execute('DELETE FROM cooldowns WHERE key = ?', (key,))
+                    written.append(None)
+                else:
+                    written.append(self._write(connection, key, per, func))
+        return written
+
+    async def _flush(self) -> None:
+        batch = []
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    written = await asyncio.to_thread(self._write_batch, batch)
+                except Exception as exc:
+                    for *_, future in batch:
+                        if future is not None and not future.done():
+                            future.set_exception(exc)
+                    continue
+
+                for (key, per, _, future), item in zip(batch, written):
+                    if item is None:
+                        self._states.pop(key, None)
+                        continue
+
+                    state, result = item
+                    self._remember(key, state, per)
+                    if future is not None and not future.done():
+                        future.set_result(result)
+        except asyncio.CancelledError:
+            for *_, future in batch:
+                if future is not None:
+                    future.cancel()
+            raise
+        finally:
+            self._flush_task = None
+
+    def _enqueue(self, key: str, per: float, func: Any, future: Optional[asyncio.Future[Any]]) -> None:
+        self._pending.append((key, per, func, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+    def get(self, key: str) -> Optional[CooldownState]:
+        try:
+            state, expires = self._states[self.namespace + key]
+        except KeyError:
+            return None
+        return state
+
+    def update(self, key: str, per: float, func: Callable[[Optional[CooldownState]], Tuple[CooldownState, T]]) -> T:
+        key = self.namespace + key
+        with self._transaction() as connection:
+            state, result = self._write(connection, key, per, func)
+        self._remember(key, state, per)
+        return result
+
+    async def update_async(
+        self, key: str, per: float, func: Callable[[Optional[CooldownState]], Tuple[CooldownState, T]]
+    ) -> T:
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(self.namespace + key, per, func, future)
+        return await future
+
+    def delete(self, key: str) -> None:
+        key = self.namespace + key
+        self._states.pop(key, None)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside of the event loop there's nothing to block
+            with self._lock:
+                self._connection.execute('DELETE FROM cooldowns WHERE key = ?', (key,))
+        else:
+            self._enqueue(key, 0.0, None, None)
+
+    def _try_acquire(self, key: str, number: int, holder: str) -> bool:
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute('DELETE FROM concurrency WHERE key = ? AND acquired < ?', (key, now - self.lease))
+            (count,) = connection.execute('SELECT COUNT(*) FROM concurrency WHERE key = ?', (key,)).fetchone()
+            if count >= number:
+                return False
+
+            connection.execute('INSERT INTO concurrency (holder, key, acquired) VALUES (?, ?, ?)', (holder, key, now))
+        return True
+
+    def _release(self, holder: str) -> None:
+        with self._lock:
+            self._connection.execute('DELETE FROM concurrency WHERE holder = ?', (holder,))
+
+    def _renew(self, holders: List[str]) -> None:
+        with self._transaction() as connection:
+            connection.executemany(
+                'UPDATE concurrency SET acquired = ? WHERE holder = ?', [(time.time(), holder) for holder in holders]
+            )
+
+    async def _renew_leases(self) -> None:
+        try:
+            while self._holders:
+                await asyncio.sleep(self.lease / 3)
+                holders = [holder for held in self._holders.values() for holder in held]
+                if holders:
+                    await asyncio.to_thread(self._renew, holders)
+        finally:
+            self._renewal = None
+
+    async def acquire(self, key: str, number: int, *, wait: bool) -> bool:
+        key = self.namespace + key
+        holder = f'{os.getpid()}:{id(self)}:{next(self._holder_ids)}'
+        while not await asyncio.to_thread(self._try_acquire, key, number, holder):
+            if not wait:
+                return False
+            await asyncio.sleep(self.poll_interval)
+
+        self._holders.setdefault(key, []).append(holder)
+        if self._renewal is None:
+            self._renewal = asyncio.create_task(self._renew_leases())
+        return True
+
+    async def release(self, key: str) -> None:
+        key = self.namespace + key
+        holders = self._holders.get(key)
+        if not holders:
+            return
+
+        holder = holders.pop()
+        if not holders:
+            del self._holders[key]
+        await asyncio.to_thread(self._release, holder)
@@ -34,6 +34,7 @@ from typing import (
     Dict,
     Generator,
     Generic,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -47,12 +48,22 @@ from typing import (
 import re
 
 import discord
+from discord.cache import BoundedCache
 
 from ._types import _BaseCommand, CogT
 from .cog import Cog
 from .context import Context
-from .converter import Greedy, run_converters
-from .cooldowns import BucketType, Cooldown, CooldownMapping, DynamicCooldownMapping, MaxConcurrency
+from .converter import Greedy, _compile_converter
+from .cooldowns import (
+    BucketType,
+    ConcurrencyStorage,
+    Cooldown,
+    CooldownMapping,
+    CooldownStorage,
+    DynamicCooldownMapping,
+    MaxConcurrency,
+    _StoredCooldown,
+)
 from .errors import *
 from .parameters import Parameter, Signature
 
@@ -259,6 +270,45 @@ def hooked_wrapped_callback(
     return wrapped
 
 
+async def _first_failed_check(checks: Iterable[Callable[[Any], Any]], ctx: Context[Any], /) -> int:
+    # Every check is started before any of them is awaited. The outcome is that of the
+    # first failing check in order, so the same error surfaces as with sequential evaluation.
+    results: List[Any] = []
+    errors: Dict[int, BaseException] = {}
+    pending: List[int] = []
+    for index, check in enumerate(checks):
+        try:
+            result = check(ctx)
+        except Exception as exc:
+            errors[index] = exc
+            result = None
+        else:
+            if inspect.isawaitable(result):
+                pending.append(index)
+        results.append(result)
+
+    if len(pending) == 1:
+        index = pending[0]
+        try:
+            results[index] = await results[index]
+        except Exception as exc:
+            errors[index] = exc
+    elif pending:
+        done = await asyncio.gather(*(results[index] for index in pending), return_exceptions=True)
+        for index, result in zip(pending, done):
+            if isinstance(result, BaseException):
+                errors[index] = result
+            else:
+                results[index] = result
+
+    for index, result in enumerate(results):
+        if index in errors:
+            raise errors[index]
+        if not result:
+            return index
+    return -1
+
+
 class _CaseInsensitiveDict(dict):
     def __contains__(self, k):
         return super().__contains__(k.casefold())
@@ -300,6 +350,79 @@ class _AttachmentIterator:
         return self.index >= len(self.data)
 
 
+# Parameter kinds and transform modes of a _ParameterPlan
+_POSITIONAL = 0
+_KEYWORD_ONLY = 1
+_VAR_POSITIONAL = 2
+_OTHER = 3
+
+_CONVERT = 0
+_GREEDY_ATTACHMENTS = 1
+_GREEDY_POSITIONAL = 2
+_GREEDY_VAR_POSITIONAL = 3
+_ATTACHMENT = 4
+_OPTIONAL_ATTACHMENT = 5
+
+
+class _ParameterPlan:
+    # Everything Command.transform would otherwise work out from the
+    # parameter on every invocation, resolved once per signature.
+    __slots__ = ('name', 'param', 'kind', 'mode', 'converter', 'convert', 'raw_convert', 'optional', 'flag')
+
+    def __init__(self, param: Parameter) -> None:
+        kind = param.kind
+        converter = param.converter
+        self.name: str = param.name
+        self.param: Parameter = param
+
+        if kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
+            self.kind: int = _POSITIONAL
+        elif kind == param.KEYWORD_ONLY:
+            self.kind = _KEYWORD_ONLY
+        elif kind == param.VAR_POSITIONAL:
+            self.kind = _VAR_POSITIONAL
+        else:
+            self.kind = _OTHER
+
+        # rest_is_raw passes the raw argument to the annotation as is
+        self.raw_convert: Optional[Any] = _compile_converter(converter) if self.kind == _KEYWORD_ONLY else None
+
+        mode = _CONVERT
+        if isinstance(converter, Greedy):
+            if converter.converter is discord.Attachment:
+                mode = _GREEDY_ATTACHMENTS
+            elif self.kind == _POSITIONAL:
+                mode = _GREEDY_POSITIONAL
+            elif self.kind == _VAR_POSITIONAL:
+                mode = _GREEDY_VAR_POSITIONAL
+            # Converting the inner type directly constructs converter classes once per
+            # argument, which is what Greedy.constructed_converter amounts to for
+            # keyword-only and variadic parameters.
+            converter = converter.converter
+
+        self.optional: bool = (
+            getattr(param.annotation, '__origin__', None) is Union and type(None) in param.annotation.__args__
+        )
+        if mode == _CONVERT:
+            if converter is discord.Attachment:
+                mode = _ATTACHMENT
+            elif self.optional and param.annotation.__args__[0] is discord.Attachment:
+                mode = _OPTIONAL_ATTACHMENT
+
+        self.mode: int = mode
+        self.converter: Any = converter
+        self.convert: Any = _compile_converter(converter) if mode != _GREEDY_ATTACHMENTS else None
+        self.flag: bool = hasattr(converter, '__commands_is_flag__')
+
+    def greedy_convert(self) -> Any:
+        greedy: Greedy[Any] = self.param.converter
+        constructed = greedy.constructed_converter
+        if constructed is greedy.converter:
+            return self.convert
+        # A greedy positional parameter shares one converter instance between its arguments
+        return _compile_converter(constructed)
+
+
 class Command(_BaseCommand, Generic[CogT, P, T]):
     r"""A class that implements the protocol for a bot text command.
 
@@ -509,7 +632,21 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         except AttributeError:
             globalns = {}
 
-        self.params: Dict[str, Parameter] = get_signature_parameters(function, globalns)
+        self.params = get_signature_parameters(function, globalns)
+
+    @property
+    def params(self) -> Dict[str, Parameter]:
+        """Dict[:class:`str`, :class:`Parameter`]: The parameters of the callback, by name.
+
+        Assigning a new dictionary recompiles how arguments are parsed. The dictionary
+        must be reassigned after it was modified in place for the change to apply.
+        """
+        return self._params
+
+    @params.setter
+    def params(self, value: Dict[str, Parameter]) -> None:
+        self._params: Dict[str, Parameter] = value
+        self._argument_plan: Tuple[_ParameterPlan, ...] = tuple(_ParameterPlan(param) for param in value.values())
 
     def add_check(self, func: UserCheck[Context[Any]], /) -> None:
         """Adds a check to the command.
@@ -647,71 +784,71 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             ctx.bot.dispatch('command_error', ctx, error)
 
     async def transform(self, ctx: Context[BotT], param: Parameter, attachments: _AttachmentIterator, /) -> Any:
-        converter = param.converter
-        consume_rest_is_special = param.kind == param.KEYWORD_ONLY and not self.rest_is_raw
+        for plan in self._argument_plan:
+            if plan.param is param:
+                break
+        else:
+            plan = _ParameterPlan(param)
+
+        return await self._transform(ctx, plan, attachments)
+
+    async def _transform(self, ctx: Context[BotT], plan: _ParameterPlan, attachments: _AttachmentIterator, /) -> Any:
+        param = plan.param
         view = ctx.view
         view.skip_ws()
 
-        # The greedy converter is simple -- it keeps going until it fails in which case,
-        # it undos the view ready for the next parameter to use instead
-        if isinstance(converter, Greedy):
-            # Special case for Greedy[discord.Attachment] to consume the attachments iterator
-            if converter.converter is discord.Attachment:
+        mode = plan.mode
+        if mode != _CONVERT:
+            # The greedy converter is simple -- it keeps going until it fails in which case,
+            # it undos the view ready for the next parameter to use instead
+            if mode == _GREEDY_ATTACHMENTS:
+                # Special case for Greedy[discord.Attachment] to consume the attachments iterator
                 return list(attachments)
-
-            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                return await self._transform_greedy_pos(ctx, param, param.required, converter.constructed_converter)
-            elif param.kind == param.VAR_POSITIONAL:
-                return await self._transform_greedy_var_pos(ctx, param, converter.constructed_converter)
-            else:
-                # if we're here, then it's a KEYWORD_ONLY param type
-                # since this is mostly useless, we'll helpfully transform Greedy[X]
-                # into just X and do the parsing that way.
-                converter = converter.constructed_converter
-
-        # Try to detect Optional[discord.Attachment] or discord.Attachment special converter
-        if converter is discord.Attachment:
-            try:
+            elif mode == _GREEDY_POSITIONAL:
+                return await self._transform_greedy_pos(ctx, param, param.required, plan.greedy_convert())
+            elif mode == _GREEDY_VAR_POSITIONAL:
+                return await self._transform_greedy_var_pos(ctx, param, plan.convert)
+            elif mode == _ATTACHMENT:
+                try:
+                    return next(attachments)
+                except StopIteration:
+                    raise MissingRequiredAttachment(param)
+            elif mode == _OPTIONAL_ATTACHMENT:
+                if attachments.is_empty():
+                    # I have no idea who would be doing Optional[discord.Attachment] = 1
+                    # but for those cases then 1 should be returned instead of None
+                    return None if param.default is param.empty else param.default
                 return next(attachments)
-            except StopIteration:
-                raise MissingRequiredAttachment(param)
-
-        if self._is_typing_optional(param.annotation) and param.annotation.__args__[0] is discord.Attachment:
-            if attachments.is_empty():
-                # I have no idea who would be doing Optional[discord.Attachment] = 1
-                # but for those cases then 1 should be returned instead of None
-                return None if param.default is param.empty else param.default
-            return next(attachments)
 
         if view.eof:
-            if param.kind == param.VAR_POSITIONAL:
+            if plan.kind == _VAR_POSITIONAL:
                 raise RuntimeError()  # break the loop
             if param.required:
-                if self._is_typing_optional(param.annotation):
+                if plan.optional:
                     return None
-                if hasattr(converter, '__commands_is_flag__') and converter._can_be_constructible():
+                converter = plan.converter
+                if plan.flag and converter._can_be_constructible():
                     return await converter._construct_default(ctx)
                 raise MissingRequiredArgument(param)
             return await param.get_default(ctx)
 
         previous = view.index
-        if consume_rest_is_special:
+        if plan.kind == _KEYWORD_ONLY and not self.rest_is_raw:
             ctx.current_argument = argument = view.read_rest().strip()
         else:
             try:
                 ctx.current_argument = argument = view.get_quoted_word()
             except ArgumentParsingError as exc:
-                if self._is_typing_optional(param.annotation):
+                if plan.optional:
                     view.index = previous
                     return None
                 else:
                     raise exc
         view.previous = previous
 
-        # type-checker fails to narrow argument
-        return await run_converters(ctx, converter, argument, param)  # type: ignore
+        return await plan.convert(ctx, argument, param)
 
-    async def _transform_greedy_pos(self, ctx: Context[BotT], param: Parameter, required: bool, converter: Any) -> Any:
+    async def _transform_greedy_pos(self, ctx: Context[BotT], param: Parameter, required: bool, convert: Any) -> Any:
         view = ctx.view
         result = []
         while not view.eof:
@@ -721,7 +858,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             view.skip_ws()
             try:
                 ctx.current_argument = argument = view.get_quoted_word()
-                value = await run_converters(ctx, converter, argument, param)  # type: ignore
+                value = await convert(ctx, argument, param)  # type: ignore
             except (CommandError, ArgumentParsingError):
                 view.index = previous
                 break
@@ -732,12 +869,12 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             return await param.get_default(ctx)
         return result
 
-    async def _transform_greedy_var_pos(self, ctx: Context[BotT], param: Parameter, converter: Any) -> Any:
+    async def _transform_greedy_var_pos(self, ctx: Context[BotT], param: Parameter, convert: Any) -> Any:
         view = ctx.view
         previous = view.index
         try:
             ctx.current_argument = argument = view.get_quoted_word()
-            value = await run_converters(ctx, converter, argument, param)  # type: ignore
+            value = await convert(ctx, argument, param)  # type: ignore
         except (CommandError, ArgumentParsingError):
             view.index = previous
             raise RuntimeError() from None  # break loop
@@ -834,27 +971,27 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         attachments = _AttachmentIterator(ctx.message.attachments)
 
         view = ctx.view
-        iterator = iter(self.params.items())
-
-        for name, param in iterator:
+        for plan in self._argument_plan:
+            param = plan.param
             ctx.current_parameter = param
-            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                transformed = await self.transform(ctx, param, attachments)
+            kind = plan.kind
+            if kind == _POSITIONAL:
+                transformed = await self._transform(ctx, plan, attachments)
                 args.append(transformed)
-            elif param.kind == param.KEYWORD_ONLY:
+            elif kind == _KEYWORD_ONLY:
                 # kwarg only param denotes "consume rest" semantics
                 if self.rest_is_raw:
                     ctx.current_argument = argument = view.read_rest()
-                    kwargs[name] = await run_converters(ctx, param.converter, argument, param)
+                    kwargs[plan.name] = await plan.raw_convert(ctx, argument, param)
                 else:
-                    kwargs[name] = await self.transform(ctx, param, attachments)
+                    kwargs[plan.name] = await self._transform(ctx, plan, attachments)
                 break
-            elif param.kind == param.VAR_POSITIONAL:
+            elif kind == _VAR_POSITIONAL:
                 if view.eof and self.require_var_positional:
                     raise MissingRequiredArgument(param)
                 while not view.eof:
                     try:
-                        transformed = await self.transform(ctx, param, attachments)
+                        transformed = await self._transform(ctx, plan, attachments)
                         args.append(transformed)
                     except RuntimeError:
                         break
@@ -906,13 +1043,17 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         if hook is not None:
             await hook(ctx)
 
-    def _prepare_cooldowns(self, ctx: Context[BotT]) -> None:
+    async def _prepare_cooldowns(self, ctx: Context[BotT]) -> None:
         if self._buckets.valid:
             dt = ctx.message.edited_at or ctx.message.created_at
             current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
             bucket = self._buckets.get_bucket(ctx, current)
             if bucket is not None:
-                retry_after = bucket.update_rate_limit(current)
+                if isinstance(bucket, _StoredCooldown):
+                    # Stored buckets may need to wait on their storage
+                    retry_after = await bucket._update_rate_limit_async(current)
+                else:
+                    retry_after = bucket.update_rate_limit(current)
                 if retry_after:
                     raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
 
@@ -929,9 +1070,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         try:
             if self.cooldown_after_parsing:
                 await self._parse_arguments(ctx)
-                self._prepare_cooldowns(ctx)
+                await self._prepare_cooldowns(ctx)
             else:
-                self._prepare_cooldowns(ctx)
+                await self._prepare_cooldowns(ctx)
                 await self._parse_arguments(ctx)
 
             await self.call_before_hooks(ctx)
@@ -1262,6 +1403,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         if not self.enabled:
             raise DisabledCommand(f'{self.name} command is disabled')
 
+        if getattr(ctx.bot, '_concurrent_checks', False):
+            return await self._can_run_concurrently(ctx)
+
         original = ctx.command
         ctx.command = self
 
@@ -1286,6 +1430,26 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         finally:
             ctx.command = original
 
+    async def _can_run_concurrently(self, ctx: Context[BotT], /) -> bool:
+        original = ctx.command
+        ctx.command = self
+
+        try:
+            checks: List[Callable[[Context[BotT]], Any]] = [ctx.bot.can_run]
+            cog = self.cog
+            if cog is not None:
+                local_check = Cog._get_overridden_method(cog.cog_check)
+                if local_check is not None:
+                    checks.append(local_check)
+            checks.extend(self.checks)
+
+            failed = await _first_failed_check(checks, ctx)
+            if failed == 0:
+                raise CheckFailure(f'The global check functions for command {self.qualified_name} failed.')
+            return failed == -1
+        finally:
+            ctx.command = original
+
 
 class GroupMixin(Generic[CogT]):
     """A mixin that implements common functionality for classes that behave
@@ -1835,7 +1999,32 @@ def group(
     return command(name=name, cls=cls, **attrs)
 
 
-def check(predicate: UserCheck[ContextT], /) -> Check[ContextT]:
+def _cache_check(predicate: UserCheck[ContextT], ttl: float, /) -> Callable[[ContextT], Coro[bool]]:
+    cache: BoundedCache[Tuple[Any, ...], Union[bool, CheckFailure]] = BoundedCache(max_size=1000, ttl=ttl, lru=False)
+
+    @functools.wraps(predicate)
+    async def wrapper(ctx: ContextT) -> bool:
+        command = ctx.command
+        key = (ctx.author.id, ctx.channel.id, command and command.qualified_name)
+        try:
+            result = cache[key]
+        except KeyError:
+            try:
+                result = await discord.utils.maybe_coroutine(predicate, ctx)
+            except CheckFailure as exc:
+                cache[key] = exc
+                raise
+            cache[key] = result
+            return result
+
+        if isinstance(result, CheckFailure):
+            raise result.with_traceback(None)
+        return result
+
+    return wrapper
+
+
+def check(predicate: UserCheck[ContextT], /, *, cache_ttl: Optional[float] = None) -> Check[ContextT]:
     r"""A decorator that adds a check to the :class:`.Command` or its
     subclasses. These checks could be accessed via :attr:`.Command.checks`.
 
@@ -1908,8 +2097,18 @@ def check(predicate: UserCheck[ContextT], /) -> Check[ContextT]:
     -----------
     predicate: Callable[[:class:`Context`], :class:`bool`]
         The predicate to check if the command should be invoked.
+    cache_ttl: Optional[:class:`float`]
+        The number of seconds the result of the predicate is reused for the same
+        author, channel and command, including a :exc:`.CheckFailure` it raised.
+        This suits checks that are expensive but change rarely, such as ones backed
+        by a database. Defaults to ``None``, which calls the predicate every time.
+
+        .. versionadded:: 2.1
     """
 
+    if cache_ttl is not None:
+        predicate = _cache_check(predicate, cache_ttl)
+
     def decorator(func: Union[Command[Any, ..., Any], CoroFunc]) -> Union[Command[Any, ..., Any], CoroFunc]:
         if isinstance(func, Command):
             func.checks.append(predicate)  # type: ignore
@@ -2372,6 +2571,8 @@ def cooldown(
     rate: int,
     per: float,
     type: Union[BucketType, Callable[[Context[Any]], Any]] = BucketType.default,
+    *,
+    storage: Optional[CooldownStorage] = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a cooldown to a :class:`.Command`
 
@@ -2401,13 +2602,18 @@ def cooldown(
         .. versionchanged:: 2.0
             When passing a callable, it now needs to accept :class:`.Context`
             rather than :class:`~discord.Message` as its only argument.
+    storage: Optional[:class:`.CooldownStorage`]
+        Where the state of the cooldown buckets is kept, for example a :class:`.SQLiteStorage`
+        to share the cooldown between processes. Defaults to keeping it in memory for this command.
+
+        .. versionadded:: 2.1
     """
 
     def decorator(func: Union[Command, CoroFunc]) -> Union[Command, CoroFunc]:
         if isinstance(func, Command):
-            func._buckets = CooldownMapping(Cooldown(rate, per), type)
+            func._buckets = CooldownMapping(Cooldown(rate, per), type, storage=storage)
         else:
-            func.__commands_cooldown__ = CooldownMapping(Cooldown(rate, per), type)
+            func.__commands_cooldown__ = CooldownMapping(Cooldown(rate, per), type, storage=storage)
         return func
 
     return decorator  # type: ignore
@@ -2416,6 +2622,8 @@ def cooldown(
 def dynamic_cooldown(
     cooldown: Callable[[Context[Any]], Optional[Cooldown]],
     type: Union[BucketType, Callable[[Context[Any]], Any]],
+    *,
+    storage: Optional[CooldownStorage] = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a dynamic cooldown to a :class:`.Command`
 
@@ -2444,6 +2652,11 @@ def dynamic_cooldown(
         apply to this invocation or ``None`` if the cooldown should be bypassed.
     type: :class:`.BucketType`
         The type of cooldown to have.
+    storage: Optional[:class:`.CooldownStorage`]
+        Where the state of the cooldown buckets is kept, for example a :class:`.SQLiteStorage`
+        to share the cooldown between processes. Defaults to keeping it in memory for this command.
+
+        .. versionadded:: 2.1
     """
     if not callable(cooldown):
         raise TypeError("A callable must be provided")
@@ -2453,15 +2666,17 @@ def dynamic_cooldown(
 
     def decorator(func: Union[Command, CoroFunc]) -> Union[Command, CoroFunc]:
         if isinstance(func, Command):
-            func._buckets = DynamicCooldownMapping(cooldown, type)
+            func._buckets = DynamicCooldownMapping(cooldown, type, storage=storage)
         else:
-            func.__commands_cooldown__ = DynamicCooldownMapping(cooldown, type)
+            func.__commands_cooldown__ = DynamicCooldownMapping(cooldown, type, storage=storage)
         return func
 
     return decorator  # type: ignore
 
 
-def max_concurrency(number: int, per: BucketType = BucketType.default, *, wait: bool = False) -> Callable[[T], T]:
+def max_concurrency(
+    number: int, per: BucketType = BucketType.default, *, wait: bool = False, storage: Optional[ConcurrencyStorage] = None
+) -> Callable[[T], T]:
     """A decorator that adds a maximum concurrency to a :class:`.Command` or its subclasses.
 
     This enables you to only allow a certain number of command invocations at the same time,
@@ -2483,10 +2698,15 @@ def max_concurrency(number: int, per: BucketType = BucketType.default, *, wait:
         then instead of waiting until the command can run again, the command raises
         :exc:`.MaxConcurrencyReached` to its error handler. If this is set to ``True``
         then the command waits until it can be executed.
+    storage: Optional[:class:`.ConcurrencyStorage`]
+        Where the concurrency counters are kept, for example a :class:`.SQLiteStorage`
+        to limit invocations across processes. Defaults to keeping them in memory for this command.
+
+        .. versionadded:: 2.1
     """
 
     def decorator(func: Union[Command, CoroFunc]) -> Union[Command, CoroFunc]:
-        value = MaxConcurrency(number, per=per, wait=wait)
+        value = MaxConcurrency(number, per=per, wait=wait, storage=storage)
         if isinstance(func, Command):
             func._max_concurrency = value
         else:
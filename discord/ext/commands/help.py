@@ -24,6 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import itertools
 import copy
 import functools
@@ -42,9 +43,11 @@ from typing import (
     Iterable,
     Sequence,
     Mapping,
+    MutableMapping,
 )
 
 import discord.utils
+from discord.cache import CachePolicy
 from discord.utils import MISSING
 
 from .core import Group, Command, get_signature_parameters
@@ -58,7 +61,6 @@ if TYPE_CHECKING:
     from .bot import BotBase
     from .context import Context
     from .cog import Cog
-    from .parameters import Parameter
 
     from ._types import (
         UserCheck,
@@ -222,7 +224,7 @@ class _HelpCommandImpl(Command):
         super().__init__(inject.command_callback, *args, **kwargs)
         self._original: HelpCommand = inject
         self._injected: HelpCommand = inject
-        self.params: Dict[str, Parameter] = get_signature_parameters(inject.command_callback, globals(), skip_parameters=1)
+        self.params = get_signature_parameters(inject.command_callback, globals(), skip_parameters=1)
 
     async def prepare(self, ctx: Context[Any]) -> None:
         self._injected = injected = self._original.copy()
@@ -329,6 +331,20 @@ class HelpCommand:
         This allows you to change the command behaviour without actually changing
         the implementation of the command. The attributes will be the same as the
         ones passed in the :class:`.Command` constructor.
+    page_cache: Optional[:class:`~discord.CachePolicy`]
+        The policy of the cache that holds rendered help pages, for the help commands
+        that support it such as :class:`DefaultHelpCommand` and :class:`MinimalHelpCommand`.
+        Pages are keyed by what they describe, the commands that passed
+        :meth:`filter_commands` and :meth:`get_page_cache_key`, and the cache is cleared
+        whenever a command is added to or removed from the bot. Defaults to ``None``, which
+        renders the pages on every invocation.
+
+        .. versionadded:: 2.1
+    max_concurrent_checks: :class:`int`
+        The maximum number of commands whose checks :meth:`filter_commands` awaits
+        at the same time. Defaults to ``1``, which verifies the commands one after the other.
+
+        .. versionadded:: 2.1
     """
 
     MENTION_TRANSFORMS = {
@@ -344,6 +360,9 @@ class HelpCommand:
         __original_kwargs__: Dict[str, Any]
         __original_args__: Tuple[Any, ...]
 
+    # Shared by every copy, see copy()
+    _page_cache: Optional[MutableMapping[Tuple[Any, ...], Tuple[List[str], int]]] = None
+
     def __new__(cls, *args: Any, **kwargs: Any) -> Self:
         # To prevent race conditions of a single instance while also allowing
         # for settings to be passed the original arguments passed must be assigned
@@ -367,14 +386,77 @@ class HelpCommand:
         self.command_attrs = attrs = options.pop('command_attrs', {})
         attrs.setdefault('name', 'help')
         attrs.setdefault('help', 'Shows this message')
+
+        self.max_concurrent_checks: int = options.pop('max_concurrent_checks', 1)
+        if self.max_concurrent_checks < 1:
+            raise ValueError('max_concurrent_checks must be at least 1')
+
+        page_cache: Optional[CachePolicy] = options.pop('page_cache', None)
+        if page_cache is not None:
+            if not isinstance(page_cache, CachePolicy):
+                raise TypeError(f'page_cache must be a CachePolicy not {page_cache.__class__.__name__}')
+            self._page_cache = page_cache.create_cache()
+
         self.context: Context[_Bot] = MISSING
         self._command_impl = _HelpCommandImpl(self, **self.command_attrs)
 
     def copy(self) -> Self:
         obj = self.__class__(*self.__original_args__, **self.__original_kwargs__)
         obj._command_impl = self._command_impl
+        obj._page_cache = self._page_cache
         return obj
 
+    def clear_page_cache(self) -> None:
+        """Clears the cached help pages.
+
+        This is done automatically when a command is added to or removed from
+        the bot, but not when a command's help text is edited.
+
+        .. versionadded:: 2.1
+        """
+        if self._page_cache is not None:
+            self._page_cache.clear()
+
+    def get_page_cache_key(self) -> Tuple[Any, ...]:
+        """Returns the part of the page cache key that depends on the invocation context.
+
+        Rendered pages are only reused for invocations that return an equal key.
+        By default this is the prefix and the name the help command was invoked
+        with. Subclasses whose formatting depends on anything else about the
+        context, such as :meth:`get_ending_note` mentioning the author or
+        per-guild settings, must include it here or disable the page cache.
+
+        .. versionadded:: 2.1
+
+        Returns
+        --------
+        Tuple[Any, ...]
+            The hashable key for the current context.
+        """
+        return (self.context.clean_prefix, self.invoked_with)
+
+    def _get_page_key(self, *parts: Any) -> Optional[Tuple[Any, ...]]:
+        if self._page_cache is None:
+            return None
+        return (*parts, *self.get_page_cache_key())
+
+    def _restore_pages(self, paginator: Paginator, key: Optional[Tuple[Any, ...]]) -> bool:
+        if key is None:
+            return False
+        try:
+            pages, count = self._page_cache[key]  # type: ignore # key is None without a cache
+        except KeyError:
+            return False
+        paginator.clear()
+        paginator._pages = pages.copy()
+        paginator._count = count
+        return True
+
+    def _store_pages(self, paginator: Paginator, key: Optional[Tuple[Any, ...]]) -> None:
+        if key is not None:
+            pages = paginator.pages
+            self._page_cache[key] = (pages.copy(), paginator._count)  # type: ignore
+
     def _add_to_bot(self, bot: BotBase) -> None:
         self._command_impl.update(**self.command_attrs)
         bot.add_command(self._command_impl)
@@ -612,6 +694,10 @@ class HelpCommand:
 
             ``commands`` parameter is now positional-only.
 
+        .. versionchanged:: 2.1
+
+            The checks of the commands can be evaluated concurrently, see ``max_concurrent_checks``.
+
         Parameters
         ------------
         commands: Iterable[:class:`Command`]
@@ -644,17 +730,30 @@ class HelpCommand:
             return sorted(iterator, key=key) if sort else list(iterator)  # type: ignore
 
         # if we're here then we need to check every command if it can run
-        async def predicate(cmd: Command[Any, ..., Any]) -> bool:
+        async def predicate(cmd: Command[Any, ..., Any], ctx: Context[_Bot]) -> bool:
             try:
-                return await cmd.can_run(self.context)
+                return await cmd.can_run(ctx)
             except CommandError:
                 return False
 
         ret = []
-        for cmd in iterator:
-            valid = await predicate(cmd)
-            if valid:
-                ret.append(cmd)
+        if self.max_concurrent_checks == 1:
+            for cmd in iterator:
+                valid = await predicate(cmd, self.context)
+                if valid:
+                    ret.append(cmd)
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+
+            # Each command gets its own copy of the context since can_run swaps ctx.command
+            # while its checks are awaited, which would race when they run concurrently.
+            async def limited(cmd: Command[Any, ..., Any]) -> bool:
+                async with semaphore:
+                    return await predicate(cmd, copy.copy(self.context))
+
+            candidates = list(iterator)
+            results = await asyncio.gather(*(limited(cmd) for cmd in candidates))
+            ret = [cmd for cmd, valid in zip(candidates, results) if valid]
 
         if sort:
             ret.sort(key=key)
@@ -1234,10 +1333,6 @@ class DefaultHelpCommand(HelpCommand):
         ctx = self.context
         bot = ctx.bot
 
-        if bot.description:
-            # <description> portion
-            self.paginator.add_line(bot.description, empty=True)
-
         no_category = f'\u200b{self.no_category}:'
 
         def get_category(command, *, no_category=no_category):
@@ -1245,6 +1340,14 @@ class DefaultHelpCommand(HelpCommand):
             return cog.qualified_name + ':' if cog is not None else no_category
 
         filtered = await self.filter_commands(bot.commands, sort=True, key=get_category)
+        key = self._get_page_key('bot', tuple(filtered))
+        if self._restore_pages(self.paginator, key):
+            return await self.send_pages()
+
+        if bot.description:
+            # <description> portion
+            self.paginator.add_line(bot.description, empty=True)
+
         max_size = self.get_max_size(filtered)
         to_iterate = itertools.groupby(filtered, key=get_category)
 
@@ -1258,17 +1361,24 @@ class DefaultHelpCommand(HelpCommand):
             self.paginator.add_line()
             self.paginator.add_line(note)
 
+        self._store_pages(self.paginator, key)
         await self.send_pages()
 
     async def send_command_help(self, command: Command[Any, ..., Any], /) -> None:
-        self.add_command_formatting(command)
-        self.paginator.close_page()
+        key = self._get_page_key('command', command)
+        if not self._restore_pages(self.paginator, key):
+            self.add_command_formatting(command)
+            self.paginator.close_page()
+            self._store_pages(self.paginator, key)
         await self.send_pages()
 
     async def send_group_help(self, group: Group[Any, ..., Any], /) -> None:
-        self.add_command_formatting(group)
-
         filtered = await self.filter_commands(group.commands, sort=self.sort_commands)
+        key = self._get_page_key('group', group, tuple(filtered))
+        if self._restore_pages(self.paginator, key):
+            return await self.send_pages()
+
+        self.add_command_formatting(group)
         self.add_indented_commands(filtered, heading=self.commands_heading)
 
         if filtered:
@@ -1277,13 +1387,18 @@ class DefaultHelpCommand(HelpCommand):
                 self.paginator.add_line()
                 self.paginator.add_line(note)
 
+        self._store_pages(self.paginator, key)
         await self.send_pages()
 
     async def send_cog_help(self, cog: Cog, /) -> None:
+        filtered = await self.filter_commands(cog.get_commands(), sort=self.sort_commands)
+        key = self._get_page_key('cog', cog, tuple(filtered))
+        if self._restore_pages(self.paginator, key):
+            return await self.send_pages()
+
         if cog.description:
             self.paginator.add_line(cog.description, empty=True)
 
-        filtered = await self.filter_commands(cog.get_commands(), sort=self.sort_commands)
         self.add_indented_commands(filtered, heading=self.commands_heading)
 
         note = self.get_ending_note()
@@ -1291,6 +1406,7 @@ class DefaultHelpCommand(HelpCommand):
             self.paginator.add_line()
             self.paginator.add_line(note)
 
+        self._store_pages(self.paginator, key)
         await self.send_pages()
 
 
@@ -1497,13 +1613,6 @@ class MinimalHelpCommand(HelpCommand):
         ctx = self.context
         bot = ctx.bot
 
-        if bot.description:
-            self.paginator.add_line(bot.description, empty=True)
-
-        note = self.get_opening_note()
-        if note:
-            self.paginator.add_line(note, empty=True)
-
         no_category = f'\u200b{self.no_category}'
 
         def get_category(command: Command[Any, ..., Any], *, no_category: str = no_category) -> str:
@@ -1511,6 +1620,17 @@ class MinimalHelpCommand(HelpCommand):
             return cog.qualified_name if cog is not None else no_category
 
         filtered = await self.filter_commands(bot.commands, sort=True, key=get_category)
+        key = self._get_page_key('bot', tuple(filtered))
+        if self._restore_pages(self.paginator, key):
+            return await self.send_pages()
+
+        if bot.description:
+            self.paginator.add_line(bot.description, empty=True)
+
+        note = self.get_opening_note()
+        if note:
+            self.paginator.add_line(note, empty=True)
+
         to_iterate = itertools.groupby(filtered, key=get_category)
 
         for category, commands in to_iterate:
@@ -1522,9 +1642,15 @@ class MinimalHelpCommand(HelpCommand):
             self.paginator.add_line()
             self.paginator.add_line(note)
 
+        self._store_pages(self.paginator, key)
         await self.send_pages()
 
     async def send_cog_help(self, cog: Cog, /) -> None:
+        filtered = await self.filter_commands(cog.get_commands(), sort=self.sort_commands)
+        key = self._get_page_key('cog', cog, tuple(filtered))
+        if self._restore_pages(self.paginator, key):
+            return await self.send_pages()
+
         bot = self.context.bot
         if bot.description:
             self.paginator.add_line(bot.description, empty=True)
@@ -1536,7 +1662,6 @@ class MinimalHelpCommand(HelpCommand):
         if cog.description:
             self.paginator.add_line(cog.description, empty=True)
 
-        filtered = await self.filter_commands(cog.get_commands(), sort=self.sort_commands)
         if filtered:
             self.paginator.add_line(f'**{cog.qualified_name} {self.commands_heading}**')
             for command in filtered:
@@ -1547,12 +1672,17 @@ class MinimalHelpCommand(HelpCommand):
                 self.paginator.add_line()
                 self.paginator.add_line(note)
 
+        self._store_pages(self.paginator, key)
         await self.send_pages()
 
     async def send_group_help(self, group: Group[Any, ..., Any], /) -> None:
+        filtered = await self.filter_commands(group.commands, sort=self.sort_commands)
+        key = self._get_page_key('group', group, tuple(filtered))
+        if self._restore_pages(self.paginator, key):
+            return await self.send_pages()
+
         self.add_command_formatting(group)
 
-        filtered = await self.filter_commands(group.commands, sort=self.sort_commands)
         if filtered:
             note = self.get_opening_note()
             if note:
@@ -1567,9 +1697,13 @@ class MinimalHelpCommand(HelpCommand):
                 self.paginator.add_line()
                 self.paginator.add_line(note)
 
+        self._store_pages(self.paginator, key)
         await self.send_pages()
 
     async def send_command_help(self, command: Command[Any, ..., Any], /) -> None:
-        self.add_command_formatting(command)
-        self.paginator.close_page()
+        key = self._get_page_key('command', command)
+        if not self._restore_pages(self.paginator, key):
+            self.add_command_formatting(command)
+            self.paginator.close_page()
+            self._store_pages(self.paginator, key)
         await self.send_pages()
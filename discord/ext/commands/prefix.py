@@ -0,0 +1,168 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import functools
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# fmt: off
+__all__ = (
+    'PrefixMatcher',
+)
+# fmt: on
+
+
+class PrefixMatcher:
+    """A precompiled set of command prefixes.
+
+    The prefixes are stored in a trie so that a message can be matched, or
+    rejected, by looking at no more characters than the longest prefix. When
+    several prefixes match, the one that was passed first wins, just like
+    with a plain list of prefixes.
+
+    This can be used as :attr:`.Bot.command_prefix` or returned from a
+    ``command_prefix`` callable. Iterating over it yields the prefixes.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    \\*prefixes: :class:`str`
+        The prefixes to match, in order of priority.
+    ttl: Optional[:class:`float`]
+        The number of seconds the bot may reuse this matcher for other messages
+        in the same guild (or private channel) when it is returned from a
+        ``command_prefix`` callable, instead of calling it again. The time is
+        counted from when the bot caches the matcher, so the same instance can
+        be returned more than once. Defaults to
+        ``None``, which means the matcher is only used for the message it was
+        returned for.
+
+    Attributes
+    -----------
+    ttl: Optional[:class:`float`]
+        The number of seconds this matcher may be reused for.
+    """
+
+    __slots__ = ('_prefixes', '_root', '_depth', 'ttl')
+
+    def __init__(self, *prefixes: str, ttl: Optional[float] = None) -> None:
+        root: Dict[Any, Any] = {}
+        depth = 0
+        for index, prefix in enumerate(prefixes):
+            if not isinstance(prefix, str):
+                raise TypeError(
+                    "Iterable command_prefix or list returned from get_prefix must "
+                    f"contain only strings, not {prefix.__class__.__name__}"
+                )
+
+            node = root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            # Single characters are the only other keys, so None marks a terminal node.
+            # The first prefix given keeps its priority if it's repeated.
+            node.setdefault(None, index)
+            depth = max(depth, len(prefix))
+
+        self._prefixes: Tuple[str, ...] = prefixes
+        self._root: Dict[Any, Any] = root
+        self._depth: int = depth
+        self.ttl: Optional[float] = ttl
+
+    def __repr__(self) -> str:
+        return f'<PrefixMatcher prefixes={self._prefixes!r} ttl={self.ttl}>'
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._prefixes)
+
+    def __len__(self) -> int:
+        return len(self._prefixes)
+
+    @property
+    def prefixes(self) -> Tuple[str, ...]:
+        """Tuple[:class:`str`]: The prefixes this matcher was created with."""
+        return self._prefixes
+
+    def match(self, content: str, /) -> Optional[str]:
+        """Returns the prefix that ``content`` starts with.
+
+        Parameters
+        -----------
+        content: :class:`str`
+            The message content to match.
+
+        Returns
+        --------
+        Optional[:class:`str`]
+            The matched prefix or ``None`` if the content does not start with any of them.
+        """
+        node = self._root
+        best = node.get(None)
+        for char in content[: self._depth]:
+            node = node.get(char)
+            if node is None:
+                break
+            index = node.get(None)
+            if index is not None and (best is None or index < best):
+                best = index
+
+        if best is None:
+            return None
+        return self._prefixes[best]
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_matcher(*prefixes: str) -> PrefixMatcher:
+    return PrefixMatcher(*prefixes)
+
+
+def _compile_prefix(prefix: Any) -> PrefixMatcher:
+    # Plain prefixes are compiled once per distinct value, so that a static
+    # command_prefix or a callable returning the same list each time reuses one trie.
+    if isinstance(prefix, PrefixMatcher):
+        return prefix
+
+    if isinstance(prefix, str):
+        return _cached_matcher(prefix)
+
+    try:
+        prefixes = tuple(prefix)
+    except TypeError:
+        # It's possible that a generator raised this exception.  Don't
+        # replace it with our own error if that's the case.
+        if isinstance(prefix, collections.abc.Iterable):
+            raise
+
+        raise TypeError(
+            "command_prefix must be plain string, iterable of strings, or callable "
+            f"returning either of these, not {prefix.__class__.__name__}"
+        )
+
+    try:
+        return _cached_matcher(*prefixes)
+    except TypeError:
+        # An unhashable value was passed, let the matcher report it.
+        return PrefixMatcher(*prefixes)
@@ -26,14 +26,23 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import heapq
+import itertools
 import logging
+import math
+import random
+import time as _time
 from typing import (
     Any,
     Callable,
     Coroutine,
     Generic,
+    Iterator,
     List,
+    Literal,
     Optional,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -52,6 +61,8 @@ _log = logging.getLogger(__name__)
 # fmt: off
 __all__ = (
     'loop',
+    'Scheduler',
+    'LoopStats',
 )
 # fmt: on
 
@@ -60,6 +71,7 @@ _func = Callable[..., Coroutine[Any, Any, Any]]
 LF = TypeVar('LF', bound=_func)
 FT = TypeVar('FT', bound=_func)
 ET = TypeVar('ET', bound=Callable[[Any, BaseException], Coroutine[Any, Any, Any]])
+OverrunPolicy = Literal['catch_up', 'skip', 'concurrent']
 
 
 def is_ambiguous(dt: datetime.datetime) -> bool:
@@ -134,6 +146,255 @@ class SleepHandle:
         self.future.cancel()
 
 
+class _ScheduledSleep:
+    # The SleepHandle counterpart for loops driven by a Scheduler
+    __slots__ = ('future', 'scheduler', 'when')
+
+    def __init__(self, scheduler: Scheduler, future: asyncio.Future[None]) -> None:
+        self.scheduler: Scheduler = scheduler
+        self.future: asyncio.Future[None] = future
+        self.when: float = 0.0
+
+    def recalculate(self, dt: datetime.datetime) -> None:
+        self.scheduler._push(self, dt)
+
+    def wait(self) -> asyncio.Future[Any]:
+        return self.future
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> None:
+        self.future.cancel()
+        self.scheduler._cancelled(self)
+
+
+class Scheduler:
+    """Drives the sleeps of many :class:`Loop` instances from a single timer.
+
+    Every :class:`Loop` normally schedules its own timer in the event loop.
+    Loops created with a scheduler share one heap of deadlines instead, and loops
+    that are due within the same :attr:`resolution` are woken up together.
+
+    A scheduler is bound to the event loop it is first used in, until none of its
+    loops are sleeping anymore.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    ------------
+    resolution: :class:`float`
+        The granularity of the deadlines in seconds. Deadlines are rounded up to a
+        multiple of it, so that loops due in the same tick are woken up at once.
+        Defaults to ``0``, which keeps the exact deadlines.
+    jitter: :class:`float`
+        The maximum number of seconds added at random to every deadline, to spread
+        out loops that would otherwise all run at the same time. Defaults to ``0``.
+
+    Attributes
+    ------------
+    resolution: :class:`float`
+        The granularity of the deadlines in seconds.
+    jitter: :class:`float`
+        The maximum number of seconds added at random to every deadline.
+    wakeups: :class:`int`
+        The number of times a loop was woken up.
+    overruns: :class:`int`
+        The number of times a loop asked to sleep until a time that had already passed,
+        usually because its previous iteration took longer than its interval.
+    max_lag: :class:`float`
+        The longest time in seconds a loop was woken up after its deadline.
+    total_lag: :class:`float`
+        The sum of the times in seconds loops were woken up after their deadline.
+    """
+
+    def __init__(self, *, resolution: float = 0.0, jitter: float = 0.0) -> None:
+        if resolution < 0 or jitter < 0:
+            raise ValueError('resolution and jitter cannot be less than zero.')
+
+        self.resolution: float = resolution
+        self.jitter: float = jitter
+        self.wakeups: int = 0
+        self.overruns: int = 0
+        self.max_lag: float = 0.0
+        self.total_lag: float = 0.0
+        # Entries are (deadline, sequence, sleep), rescheduled sleeps leave stale entries behind
+        # which are skipped when their deadline doesn't match the sleep's current one.
+        self._heap: List[Tuple[float, int, _ScheduledSleep]] = []
+        self._sequence: Iterator[int] = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_when: float = math.inf
+        self._clock_resolution: float = _time.get_clock_info('monotonic').resolution
+
+    def __repr__(self) -> str:
+        return f'<Scheduler resolution={self.resolution} jitter={self.jitter} pending={self.pending}>'
+
+    @property
+    def pending(self) -> int:
+        """:class:`int`: The number of loops currently sleeping."""
+        return sum(1 for entry in self._heap if self._is_live(entry))
+
+    @property
+    def average_lag(self) -> float:
+        """:class:`float`: The average time in seconds a loop was woken up after its deadline."""
+        return self.total_lag / self.wakeups if self.wakeups else 0.0
+
+    def reset_stats(self) -> None:
+        """Resets :attr:`wakeups`, :attr:`overruns` and the lag statistics."""
+        self.wakeups = self.overruns = 0
+        self.max_lag = self.total_lag = 0.0
+
+    @staticmethod
+    def _is_live(entry: Tuple[float, int, _ScheduledSleep]) -> bool:
+        when, _, sleep = entry
+        return sleep.when == when and not sleep.done()
+
+    def _cancelled(self, sleep: _ScheduledSleep) -> None:
+        # Cancelled entries are normally skipped by _wake, the timer only has to move
+        # when the cancelled sleep is the next one due
+        heap = self._heap
+        if not heap or heap[0][2] is not sleep:
+            return
+
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+        if heap:
+            if heap[0][0] != self._timer_when:
+                self._set_timer(heap[0][0])
+        else:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._timer_when = math.inf
+
+    def _sleep_until(self, dt: datetime.datetime) -> _ScheduledSleep:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sleeps left behind by a previous event loop were cancelled when it shut down
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            if self._heap:
+                raise RuntimeError('Scheduler is already used by another event loop.')
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._timer_when = math.inf
+            self._loop = loop
+
+        sleep = _ScheduledSleep(self, loop.create_future())
+        self._push(sleep, dt)
+        return sleep
+
+    def _push(self, sleep: _ScheduledSleep, dt: datetime.datetime) -> None:
+        loop: asyncio.AbstractEventLoop = self._loop  # type: ignore # only called after binding
+        now = loop.time()
+        if dt.tzinfo is None:
+            dt = dt.astimezone()
+        delay = (dt - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        if delay < 0:
+            self.overruns += 1
+            delay = 0.0
+
+        when = now + delay
+        if self.jitter:
+            when += random.uniform(0, self.jitter)
+        if self.resolution:
+            when = math.ceil(when / self.resolution) * self.resolution
+
+        sleep.when = when
+        heapq.heappush(self._heap, (when, next(self._sequence), sleep))
+        if when < self._timer_when:
+            self._set_timer(when)
+
+    def _set_timer(self, when: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_when = when
+        self._timer = self._loop.call_at(when, self._wake)  # type: ignore
+
+    def _wake(self) -> None:
+        self._timer = None
+        self._timer_when = math.inf
+
+        now = self._loop.time()  # type: ignore
+        # The event loop runs timers that are due within its clock resolution
+        limit = now + self._clock_resolution
+        heap = self._heap
+        while heap and heap[0][0] <= limit:
+            when, _, sleep = heapq.heappop(heap)
+            if sleep.when != when or sleep.future.done():
+                continue
+
+            lag = max(now - when, 0.0)
+            self.wakeups += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+            sleep.future.set_result(None)
+
+        while heap:
+            if self._is_live(heap[0]):
+                self._set_timer(heap[0][0])
+                break
+            heapq.heappop(heap)
+
+
+class LoopStats:
+    """Timing statistics of the iterations of a :class:`Loop`.
+
+    .. versionadded:: 2.1
+
+    Attributes
+    ------------
+    iterations: :class:`int`
+        The number of iterations that finished, including ones that failed or timed out.
+    overruns: :class:`int`
+        The number of times an iteration finished after the next one was due.
+    skipped: :class:`int`
+        The number of iterations that were skipped because of an overrun.
+    timeouts: :class:`int`
+        The number of iterations that were cancelled because they exceeded the loop's timeout.
+    last_duration: :class:`float`
+        How long the last iteration took, in seconds.
+    max_duration: :class:`float`
+        How long the longest iteration took, in seconds.
+    total_duration: :class:`float`
+        How long all iterations took combined, in seconds.
+    """
+
+    __slots__ = ('iterations', 'overruns', 'skipped', 'timeouts', 'last_duration', 'max_duration', 'total_duration')
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f'<LoopStats iterations={self.iterations} overruns={self.overruns} skipped={self.skipped} '
+            f'timeouts={self.timeouts} average_duration={self.average_duration}>'
+        )
+
+    @property
+    def average_duration(self) -> float:
+        """:class:`float`: How long an iteration took on average, in seconds."""
+        return self.total_duration / self.iterations if self.iterations else 0.0
+
+    def reset(self) -> None:
+        """Resets every statistic to zero."""
+        self.iterations: int = 0
+        self.overruns: int = 0
+        self.skipped: int = 0
+        self.timeouts: int = 0
+        self.last_duration: float = 0.0
+        self.max_duration: float = 0.0
+        self.total_duration: float = 0.0
+
+    def _record(self, duration: float) -> None:
+        self.iterations += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+
 class Loop(Generic[LF]):
     """A background task helper that abstracts the loop and reconnection logic for you.
 
@@ -150,12 +411,24 @@ class Loop(Generic[LF]):
         count: Optional[int],
         reconnect: bool,
         name: Optional[str],
+        scheduler: Optional[Scheduler] = None,
+        overrun: OverrunPolicy = 'catch_up',
+        max_concurrent: int = 2,
+        timeout: Optional[float] = None,
     ) -> None:
         self.coro: LF = coro
         self.reconnect: bool = reconnect
+        self.scheduler: Optional[Scheduler] = scheduler
+        self.overrun: OverrunPolicy = overrun
+        self.max_concurrent: int = max_concurrent
+        self.timeout: Optional[float] = timeout
+        self._stats: LoopStats = LoopStats()
+        self._iteration_tasks: Set[asyncio.Task[None]] = set()
+        self._iteration_slots: Optional[asyncio.Semaphore] = None
+        self._iteration_error: Optional[BaseException] = None
         self.count: Optional[int] = count
         self._current_loop = 0
-        self._handle: Optional[SleepHandle] = None
+        self._handle: Optional[Union[SleepHandle, _ScheduledSleep]] = None
         self._task: Optional[asyncio.Task[None]] = None
         self._injected = None
         self._valid_exception = (
@@ -176,6 +449,15 @@ class Loop(Generic[LF]):
         if self.count is not None and self.count <= 0:
             raise ValueError('count must be greater than 0 or None.')
 
+        if overrun not in ('catch_up', 'skip', 'concurrent'):
+            raise ValueError(f"overrun must be 'catch_up', 'skip' or 'concurrent', not {overrun!r}.")
+
+        if max_concurrent <= 0:
+            raise ValueError('max_concurrent must be greater than 0.')
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError('timeout must be greater than 0 or None.')
+
         self.change_interval(seconds=seconds, minutes=minutes, hours=hours, time=time)
         self._last_iteration_failed = False
         self._last_iteration: datetime.datetime = MISSING
@@ -195,7 +477,10 @@ class Loop(Generic[LF]):
             await coro(*args, **kwargs)
 
     def _try_sleep_until(self, dt: datetime.datetime):
-        self._handle = SleepHandle(dt=dt, loop=asyncio.get_running_loop())
+        if self.scheduler is not None:
+            self._handle = self.scheduler._sleep_until(dt)
+        else:
+            self._handle = SleepHandle(dt=dt, loop=asyncio.get_running_loop())
         return self._handle.wait()
 
     def _is_relative_time(self) -> bool:
@@ -204,6 +489,96 @@ class Loop(Generic[LF]):
     def _is_explicit_time(self) -> bool:
         return self._time is not MISSING
 
+    async def _run_iteration(self, *args: Any, **kwargs: Any) -> None:
+        start = _time.perf_counter()
+        try:
+            if self.timeout is None:
+                await self.coro(*args, **kwargs)
+                return
+
+            # A task is used rather than wait_for so that a TimeoutError raised
+            # by the body itself isn't mistaken for the timeout.
+            task = asyncio.create_task(self.coro(*args, **kwargs))
+            try:
+                done, _ = await asyncio.wait((task,), timeout=self.timeout)
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+
+            if not done:
+                task.cancel()
+                await asyncio.wait((task,))
+                self._stats.timeouts += 1
+                _log.warning('Iteration of task %s timed out after %s seconds.', self.coro.__qualname__, self.timeout)
+                return
+
+            task.result()
+        finally:
+            self._stats._record(_time.perf_counter() - start)
+
+    async def _start_iteration(self, *args: Any, **kwargs: Any) -> None:
+        if self.overrun != 'concurrent':
+            await self._run_iteration(*args, **kwargs)
+            return
+
+        self._raise_iteration_error()
+        if self._iteration_slots is None:
+            self._iteration_slots = asyncio.Semaphore(self.max_concurrent)
+
+        await self._iteration_slots.acquire()
+        task = asyncio.create_task(self._run_iteration(*args, **kwargs))
+        self._iteration_tasks.add(task)
+        task.add_done_callback(self._iteration_done)
+
+    def _iteration_done(self, task: asyncio.Task[None]) -> None:
+        self._iteration_tasks.discard(task)
+        if self._iteration_slots is not None:
+            self._iteration_slots.release()
+
+        if task.cancelled():
+            return
+
+        exc = task.exception()
+        if exc is None:
+            return
+
+        if isinstance(exc, self._valid_exception) and self.reconnect:
+            _log.warning('Iteration of task %s raised a handled exception.', self.coro.__qualname__, exc_info=exc)
+        elif self._iteration_error is None:
+            self._iteration_error = exc
+
+    def _raise_iteration_error(self) -> None:
+        # Errors of concurrent iterations are raised by the loop once it gets to the next one
+        exc = self._iteration_error
+        if exc is not None:
+            self._iteration_error = None
+            raise exc
+
+    async def _finish_iterations(self) -> None:
+        tasks = self._iteration_tasks
+        if tasks:
+            if self._is_being_cancelled or self._has_failed:
+                for task in tasks:
+                    task.cancel()
+            await asyncio.wait(tasks)
+
+    def _handle_overrun(self) -> None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        if self._next_iteration >= now:
+            return
+
+        self._stats.overruns += 1
+        if self.overrun != 'skip':
+            return
+
+        if self._is_explicit_time():
+            self._next_iteration = self._get_next_sleep_time(now)
+            self._stats.skipped += 1
+        elif self._sleep_delta:
+            missed = (now - self._next_iteration) // self._sleep_delta + 1
+            self._next_iteration += missed * self._sleep_delta
+            self._stats.skipped += missed
+
     async def _loop(self, *args: Any, **kwargs: Any) -> None:
         backoff = ExponentialBackoff()
         await self._call_loop_function('before_loop')
@@ -243,7 +618,7 @@ class Loop(Generic[LF]):
                         self._next_iteration = self._get_next_sleep_time()
 
                 try:
-                    await self.coro(*args, **kwargs)
+                    await self._start_iteration(*args, **kwargs)
                     self._last_iteration_failed = False
                 except self._valid_exception:
                     self._last_iteration_failed = True
@@ -252,7 +627,9 @@ class Loop(Generic[LF]):
                     await asyncio.sleep(backoff.delay())
                 else:
                     if self._stop_next_iteration:
-                        return
+                        break
+
+                    self._handle_overrun()
 
                     # sleep after the body of the task for relative time intervals
                     if self._is_relative_time():
@@ -262,6 +639,9 @@ class Loop(Generic[LF]):
                     if self._current_loop == self.count:
                         break
 
+            # concurrent iterations may still be running, their errors are the loop's errors
+            await self._finish_iterations()
+            self._raise_iteration_error()
         except asyncio.CancelledError:
             self._is_being_cancelled = True
             raise
@@ -270,6 +650,9 @@ class Loop(Generic[LF]):
             await self._call_loop_function('error', exc)
             raise exc
         finally:
+            await self._finish_iterations()
+            self._iteration_slots = None
+            self._iteration_error = None
             await self._call_loop_function('after_loop')
             if self._handle:
                 self._handle.cancel()
@@ -290,6 +673,10 @@ class Loop(Generic[LF]):
             count=self.count,
             reconnect=self.reconnect,
             name=self._name,
+            scheduler=self.scheduler,
+            overrun=self.overrun,
+            max_concurrent=self.max_concurrent,
+            timeout=self.timeout,
         )
         copy._injected = obj
         copy._before_loop = self._before_loop
@@ -338,6 +725,14 @@ class Loop(Generic[LF]):
         if self._time is not MISSING:
             return self._time.copy()
 
+    @property
+    def stats(self) -> LoopStats:
+        """:class:`LoopStats`: The timing statistics of the loop's iterations.
+
+        .. versionadded:: 2.1
+        """
+        return self._stats
+
     @property
     def current_loop(self) -> int:
         """:class:`int`: The current iteration of the loop."""
@@ -632,7 +1027,7 @@ class Loop(Generic[LF]):
 
     def _get_next_sleep_time(self, now: datetime.datetime = MISSING) -> datetime.datetime:
         if self._sleep is not MISSING:
-            return self._last_iteration + datetime.timedelta(seconds=self._sleep)
+            return self._last_iteration + self._sleep_delta
 
         if now is MISSING:
             now = datetime.datetime.now(datetime.timezone.utc)
@@ -752,6 +1147,7 @@ class Loop(Generic[LF]):
                 raise ValueError('Total number of seconds cannot be less than zero.')
 
             self._sleep = sleep
+            self._sleep_delta: datetime.timedelta = datetime.timedelta(seconds=sleep)
             self._seconds = float(seconds)
             self._hours = float(hours)
             self._minutes = float(minutes)
@@ -761,6 +1157,7 @@ class Loop(Generic[LF]):
                 raise TypeError('Cannot mix explicit time with relative time')
             self._time = self._get_time_parameter(time)
             self._sleep = self._seconds = self._minutes = self._hours = MISSING
+            self._sleep_delta = MISSING
 
         # Only update the interval if we've ran the body at least once
         if self.is_running() and self._last_iteration is not MISSING:
@@ -779,6 +1176,10 @@ def loop(
     count: Optional[int] = None,
     reconnect: bool = True,
     name: Optional[str] = None,
+    scheduler: Optional[Scheduler] = None,
+    overrun: OverrunPolicy = 'catch_up',
+    max_concurrent: int = 2,
+    timeout: Optional[float] = None,
 ) -> Callable[[LF], Loop[LF]]:
     """A decorator that schedules a task in the background for you with
     optional reconnect logic. The decorator returns a :class:`Loop`.
@@ -816,6 +1217,35 @@ def loop(
         it is assigned a name based off of the callable name
         such as ``discord-ext-tasks: function_name``.
 
+        .. versionadded:: 2.1
+    scheduler: Optional[:class:`Scheduler`]
+        The scheduler that drives the sleeps of this loop. Sharing one between many
+        loops replaces their individual timers with a single one. Defaults to ``None``,
+        which gives the loop its own timer.
+
+        .. versionadded:: 2.1
+    overrun: :class:`str`
+        What to do when an iteration takes longer than the interval, so that the next
+        iteration is already due when it finishes. ``'catch_up'`` runs the missed
+        iterations back to back, ``'skip'`` skips them and waits for the next one that
+        is still ahead, and ``'concurrent'`` starts every iteration on schedule, even
+        while earlier ones are still running, up to ``max_concurrent`` at a time.
+        Defaults to ``'catch_up'``.
+
+        Errors raised by concurrent iterations are raised by the loop when it starts
+        the next iteration.
+
+        .. versionadded:: 2.1
+    max_concurrent: :class:`int`
+        The maximum number of iterations running at the same time when ``overrun``
+        is ``'concurrent'``. Defaults to 2.
+
+        .. versionadded:: 2.1
+    timeout: Optional[:class:`float`]
+        The number of seconds after which an iteration is cancelled. A timed out iteration
+        is logged and counted in :attr:`Loop.stats`, then the loop carries on.
+        Defaults to ``None``, which lets iterations run for as long as they need.
+
         .. versionadded:: 2.1
 
     Raises
@@ -837,6 +1267,10 @@ def loop(
             time=time,
             reconnect=reconnect,
             name=name,
+            scheduler=scheduler,
+            overrun=overrun,
+            max_concurrent=max_concurrent,
+            timeout=timeout,
         )
 
     return decorator
@@ -82,6 +82,8 @@ __all__ = (
 
 BF = TypeVar('BF', bound='BaseFlags')
 
+_new = object.__new__
+
 
 class flag_value:
     def __init__(self, func: Callable[[Any], int]):
@@ -122,9 +124,17 @@ def fill_with_flags(*, inverted: bool = False) -> Callable[[Type[BF]], Type[BF]]
         }
         # fmt: on
 
+        # Precomputed so that iterating and inverting flags doesn't walk the class namespace
+        cls._FLAG_ITEMS = tuple(
+            (name, value.flag)
+            for name, value in cls.__dict__.items()
+            if isinstance(value, flag_value) and not isinstance(value, alias_flag_value)
+        )
+        max_bits = max(cls.VALID_FLAGS.values()).bit_length() if cls.VALID_FLAGS else 0
+        cls._ALL_VALUE = -1 + (2**max_bits)
+
         if inverted:
-            max_bits = max(cls.VALID_FLAGS.values()).bit_length()
-            cls.DEFAULT_VALUE = -1 + (2**max_bits)
+            cls.DEFAULT_VALUE = cls._ALL_VALUE
         else:
             cls.DEFAULT_VALUE = 0
 
@@ -137,6 +147,8 @@ def fill_with_flags(*, inverted: bool = False) -> Callable[[Type[BF]], Type[BF]]
 class BaseFlags:
     VALID_FLAGS: ClassVar[Dict[str, int]]
     DEFAULT_VALUE: ClassVar[int]
+    _FLAG_ITEMS: ClassVar[Tuple[Tuple[str, int], ...]]
+    _ALL_VALUE: ClassVar[int]
 
     value: int
 
@@ -151,7 +163,8 @@ class BaseFlags:
 
     @classmethod
     def _from_value(cls, value: int) -> Self:
-        self = cls.__new__(cls)
+        # Bypasses __init__, as this is called for every flags field of every parsed object
+        self = _new(cls)
         self.value = value
         return self
 
@@ -177,9 +190,7 @@ class BaseFlags:
         return self
 
     def __invert__(self) -> Self:
-        max_bits = max(self.VALID_FLAGS.values()).bit_length()
-        max_value = -1 + (2**max_bits)
-        return self._from_value(self.value ^ max_value)
+        return self._from_value(self.value ^ self._ALL_VALUE)
 
     def __bool__(self) -> bool:
         return self.value != self.DEFAULT_VALUE
@@ -197,12 +208,9 @@ class BaseFlags:
         return f'<{self.__class__.__name__} value={self.value}>'
 
     def __iter__(self) -> Iterator[Tuple[str, bool]]:
-        for name, value in self.__class__.__dict__.items():
-            if isinstance(value, alias_flag_value):
-                continue
-
-            if isinstance(value, flag_value):
-                yield (name, self._has_flag(value.flag))
+        has_flag = self._has_flag
+        for name, flag in self._FLAG_ITEMS:
+            yield (name, has_flag(flag))
 
     def _has_flag(self, o: int) -> bool:
         return (self.value & o) == o
@@ -219,7 +227,7 @@ class BaseFlags:
 class ArrayFlags(BaseFlags):
     @classmethod
     def _from_value(cls: Type[Self], value: Sequence[int]) -> Self:
-        self = cls.__new__(cls)
+        self = _new(cls)
         # This is a micro-optimization given the frequency this object can be created.
         # (1).__lshift__ is used in place of lambda x: 1 << x
         # prebinding to a method of a constant rather than define a lambda.
@@ -53,6 +53,7 @@ __all__ = (
     'VoiceKeepAliveHandler',
     'DiscordVoiceWebSocket',
     'ReconnectWebSocket',
+    'GatewayStats',
 )
 
 if TYPE_CHECKING:
@@ -138,6 +139,68 @@ class GatewayRatelimiter:
                 await asyncio.sleep(delta)
 
 
+class GatewayStats:
+    """Keeps track of how gateway sessions were established and resumed.
+
+    A single instance is shared by every websocket a :class:`Client` opens.
+
+    .. versionadded:: 2.1
+
+    Attributes
+    -----------
+    identifies: :class:`int`
+        The number of IDENTIFYs sent, i.e. the number of full sessions started.
+    resumes: :class:`int`
+        The number of RESUMEs attempted.
+    failed_resumes: :class:`int`
+        The number of RESUMEs that were rejected and fell back to an IDENTIFY.
+    reconciled_readies: :class:`int`
+        The number of READYs that were reconciled against the existing cache
+        rather than rebuilding it from scratch. Only non-zero with ``reconcile_ready`` enabled.
+    replayed_events: :class:`int`
+        The total number of events replayed by the gateway across all RESUMEs.
+    last_replayed_events: :class:`int`
+        The number of events replayed by the last successful RESUME.
+    last_resume_duration: Optional[:class:`float`]
+        The number of seconds the last successful RESUME took, from sending
+        the RESUME payload to receiving RESUMED.
+    sequence_gaps: :class:`int`
+        The number of times a dispatched event's sequence skipped ahead.
+    missed_events: :class:`int`
+        The number of events that were skipped over by sequence gaps.
+    """
+
+    __slots__ = (
+        'identifies',
+        'resumes',
+        'failed_resumes',
+        'reconciled_readies',
+        'replayed_events',
+        'last_replayed_events',
+        'last_resume_duration',
+        'sequence_gaps',
+        'missed_events',
+    )
+
+    def __init__(self) -> None:
+        self.identifies: int = 0
+        self.resumes: int = 0
+        self.failed_resumes: int = 0
+        self.reconciled_readies: int = 0
+        self.replayed_events: int = 0
+        self.last_replayed_events: int = 0
+        self.last_resume_duration: Optional[float] = None
+        self.sequence_gaps: int = 0
+        self.missed_events: int = 0
+
+    def __repr__(self) -> str:
+        attrs = ' '.join(f'{attr}={getattr(self, attr)!r}' for attr in self.__slots__)
+        return f'<GatewayStats {attrs}>'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+
 class KeepAliveHandler:  # Inspired by enhanced-discord.py/Gnome
     def __init__(self, *, ws: DiscordWebSocket, interval: Optional[float] = None):
         self.ws: DiscordWebSocket = ws
@@ -324,6 +387,11 @@ class DiscordWebSocket:
         self._resume_trace: List[str] = []
         self._initial_identify: bool = False
 
+        # Resume accounting
+        self._stats: GatewayStats = GatewayStats()
+        self._resume_started: Optional[float] = None
+        self._replayed: int = 0
+
         # Presence state tracking
         self.afk: bool = False
         self.idle_since: int = 0
@@ -392,6 +460,7 @@ class DiscordWebSocket:
         ws._transport_compression = compress
         ws.afk = client._connection._afk
         ws.idle_since = client._connection._idle_since
+        ws._stats = client._connection.gateway_stats
 
         if client._enable_debug_events:
             ws.send = ws.debug_send
@@ -481,6 +550,7 @@ class DiscordWebSocket:
         await self.send_as_json(payload)
         _log.debug('Gateway has sent the IDENTIFY payload.')
         self._initial_identify = True
+        self._stats.identifies += 1
 
     async def resume(self) -> None:
         """Sends the RESUME packet."""
@@ -495,6 +565,9 @@ class DiscordWebSocket:
 
         await self.send_as_json(payload)
         _log.debug('Gateway has sent the RESUME payload.')
+        self._resume_started = time.perf_counter()
+        self._replayed = 0
+        self._stats.resumes += 1
 
     async def received_message(self, msg: Any, /) -> None:
         if type(msg) is bytes:
@@ -516,6 +589,11 @@ class DiscordWebSocket:
         data = msg.get('d')
         seq = msg.get('s')
         if seq is not None:
+            if self.sequence is not None and seq > self.sequence + 1 and event != 'READY':
+                missed = seq - self.sequence - 1
+                self._stats.sequence_gaps += 1
+                self._stats.missed_events += missed
+                _log.warning('Gateway sequence jumped from %s to %s, %s events were missed.', self.sequence, seq, missed)
             self.sequence = seq
 
         if self._keep_alive:
@@ -551,6 +629,10 @@ class DiscordWebSocket:
                 return
 
             if op == self.INVALIDATE_SESSION:
+                if self._resume_started is not None:
+                    self._stats.failed_resumes += 1
+                    self._resume_started = None
+
                 if data is True:
                     await self.close()
                     raise ReconnectWebSocket
@@ -577,7 +659,22 @@ class DiscordWebSocket:
 
         elif event == 'RESUMED':
             self._resume_trace = data.get('_trace', [])
-            _log.info('Gateway has successfully RESUMED session %s.', self.session_id)
+            stats = self._stats
+            if self._resume_started is not None:
+                stats.last_resume_duration = time.perf_counter() - self._resume_started
+                self._resume_started = None
+            stats.last_replayed_events = self._replayed
+            stats.replayed_events += self._replayed
+            _log.info(
+                'Gateway has successfully RESUMED session %s in %.2fs, replaying %d events.',
+                self.session_id,
+                stats.last_resume_duration or 0.0,
+                self._replayed,
+            )
+
+        elif self._resume_started is not None:
+            # Every event between RESUME and RESUMED is a replay of a missed event
+            self._replayed += 1
 
         try:
             func = self._discord_parsers[event]
@@ -585,7 +682,10 @@ class DiscordWebSocket:
             _log.debug('Unknown event %s.', event)
         else:
             try:
-                func(data)
+                ret = func(data)
+                if asyncio.iscoroutine(ret):
+                    # Parsers for large payloads (READY) yield to the event loop as they go
+                    await ret
             except Exception as exc:
                 _log.warning(
                     'Parsing event %s encountered an exception. Please open an issue with this traceback:',
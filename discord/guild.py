@@ -38,6 +38,7 @@ from typing import (
     Iterable,
     List,
     Mapping,
+    MutableMapping,
     NamedTuple,
     Sequence,
     Set,
@@ -51,8 +52,9 @@ from typing import (
 import warnings
 
 from . import utils, abc
+from .cache import NameIndex
 from .role import Role
-from .member import Member, VoiceState
+from .member import CompactMemberStore, Member, VoiceState
 from .emoji import Emoji
 from .errors import ClientException, InvalidData
 from .permissions import Permissions, PermissionOverwrite
@@ -268,7 +270,7 @@ class UserGuild(Hashable):
     @property
     def permissions(self) -> Permissions:
         """:class:`Permissions`: Returns the calculated permissions the current user has in the guild."""
-        return Permissions(self._permissions)
+        return Permissions._from_value(self._permissions)
 
     def is_joined(self) -> bool:
         """Returns whether you are a member of this guild.
@@ -524,6 +526,9 @@ class Guild(Hashable):
         '_joined_at',
         '_cs_joined',
         '_incidents_data',
+        '_member_names',
+        '_channel_names',
+        '_role_names',
     )
 
     _PREMIUM_GUILD_LIMITS: ClassVar[Dict[int, _GuildLimit]] = {
@@ -537,7 +542,7 @@ class Guild(Hashable):
         self._cs_joined: Optional[bool] = None
         self._roles: Dict[int, Role] = {}
         self._channels: Dict[int, GuildChannel] = {}
-        self._members: Dict[int, Member] = {}
+        self._members: MutableMapping[int, Member] = {}
         self._member_list: List[Optional[Member]] = []
         self._voice_states: Dict[int, VoiceState] = {}
         self._threads: Dict[int, Thread] = {}
@@ -547,22 +552,31 @@ class Guild(Hashable):
         self._member_count: Optional[int] = None
         self._presence_count: Optional[int] = None
         self._large: Optional[bool] = None
+        # Name lookup indexes, built on first use
+        self._member_names: Optional[NameIndex] = None
+        self._channel_names: Optional[NameIndex] = None
+        self._role_names: Optional[NameIndex] = None
         self._from_data(data)
 
     def _add_channel(self, channel: GuildChannel, /) -> None:
         self._channels[channel.id] = channel
+        self._channel_names = None
 
     def _remove_channel(self, channel: Snowflake, /) -> None:
         self._channels.pop(channel.id, None)
+        self._channel_names = None
 
     def _voice_state_for(self, user_id: int, /) -> Optional[VoiceState]:
         return self._voice_states.get(user_id)
 
     def _add_member(self, member: Member, /) -> None:
-        self._members[member.id] = member
+        # The presence is moved to the state first so a compact member store doesn't keep it too
         if member._presence:
             self._state.store_presence(member.id, member._presence, self.id)
             member._presence = None
+        self._members[member.id] = member
+        if self._member_names is not None:
+            self._member_names.add(member)
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
         thread = Thread(guild=self, state=self._state, data=payload)
@@ -571,6 +585,8 @@ class Guild(Hashable):
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
+        if self._member_names is not None:
+            self._member_names.discard(member.id)
         self._state.remove_presence(member.id, self.id)
 
     def _add_thread(self, thread: Thread, /) -> None:
@@ -637,10 +653,87 @@ class Guild(Hashable):
 
     def _add_role(self, role: Role, /) -> None:
         self._roles[role.id] = role
+        self._role_names = None
 
     def _remove_role(self, role_id: int, /) -> Role:
         # This raises KeyError if it fails..
-        return self._roles.pop(role_id)
+        role = self._roles.pop(role_id)
+        self._role_names = None
+        return role
+
+    def _update_member_names(self, member: Member, /) -> None:
+        # Called when a cached member's nick, name or global name changes
+        index = self._member_names
+        if index is not None and member.id in index:
+            index.add(member)
+
+    def _get_member_name_index(self) -> NameIndex:
+        index = self._member_names
+        if index is None:
+            index = self._member_names = NameIndex('nick', 'global_name', 'name', objects=self._members.values())
+        return index
+
+    def _get_channels_named(self, name: str, /) -> List[GuildChannel]:
+        index = self._channel_names
+        if index is None:
+            index = self._channel_names = NameIndex('name', objects=self._channels.values())
+
+        channels = self._channels
+        result = []
+        for channel_id in index.get('name', name):
+            channel = channels.get(channel_id)
+            if channel is not None and channel.name == name:
+                result.append(channel)
+        return result
+
+    def _get_role_named(self, name: str, /) -> Optional[Role]:
+        index = self._role_names
+        if index is None:
+            index = self._role_names = NameIndex('name', objects=self._roles.values())
+
+        for role_id in index.get('name', name):
+            role = self._roles.get(role_id)
+            if role is not None and role.name == name:
+                return role
+        return None
+
+    def _reconcile(self, guild: GuildPayload) -> None:
+        # Updates the guild from a fresh payload while keeping the identity of
+        # the roles and channels that still exist, as other objects reference them
+        state = self._state
+
+        old_roles, self._roles = self._roles, {}
+        self._role_names = None
+        for r in guild.get('roles', []):
+            role = old_roles.get(int(r['id']))
+            if role is not None:
+                role._update(r)
+            else:
+                role = Role(guild=self, data=r, state=state)
+            self._add_role(role)
+
+        old_channels, self._channels = self._channels, {}
+        self._channel_names = None
+        for c in guild.get('channels', []):
+            factory, _ = _guild_channel_factory(c['type'])
+            if not factory:
+                continue
+
+            channel = old_channels.get(int(c['id']))
+            if type(channel) is factory:
+                channel._update(self, c)  # type: ignore # The payload varies based on the channel type
+            else:
+                channel = factory(guild=self, data=c, state=state)  # type: ignore
+            self._add_channel(channel)  # type: ignore
+
+        self._threads = {}
+        self._stage_instances = {}
+        self._scheduled_events = {}
+        self._voice_states = {}
+
+        # Cached members are kept and updated with the ones present in the payload
+        data: Any = {k: v for k, v in guild.items() if k not in ('roles', 'channels')}
+        self._from_data(data)
 
     @classmethod
     def _create_unavailable(cls, *, state: ConnectionState, guild_id: int) -> Guild:
@@ -671,7 +764,7 @@ class Guild(Hashable):
 
         for r in guild.get('roles', []):
             role = Role(guild=self, data=r, state=state)
-            self._roles[role.id] = role
+            self._add_role(role)
 
         for c in guild.get('channels', []):
             factory, _ = _guild_channel_factory(c['type'])
@@ -733,6 +826,14 @@ class Guild(Hashable):
         for vs in guild.get('voice_states', []):
             self._update_voice_state(vs, int(vs['channel_id']))
 
+        threshold = state.compact_member_threshold
+        if (
+            threshold is not None
+            and (self._member_count or 0) >= threshold
+            and not isinstance(self._members, CompactMemberStore)
+        ):
+            self._members = CompactMemberStore(self, self._members)  # type: ignore
+
         cache_flags = state.member_cache_flags
         for mdata in guild.get('members', []):
             member = Member(data=mdata, guild=self, state=state)
@@ -1421,8 +1522,6 @@ class Guild(Hashable):
             then ``None`` is returned.
         """
 
-        members = self.members
-
         username, _, discriminator = name.rpartition('#')
 
         # If # isn't found then "discriminator" actually has the username
@@ -1430,12 +1529,21 @@ class Guild(Hashable):
             discriminator, username = username, discriminator
 
         if discriminator == '0' or (len(discriminator) == 4 and discriminator.isdigit()):
-            return utils.find(lambda m: m.name == username and m.discriminator == discriminator, members)
-
-        def pred(m: Member) -> bool:
-            return m.nick == name or m.global_name == name or m.name == name
-
-        return utils.find(pred, members)
+            attrs: Tuple[str, ...] = ('name',)
+            pred = lambda m: m.name == username and m.discriminator == discriminator
+        else:
+            attrs = ('nick', 'global_name', 'name')
+            pred = lambda m: m.nick == name or m.global_name == name or m.name == name
+
+        # The index is kept up to date by the member and user update hooks, so only
+        # its candidates need to be checked, in the order the members were cached
+        members = self._members
+        lookup = username if len(attrs) == 1 else name
+        for member_id in self._get_member_name_index().find(attrs, lookup):
+            member = members.get(member_id)
+            if member is not None and pred(member):
+                return member
+        return None
 
     @overload
     def _create_channel(
@@ -1708,7 +1816,7 @@ class Guild(Hashable):
         channel = TextChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_voice_channel(
@@ -1809,7 +1917,7 @@ class Guild(Hashable):
         channel = VoiceChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_stage_channel(
@@ -1922,7 +2030,7 @@ class Guild(Hashable):
         channel = StageChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_category(
@@ -1970,7 +2078,7 @@ class Guild(Hashable):
         channel = CategoryChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     create_category_channel = create_category
@@ -2047,7 +2155,7 @@ class Guild(Hashable):
         channel = DirectoryChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     create_directory_channel = create_directory
@@ -2201,7 +2309,7 @@ class Guild(Hashable):
         )
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     create_forum_channel = create_forum
@@ -4338,7 +4446,7 @@ class Guild(Hashable):
         for d in data:
             role = Role(guild=self, data=d, state=self._state)
             roles.append(role)
-            self._roles[role.id] = role
+            self._add_role(role)
 
         return roles
 
@@ -25,12 +25,16 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import copy
 import datetime
+import heapq
 import io
 import logging
+import os
 import re
 import ssl
 import string
+import time
 from collections import deque
 from http import HTTPStatus
 from random import choice, choices
@@ -48,6 +52,7 @@ from typing import (
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -56,7 +61,7 @@ from typing import (
 from urllib.parse import quote as _uriquote
 
 import aiohttp
-from curl_cffi import requests, CurlMime
+from curl_cffi import requests, CurlHttpVersion, CurlInfo, CurlMime, CurlOpt
 
 from . import utils
 from .enums import InviteType, NetworkConnectionType, RelationshipAction
@@ -158,6 +163,8 @@ CIPHERS = (
 )
 
 _CLOUDFLARE_REGEX = re.compile(r'<span>(\d{3,4})</span>')
+# CURLINFO_HTTP_VERSION -> Human readable version
+_HTTP_VERSIONS = {1: '1.0', 2: '1.1', 3: '2', 30: '3'}
 _log = logging.getLogger(__name__)
 
 
@@ -433,6 +440,9 @@ class Ratelimit:
     everything into a single lock queue per route.
     """
 
+    # The number of seconds without requests after which a rate limit may be evicted
+    INACTIVITY_TIMEOUT: ClassVar[float] = 300.0
+
     __slots__ = (
         'limit',
         'remaining',
@@ -533,7 +543,43 @@ class Ratelimit:
 
     def is_inactive(self) -> bool:
         delta = self._loop.time() - self._last_request
-        return delta >= 300 and self.outgoing == 0 and len(self._pending_requests) == 0
+        return delta >= self.INACTIVITY_TIMEOUT and self.outgoing == 0 and len(self._pending_requests) == 0
+
+    def inactive_at(self) -> float:
+        """Returns the loop time at which this rate limit becomes eligible for eviction, if left unused."""
+        return self._last_request + self.INACTIVITY_TIMEOUT
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the state of this rate limit in a form that can outlive the event loop.
+
+        Loop times are converted to wall clock timestamps so that they remain meaningful
+        across process restarts.
+        """
+        now = self._loop.time()
+        wall = time.time()
+        return {
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'reset': wall + (self.expires - now) if self.expires is not None else None,
+            'last_request': wall - (now - self._last_request),
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """Restores a state previously returned by :meth:`snapshot`."""
+        now = self._loop.time()
+        wall = time.time()
+        self.limit = data['limit']
+        self._last_request = now - max(wall - data['last_request'], 0.0)
+
+        reset = data.get('reset')
+        if reset is not None and reset > wall:
+            # The window is still ongoing, so the remaining tokens are still accurate
+            self.remaining = min(data['remaining'], self.limit)
+            self.reset_after = reset - wall
+            self.expires = now + self.reset_after
+            self.dirty = True
+        else:
+            self.remaining = self.limit
 
     async def acquire(self) -> None:
         self._last_request = self._loop.time()
@@ -586,6 +632,15 @@ class Ratelimit:
                 self._wake(tokens, exception=exception)
 
 
+class _InflightRequest:
+    # A coalesced GET request and whether its result still hasn't been handed out
+    __slots__ = ('task', 'unclaimed')
+
+    def __init__(self, task: asyncio.Task[Any], unclaimed: bool) -> None:
+        self.task: asyncio.Task[Any] = task
+        self.unclaimed: bool = unclaimed
+
+
 class _FakeResponse:
     def __init__(self, reason: str, status: int) -> None:
         self.reason = reason
@@ -613,6 +668,14 @@ class HTTPClient:
         interface: Optional[str] = None,
         proxy_gateway: bool = True,
         timezone: Optional[str] = None,
+        ratelimit_cache_path: Optional[str] = None,
+        ratelimit_cache_ttl: float = 86400.0,
+        coalesce_requests: bool = False,
+        request_cache_ttl: float = 0.0,
+        max_connections: Optional[int] = None,
+        http2: bool = True,
+        dns_cache_ttl: int = 60,
+        keepalive_timeout: Optional[float] = None,
     ) -> None:
         self.connector: aiohttp.BaseConnector = connector or MISSING
         self.loop: asyncio.AbstractEventLoop = loop
@@ -625,8 +688,15 @@ class HTTPClient:
         # Route key + Major Parameters -> Rate limit
         # When the key is the latter, it is used for temporary
         # one shot requests that don't have a bucket hash
-        # When this reaches 256 elements, it will try to evict based off of expiry
+        # Inactive rate limits are evicted using _bucket_deadlines
         self._buckets: Dict[str, Ratelimit] = {}
+        # Min-heap of (Inactivity deadline, Key) used for lazy eviction of self._buckets
+        # Entries may be stale, in which case they are rescheduled or dropped when popped
+        self._bucket_deadlines: List[Tuple[float, str]] = []
+        # Coalescing key -> In-flight GET request
+        self._inflight_requests: Dict[Tuple[Any, ...], _InflightRequest] = {}
+        # Coalescing key -> (Expiry, Response data)
+        self._response_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
         self._global_over: asyncio.Event = MISSING
         self.user_id: Optional[int] = None
         self.token: Optional[str] = None
@@ -644,6 +714,16 @@ class HTTPClient:
         self.interface: Optional[str] = interface
         self.proxy_gateway: bool = proxy_gateway
         self.timezone: Optional[str] = timezone
+        self.ratelimit_cache_path: Optional[str] = ratelimit_cache_path
+        self.ratelimit_cache_ttl: float = ratelimit_cache_ttl
+        self.coalesce_requests: bool = coalesce_requests
+        self.request_cache_ttl: float = request_cache_ttl
+        self.max_connections: Optional[int] = max_connections
+        self.http2: bool = http2
+        self.dns_cache_ttl: int = dns_cache_ttl
+        self.keepalive_timeout: Optional[float] = keepalive_timeout
+        self._connection_stats: Dict[str, int] = {'requests': 0, 'new_connections': 0, 'reused_connections': 0}
+        self._http_versions: Dict[str, int] = {}
 
         self.tracer = None
         if debug_options and 'trace' in debug_options:
@@ -674,7 +754,15 @@ class HTTPClient:
         self._global_over.set()
 
         if self.connector is MISSING or self.connector.closed:
-            self.connector = aiohttp.TCPConnector(limit=0)
+            connector_options: Dict[str, Any] = {}
+            if self.keepalive_timeout is not None:
+                connector_options['keepalive_timeout'] = self.keepalive_timeout
+            self.connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.max_connections or 0,
+                ttl_dns_cache=self.dns_cache_ttl,
+                **connector_options,
+            )
         self.__asession = session = await _gen_session(aiohttp.ClientSession(connector=self.connector))
         self.headers = headers = await utils.Headers.default(session, self.proxy, self.proxy_auth)
         _log.info(
@@ -690,9 +778,31 @@ class HTTPClient:
             impersonate = 'chrome'
 
         _log.info('Found TLS fingerprint target "%s".', impersonate)
-        self.__session = requests.AsyncSession(impersonate=impersonate, default_headers=False)
+        curl_options: Dict[CurlOpt, Any] = {
+            CurlOpt.DNS_CACHE_TIMEOUT: self.dns_cache_ttl,
+        }
+        if self.keepalive_timeout is not None:
+            # Idle connections older than this are not reused, curl's own default is much longer
+            curl_options[CurlOpt.MAXAGE_CONN] = int(self.keepalive_timeout)
+        if self.max_connections:
+            curl_options[CurlOpt.MAXCONNECTS] = self.max_connections
+        if self.http2:
+            # Prefer multiplexing over an existing HTTP/2 connection to opening a new one
+            curl_options[CurlOpt.PIPEWAIT] = 1
+
+        self.__session = requests.AsyncSession(
+            impersonate=impersonate,
+            default_headers=False,
+            max_clients=self.max_connections or 10,
+            curl_options=curl_options,
+            curl_infos=[CurlInfo.NUM_CONNECTS],
+            http_version=None if self.http2 else CurlHttpVersion.V1_1,
+        )
         self._started = True
 
+        if self.ratelimit_cache_path:
+            await self.load_ratelimits(self.ratelimit_cache_path)
+
     async def ws_connect(self, url: str, **kwargs) -> requests.AsyncWebSocket:
         await self.startup()
 
@@ -725,21 +835,176 @@ class HTTPClient:
         return self.headers.user_agent
 
     def _try_clear_expired_ratelimits(self) -> None:
-        if len(self._buckets) < 256:
-            return
+        # Only deadlines that have passed are looked at, so this is amortized O(log n) per bucket
+        deadlines = self._bucket_deadlines
+        now = self.loop.time()
+        while deadlines and deadlines[0][0] <= now:
+            _, key = heapq.heappop(deadlines)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+
+            if bucket.is_inactive():
+                del self._buckets[key]
+            else:
+                # Still in use, check back once it may have gone quiet
+                heapq.heappush(deadlines, (max(bucket.inactive_at(), now + 1.0), key))
 
-        keys = [key for key, bucket in self._buckets.items() if bucket.is_inactive()]
-        for key in keys:
-            del self._buckets[key]
+    def _set_ratelimit(self, key: str, ratelimit: Ratelimit) -> None:
+        self._buckets[key] = ratelimit
+        heapq.heappush(self._bucket_deadlines, (ratelimit.inactive_at(), key))
 
     def get_ratelimit(self, key: str) -> Ratelimit:
         try:
             value = self._buckets[key]
         except KeyError:
-            self._buckets[key] = value = Ratelimit(self.max_ratelimit_timeout, self.default_ratelimit_limit)
+            value = Ratelimit(self.max_ratelimit_timeout, self.default_ratelimit_limit)
+            self._set_ratelimit(key, value)
             self._try_clear_expired_ratelimits()
         return value
 
+    def ratelimit_stats(self) -> Dict[str, int]:
+        """Returns counts describing the current rate limit bookkeeping.
+
+        This is useful for exporting to metrics.
+        """
+        exhausted = pending = 0
+        for bucket in self._buckets.values():
+            if bucket.remaining <= 0:
+                exhausted += 1
+            pending += len(bucket._pending_requests)
+
+        return {
+            'buckets': len(self._buckets),
+            'bucket_hashes': len(self._bucket_hashes),
+            'scheduled_evictions': len(self._bucket_deadlines),
+            'exhausted_buckets': exhausted,
+            'pending_requests': pending,
+        }
+
+    def _dump_ratelimits(self) -> Dict[str, Any]:
+        buckets = {key: bucket.snapshot() for key, bucket in self._buckets.items()}
+
+        # A route hash is as fresh as the most recently used bucket that shares it
+        last_seen: Dict[str, float] = {}
+        for key, bucket in buckets.items():
+            bucket_hash = key.partition(':')[0]
+            last_seen[bucket_hash] = max(last_seen.get(bucket_hash, 0.0), bucket['last_request'])
+
+        now = time.time()
+        hashes = {
+            route_key: {'hash': bucket_hash, 'last_seen': last_seen.get(bucket_hash, now)}
+            for route_key, bucket_hash in self._bucket_hashes.items()
+        }
+        return {'version': 1, 'bucket_hashes': hashes, 'buckets': buckets}
+
+    def _load_ratelimits(self, data: Dict[str, Any]) -> None:
+        if data.get('version') != 1:
+            return
+
+        cutoff = time.time() - self.ratelimit_cache_ttl
+        for route_key, entry in data.get('bucket_hashes', {}).items():
+            # Hashes learned in this session always take priority
+            if entry['last_seen'] >= cutoff and route_key not in self._bucket_hashes:
+                self._bucket_hashes[route_key] = entry['hash']
+
+        for key, entry in data.get('buckets', {}).items():
+            if entry['last_request'] >= cutoff and key not in self._buckets:
+                ratelimit = Ratelimit(self.max_ratelimit_timeout, self.default_ratelimit_limit)
+                ratelimit.restore(entry)
+                self._set_ratelimit(key, ratelimit)
+
+    async def load_ratelimits(self, path: str) -> None:
+        """Warm-loads learned bucket hashes and rate limit state from a file written by :meth:`save_ratelimits`.
+
+        Entries older than :attr:`ratelimit_cache_ttl` seconds are discarded. A missing or
+        corrupt file is ignored.
+        """
+
+        def _read() -> Any:
+            with open(path, 'rb') as fp:
+                return utils._from_json(fp.read())
+
+        try:
+            data = await self.loop.run_in_executor(None, _read)
+            self._load_ratelimits(data)
+        except FileNotFoundError:
+            return
+        except Exception:
+            _log.warning('Failed to load rate limit cache from %s.', path, exc_info=True)
+        else:
+            _log.debug(
+                'Loaded %d bucket hashes and %d rate limits from %s.', len(self._bucket_hashes), len(self._buckets), path
+            )
+
+    def _merge_ratelimits(self, existing: Any, current: Dict[str, Any]) -> Dict[str, Any]:
+        # Entries saved by other processes are kept unless this process has a fresher one
+        if not isinstance(existing, dict) or existing.get('version') != 1:
+            return current
+
+        cutoff = time.time() - self.ratelimit_cache_ttl
+        for section, field in (('bucket_hashes', 'last_seen'), ('buckets', 'last_request')):
+            merged = {key: entry for key, entry in existing.get(section, {}).items() if entry[field] >= cutoff}
+            for key, entry in current[section].items():
+                other = merged.get(key)
+                if other is None or other[field] <= entry[field]:
+                    merged[key] = entry
+            current[section] = merged
+        return current
+
+    async def save_ratelimits(self, path: str) -> None:
+        """Snapshots learned bucket hashes and rate limit state to a file.
+
+        Entries already in the file are merged with the ones of this client, keeping the most
+        recently used of each, and the file is replaced atomically. This lets many processes
+        share the same path, although entries saved by another process in between reading and
+        replacing the file are lost.
+        """
+        current = self._dump_ratelimits()
+
+        def _write() -> None:
+            try:
+                with open(path, 'rb') as fp:
+                    existing = utils._from_json(fp.read())
+            except FileNotFoundError:
+                existing = None
+            except ValueError:
+                _log.debug('Overwriting corrupt rate limit cache at %s.', path)
+                existing = None
+
+            data = utils._to_json(self._merge_ratelimits(existing, current))
+            tmp = f'{path}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as fp:
+                fp.write(data)
+            os.replace(tmp, path)
+
+        try:
+            await self.loop.run_in_executor(None, _write)
+        except Exception:
+            _log.warning('Failed to save rate limit cache to %s.', path, exc_info=True)
+
+    def _record_connection(self, response: requests.Response) -> None:
+        stats = self._connection_stats
+        stats['requests'] += 1
+        new_connections = response.infos.get(CurlInfo.NUM_CONNECTS) or 0
+        if new_connections:
+            stats['new_connections'] += new_connections
+        else:
+            stats['reused_connections'] += 1
+
+        version = _HTTP_VERSIONS.get(response.http_version, 'unknown')
+        self._http_versions[version] = self._http_versions.get(version, 0) + 1
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Returns connection reuse statistics for REST requests.
+
+        ``new_connections`` counts connections that had to be established (and paid a TLS handshake),
+        while ``reused_connections`` counts requests that were sent over an existing connection.
+        """
+        stats: Dict[str, Any] = dict(self._connection_stats)
+        stats['http_versions'] = dict(self._http_versions)
+        return stats
+
     def _parse_form_data(self, form: List[Dict[str, Any]]) -> asyncio.Future[CurlMime]:
         def _inner_parse():
             mime = CurlMime()
@@ -755,6 +1020,67 @@ class HTTPClient:
 
         return self.loop.run_in_executor(None, _inner_parse)
 
+    @staticmethod
+    def _coalesce_key(route: Route, kwargs: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        # Only plain GETs are idempotent enough to share, anything
+        # that customises the request in other ways is sent as-is
+        if route.method != 'GET' or not kwargs.keys() <= {'params', 'auth'}:
+            return None
+
+        params = kwargs.get('params')
+        if params:
+            params = tuple(sorted((k, str(v)) for k, v in params.items()))
+        return (route.url, params, kwargs.get('auth', True))
+
+    def _prune_response_cache(self) -> None:
+        if len(self._response_cache) < 256:
+            return
+
+        now = self.loop.time()
+        keys = [key for key, (expires, _) in self._response_cache.items() if expires <= now]
+        for key in keys:
+            del self._response_cache[key]
+
+    async def _coalesced_request(self, key: Tuple[Any, ...], route: Route, kwargs: Dict[str, Any]) -> Any:
+        try:
+            expires, data = self._response_cache[key]
+        except KeyError:
+            pass
+        else:
+            if expires > self.loop.time():
+                _log.debug('%s %s was served from the response cache.', route.method, route.url)
+                return copy.deepcopy(data)
+            del self._response_cache[key]
+
+        try:
+            inflight = self._inflight_requests[key]
+        except KeyError:
+            task = self.loop.create_task(self._request(route, **kwargs))
+            # Ensure exceptions are retrieved even if every waiter was cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            # A cached result is shared with later callers, so it's never handed out as is
+            inflight = self._inflight_requests[key] = _InflightRequest(task, self.request_cache_ttl <= 0)
+
+            def _done(task: asyncio.Task[Any]) -> None:
+                current = self._inflight_requests.get(key)
+                if current is not None and current.task is task:
+                    del self._inflight_requests[key]
+                if self.request_cache_ttl > 0 and not task.cancelled() and task.exception() is None:
+                    self._prune_response_cache()
+                    self._response_cache[key] = (self.loop.time() + self.request_cache_ttl, task.result())
+
+            task.add_done_callback(_done)
+        else:
+            _log.debug('%s %s is already in flight, waiting on the existing request.', route.method, route.url)
+
+        # Shielded so that a cancelled caller does not cancel the request for everyone else
+        data = await asyncio.shield(inflight.task)
+        if inflight.unclaimed:
+            inflight.unclaimed = False
+            return data
+        # Payloads are shared between callers, so the others get copies to prevent cross-contamination
+        return copy.deepcopy(data)
+
     async def request(
         self,
         route: Route,
@@ -762,6 +1088,21 @@ class HTTPClient:
         files: Optional[Sequence[File]] = None,
         form: Optional[List[Dict[str, Any]]] = None,
         **kwargs: Any,
+    ) -> Any:
+        if self.coalesce_requests and not files and not form:
+            key = self._coalesce_key(route, kwargs)
+            if key is not None:
+                return await self._coalesced_request(key, route, kwargs)
+
+        return await self._request(route, files=files, form=form, **kwargs)
+
+    async def _request(
+        self,
+        route: Route,
+        *,
+        files: Optional[Sequence[File]] = None,
+        form: Optional[List[Dict[str, Any]]] = None,
+        **kwargs: Any,
     ) -> Any:
         method = route.method
         url = route.url
@@ -878,6 +1219,7 @@ class HTTPClient:
                 try:
                     response = await self.__session.request(method, url, **kwargs, stream=True, interface=interface)
                     response.status = response.status_code  # type: ignore
+                    self._record_connection(response)
                     try:
                         response.reason = HTTPStatus(response.status_code).phrase
                     except Exception:
@@ -916,13 +1258,13 @@ class HTTPClient:
                                 _log.debug(fmt, route_key, bucket_hash, discord_hash)
 
                                 self._bucket_hashes[route_key] = discord_hash
-                                self._buckets[f'{discord_hash}:{route.major_parameters}'] = ratelimit
+                                self._set_ratelimit(f'{discord_hash}:{route.major_parameters}', ratelimit)
                                 self._buckets.pop(key, None)
                             elif route_key not in self._bucket_hashes:
                                 fmt = '%s has found its initial rate limit bucket hash (%s).'
                                 _log.debug(fmt, route_key, discord_hash)
                                 self._bucket_hashes[route_key] = discord_hash
-                                self._buckets[f'{discord_hash}:{route.major_parameters}'] = ratelimit
+                                self._set_ratelimit(f'{discord_hash}:{route.major_parameters}', ratelimit)
 
                     if has_ratelimit_headers:
                         if response.status_code != 429:
@@ -1171,6 +1513,8 @@ class HTTPClient:
     # State management
 
     async def close(self) -> None:
+        if self.ratelimit_cache_path and self._started:
+            await self.save_ratelimits(self.ratelimit_cache_path)
         if self.__asession:
             await self.__asession.close()
         if self.__session:
@@ -24,11 +24,28 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import array
 import datetime
 import inspect
 import itertools
+import sys
+import weakref
 from operator import attrgetter
-from typing import Any, Awaitable, Callable, Collection, Dict, List, Optional, TYPE_CHECKING, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import discord.abc
 
@@ -360,7 +377,10 @@ class Member(discord.abc.Messageable, discord.abc.Connectable, _UserTag):
         self.joined_at = utils.parse_time(data.get('joined_at'))
         self.premium_since = utils.parse_time(data.get('premium_since'))
         self._roles = utils.SnowflakeList(map(int, data['roles']))
+        nick = self.nick
         self.nick = data.get('nick', None)
+        if self.nick != nick:
+            self.guild._update_member_names(self)
         self.pending = data.get('pending', False)
         self._avatar = data.get('avatar')
         self._avatar_decoration_data = data.get('avatar_decoration_data')
@@ -424,6 +444,9 @@ class Member(discord.abc.Messageable, discord.abc.Connectable, _UserTag):
         self._banner = data.get('banner')
         self._flags = data.get('flags', 0)
 
+        if self.nick != old.nick:
+            self.guild._update_member_names(self)
+
         attrs = {'joined_at', 'premium_since', '_roles', '_avatar', '_banner', 'timed_out_until', 'nick', 'pending'}
 
         if any(getattr(self, attr) != getattr(old, attr) for attr in attrs):
@@ -1276,3 +1299,281 @@ class Member(discord.abc.Messageable, discord.abc.Connectable, _UserTag):
             with_mutual_friends_count=with_mutual_friends_count,
             with_mutual_friends=with_mutual_friends,
         )
+
+
+_NO_TIME: int = -(2**63)
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _pack_time(dt: Optional[datetime.datetime]) -> int:
+    return _NO_TIME if dt is None else (dt - _EPOCH) // _MICROSECOND
+
+
+def _unpack_time(value: int) -> Optional[datetime.datetime]:
+    return None if value == _NO_TIME else _EPOCH + datetime.timedelta(microseconds=value)
+
+
+# The member attributes kept by a CompactMemberStore and the columns they are kept in
+_MEMBER_COLUMNS: Dict[str, str] = {
+    '_user': '_users',
+    '_roles': '_roles',
+    'joined_at': '_joined_at',
+    'premium_since': '_premium_since',
+    'timed_out_until': '_timed_out_until',
+    '_flags': '_flags',
+    'pending': '_pending',
+    'nick': '_nicks',
+    '_avatar': '_avatars',
+    '_banner': '_banners',
+    '_avatar_decoration_data': '_decorations',
+    '_presence': '_presences',
+}
+
+
+class _MemberView(Member):
+    """A :class:`Member` materialized from a :class:`CompactMemberStore`.
+
+    Every assignment to a stored attribute is written back to the store.
+    """
+
+    __slots__ = ('_store', '__weakref__')
+
+    if TYPE_CHECKING:
+        _store: CompactMemberStore
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _MEMBER_COLUMNS:
+            # _store is assigned last when materializing, so nothing is written back before that
+            store = getattr(self, '_store', None)
+            if store is not None:
+                store._write_attr(self, name, value)
+
+
+class CompactMemberStore(MutableMapping[int, Member]):
+    """A columnar mapping of user IDs to members, used as the member cache of large guilds.
+
+    Instead of keeping a :class:`Member` around for every member, member data is kept
+    in parallel arrays, with role lists and strings deduplicated across members.
+    :class:`Member` objects are materialized on access and reused while referenced.
+
+    Removal swaps the last row into the freed one, so the arrays stay dense.
+    """
+
+    __slots__ = (
+        'guild',
+        '_index',
+        '_ids',
+        '_users',
+        '_roles',
+        '_role_sets',
+        '_role_set_index',
+        '_joined_at',
+        '_premium_since',
+        '_timed_out_until',
+        '_flags',
+        '_pending',
+        '_nicks',
+        '_avatars',
+        '_banners',
+        '_decorations',
+        '_presences',
+        '_views',
+    )
+
+    def __init__(self, guild: Guild, members: Optional[Dict[int, Member]] = None) -> None:
+        self.guild: Guild = guild
+        self._index: Dict[int, int] = {}
+        self._ids: array.array[int] = array.array('Q')
+        # Users are shared between guilds, so this is just a reference per member
+        self._users: List[User] = []
+        self._roles: array.array[int] = array.array('I')
+        self._role_sets: List[Tuple[int, ...]] = []
+        self._role_set_index: Dict[Tuple[int, ...], int] = {}
+        self._joined_at: array.array[int] = array.array('q')
+        self._premium_since: array.array[int] = array.array('q')
+        self._timed_out_until: array.array[int] = array.array('q')
+        self._flags: array.array[int] = array.array('Q')
+        self._pending: bytearray = bytearray()
+        self._nicks: List[Optional[str]] = []
+        self._avatars: List[Optional[str]] = []
+        self._banners: List[Optional[str]] = []
+        self._decorations: List[Optional[AvatarDecorationData]] = []
+        # Presences are interned by the state, so this is just a reference per member
+        self._presences: List[Optional[Presence]] = []
+        self._views: weakref.WeakValueDictionary[int, _MemberView] = weakref.WeakValueDictionary()
+
+        if members:
+            for member in members.values():
+                self[member.id] = member
+
+    def __repr__(self) -> str:
+        return f'<CompactMemberStore guild_id={self.guild.id} members={len(self._index)}>'
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __sizeof__(self) -> int:
+        # Users are shared with the state and so are not counted here
+        columns = (
+            self._index,
+            self._ids,
+            self._users,
+            self._roles,
+            self._role_sets,
+            self._role_set_index,
+            self._joined_at,
+            self._premium_since,
+            self._timed_out_until,
+            self._flags,
+            self._pending,
+            self._nicks,
+            self._avatars,
+            self._banners,
+            self._decorations,
+            self._presences,
+        )
+        size = object.__sizeof__(self) + sum(sys.getsizeof(column) for column in columns)
+        size += sum(sys.getsizeof(role_set) for role_set in self._role_sets)
+        for strings in (self._nicks, self._avatars, self._banners):
+            size += sum(sys.getsizeof(string) for string in strings if string is not None)
+        return size
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._index)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._index
+
+    def __getitem__(self, user_id: int) -> Member:
+        view = self._views.get(user_id)
+        if view is None:
+            view = self._materialize(self._index[user_id])
+            self._views[user_id] = view
+        return view
+
+    def __setitem__(self, user_id: int, member: Member) -> None:
+        try:
+            row = self._index[user_id]
+        except KeyError:
+            row = self._index[user_id] = len(self._ids)
+            self._ids.append(user_id)
+            self._users.append(member._user)
+            self._roles.append(0)
+            self._joined_at.append(_NO_TIME)
+            self._premium_since.append(_NO_TIME)
+            self._timed_out_until.append(_NO_TIME)
+            self._flags.append(0)
+            self._pending.append(0)
+            self._nicks.append(None)
+            self._avatars.append(None)
+            self._banners.append(None)
+            self._decorations.append(None)
+            self._presences.append(None)
+
+        self._write_row(row, member)
+        if isinstance(member, _MemberView) and member._store is self:
+            self._views[user_id] = member
+        else:
+            self._views.pop(user_id, None)
+
+    def __delitem__(self, user_id: int) -> None:
+        row = self._index.pop(user_id)
+        self._views.pop(user_id, None)
+        last = len(self._ids) - 1
+
+        if row != last:
+            # Move the last row into the hole
+            moved = self._ids[last]
+            self._index[moved] = row
+            for column in (
+                self._ids,
+                self._users,
+                self._roles,
+                self._joined_at,
+                self._premium_since,
+                self._timed_out_until,
+                self._flags,
+                self._pending,
+                self._nicks,
+                self._avatars,
+                self._banners,
+                self._decorations,
+                self._presences,
+            ):
+                column[row] = column[last]  # type: ignore
+
+        for column in (
+            self._ids,
+            self._users,
+            self._roles,
+            self._joined_at,
+            self._premium_since,
+            self._timed_out_until,
+            self._flags,
+            self._pending,
+            self._nicks,
+            self._avatars,
+            self._banners,
+            self._decorations,
+            self._presences,
+        ):
+            del column[last]  # type: ignore
+
+    def _role_set(self, roles: Collection[int]) -> int:
+        key = tuple(roles)
+        try:
+            return self._role_set_index[key]
+        except KeyError:
+            index = self._role_set_index[key] = len(self._role_sets)
+            self._role_sets.append(key)
+            return index
+
+    def _write_row(self, row: int, member: Member) -> None:
+        self._users[row] = member._user
+        self._roles[row] = self._role_set(member._roles)
+        self._joined_at[row] = _pack_time(member.joined_at)
+        self._premium_since[row] = _pack_time(member.premium_since)
+        self._timed_out_until[row] = _pack_time(member.timed_out_until)
+        self._flags[row] = member._flags
+        self._pending[row] = member.pending
+        self._nicks[row] = sys.intern(member.nick) if member.nick else member.nick
+        self._avatars[row] = member._avatar
+        self._banners[row] = member._banner
+        self._decorations[row] = member._avatar_decoration_data
+        self._presences[row] = member._presence
+
+    def _write_attr(self, member: _MemberView, name: str, value: Any) -> None:
+        row = self._index.get(member.id)
+        # Views that were replaced or removed no longer own the row
+        if row is None or self._views.get(member.id) is not member:
+            return
+
+        if name == '_roles':
+            value = self._role_set(value)
+        elif name in ('joined_at', 'premium_since', 'timed_out_until'):
+            value = _pack_time(value)
+        elif name == 'nick' and value:
+            value = sys.intern(value)
+        getattr(self, _MEMBER_COLUMNS[name])[row] = value
+
+    def _materialize(self, row: int) -> _MemberView:
+        guild = self.guild
+        member = _MemberView.__new__(_MemberView)
+        member._state = guild._state
+        member.guild = guild
+        member._user = self._users[row]
+        member._roles = utils.SnowflakeList(self._role_sets[self._roles[row]], is_sorted=True)
+        member.joined_at = _unpack_time(self._joined_at[row])
+        member.premium_since = _unpack_time(self._premium_since[row])
+        member.timed_out_until = _unpack_time(self._timed_out_until[row])
+        member._flags = self._flags[row]
+        member.pending = bool(self._pending[row])
+        member.nick = self._nicks[row]
+        member._avatar = self._avatars[row]
+        member._banner = self._banners[row]
+        member._avatar_decoration_data = self._decorations[row]
+        member._presence = self._presences[row]
+        member._store = self
+        return member
@@ -30,6 +30,12 @@ from datetime import datetime
 from .asset import Asset
 from .utils import snowflake_time, _get_as_snowflake
 
+# fmt: off
+__all__ = (
+    'PrimaryGuild',
+)
+# fmt: on
+
 if TYPE_CHECKING:
     from .state import ConnectionState
     from .types.user import PrimaryGuild as PrimaryGuildPayload
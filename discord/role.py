@@ -363,7 +363,7 @@ class Role(Hashable):
     @property
     def permissions(self) -> Permissions:
         """:class:`Permissions`: Returns the role's permissions."""
-        return Permissions(self._permissions)
+        return Permissions._from_value(self._permissions)
 
     @property
     def colour(self) -> Colour:
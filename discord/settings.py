@@ -92,11 +92,11 @@ _log = logging.getLogger(__name__)
 class _ProtoSettings:
     __slots__ = (
         '_state',
-        'settings',
+        '_settings',
+        '_pending',
     )
 
     PROTOBUF_CLS: Type[Message] = MISSING
-    settings: Any
 
     # I honestly wish I didn't have to vomit properties everywhere like this,
     # but unfortunately it's probably the best way to do it
@@ -109,6 +109,28 @@ class _ProtoSettings:
         self._state: ConnectionState = state
         self._update(data)
 
+    @property
+    def settings(self) -> Any:
+        # The protobuf is only decoded once it is first needed, as most settings are never read
+        # Until then, received payloads are kept encoded; concatenating serialized
+        # messages is equivalent to merging them, so updates can simply be queued
+        settings = self._settings
+        if settings is None:
+            settings = self._settings = self.PROTOBUF_CLS.FromString(
+                b''.join(base64.b64decode(data) for data in self._pending)
+            )
+            self._pending = []
+            self._decoded()
+        return settings
+
+    @settings.setter
+    def settings(self, value: Any) -> None:
+        self._settings = value
+        self._pending = []
+
+    def _decoded(self) -> None:
+        pass
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}>'
 
@@ -132,8 +154,12 @@ class _ProtoSettings:
     def _copy(cls, self: Self, /) -> Self:
         new = cls.__new__(cls)
         new._state = self._state
-        new.settings = cls.PROTOBUF_CLS()
-        new.settings.CopyFrom(self.settings)
+        if self._settings is None:
+            new._settings = None
+            new._pending = self._pending.copy()
+        else:
+            new.settings = cls.PROTOBUF_CLS()
+            new.settings.CopyFrom(self._settings)
         return new
 
     @overload
@@ -162,12 +188,18 @@ class _ProtoSettings:
         return base64.b64encode(message.SerializeToString()).decode('ascii')
 
     def from_base64(self, data: str):
-        self.settings = self.PROTOBUF_CLS().FromString(base64.b64decode(data))
+        self._settings = None
+        self._pending = [data]
 
     def merge_from_base64(self, data: str):
-        self.settings.MergeFromString(base64.b64decode(data))
+        if self._settings is None:
+            self._pending.append(data)
+        else:
+            self._settings.MergeFromString(base64.b64decode(data))
 
     def to_base64(self) -> str:
+        if self._settings is None and len(self._pending) == 1:
+            return self._pending[0]
         return base64.b64encode(self.settings.SerializeToString()).decode('ascii')
 
 
@@ -187,8 +219,7 @@ class UserSettings(_ProtoSettings):
     SUPPORTED_CLIENT_VERSION = 17
     SUPPORTED_SERVER_VERSION = 0
 
-    def __init__(self, *args):
-        super().__init__(*args)
+    def _decoded(self) -> None:
         if self.client_version < self.SUPPORTED_CLIENT_VERSION:
             # Migrations are mostly for client state, but we'll throw a debug log anyway
             _log.debug('PreloadedUserSettings client version is outdated, migration needed. Unexpected behaviour may occur.')
@@ -1066,7 +1097,7 @@ class UserSettings(_ProtoSettings):
                     client_theme_settings['background_gradient_preset_id'] = provided[1]
                 if len(provided) > 2 and provided[2] is not MISSING:
                     client_theme_settings['background_gradient_angle'] = float(provided[2])
-                appearance['client_theme_settings'] = client_theme_settings
+            appearance['client_theme_settings'] = client_theme_settings
         if 'disable_mobile_redesign' in kwargs:
             appearance['mobile_redesign_disabled'] = kwargs.pop('disable_mobile_redesign')
         for field in ('developer_mode',):
@@ -1104,8 +1135,10 @@ class UserSettings(_ProtoSettings):
             )
 
         # Now, we do the actual patching
-        existing = self.to_dict()
-        payload = {}
+        # Touched sections are copied from the current settings and only the changed fields
+        # are converted, rather than round-tripping the entire message through a dict
+        current = self.settings
+        message = self.PROTOBUF_CLS()
         for subsetting in (
             'versions',
             'inbox',
@@ -1126,16 +1159,18 @@ class UserSettings(_ProtoSettings):
         ):
             subsetting_dict = locals()[subsetting]
             if subsetting_dict:
-                original = existing.get(subsetting, {})
-                original.update(subsetting_dict)
-                for k, v in dict(original).items():
-                    if v is MISSING:
-                        del original[k]
-                payload[subsetting] = original
+                section = getattr(message, subsetting)
+                section.CopyFrom(getattr(current, subsetting))
+                section.SetInParent()
+                for k, v in subsetting_dict.items():
+                    section.ClearField(k)
+                    if v is not MISSING:
+                        ParseDict({k: v}, section)
 
         state = self._state
         require_version = self.data_version if require_version == True else require_version
-        ret = await state.http.edit_proto_settings(1, self.dict_to_base64(payload), require_version or None)
+        payload = base64.b64encode(message.SerializeToString()).decode('ascii')
+        ret = await state.http.edit_proto_settings(1, payload, require_version or None)
         # TODO: What do we do with out of date settings here?
 
         return self.__class__(state, ret['settings'])
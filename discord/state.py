@@ -28,7 +28,9 @@ import asyncio
 from collections import deque, OrderedDict
 import copy
 import datetime
+import itertools
 import logging
+import sys
 from typing import (
     ClassVar,
     Dict,
@@ -38,7 +40,10 @@ from typing import (
     Union,
     Callable,
     Any,
+    Iterable,
     List,
+    MutableMapping,
+    NamedTuple,
     TypeVar,
     Coroutine,
     Tuple,
@@ -105,6 +110,8 @@ from .tutorial import Tutorial
 from .experiment import UserExperiment, GuildExperiment
 from .metadata import Metadata
 from .directory import DirectoryEntry
+from .gateway import GatewayStats
+from .cache import BoundedCache, CachePolicy, NameIndex
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -905,17 +912,23 @@ class ClientStatus:
         self.desktop = client_status.desktop
         self.mobile = client_status.mobile
         self.web = client_status.web
+        self.embedded = client_status.embedded
         return self
 
 
 class Presence:
-    __slots__ = ('client_status', 'activities')
+    # Presences are interned by content (see ConnectionState.create_presence)
+    # and shared between every guild, so they must never be mutated
+    __slots__ = ('client_status', 'activities', '_key', '__weakref__')
 
     _OFFLINE: ClassVar[Self] = MISSING
 
-    def __init__(self, data: gw.BasePresenceUpdate, state: ConnectionState, /) -> None:
+    def __init__(
+        self, data: gw.BasePresenceUpdate, state: ConnectionState, key: Optional[Tuple[Any, ...]] = None, /
+    ) -> None:
         self.client_status: ClientStatus = ClientStatus(data['status'], data.get('client_status'))
         self.activities: Tuple[ActivityTypes, ...] = tuple(create_activity(d, state) for d in data['activities'])
+        self._key: Optional[Tuple[Any, ...]] = key if key is not None else self._make_key(data)
 
     def __repr__(self) -> str:
         attrs = [
@@ -928,16 +941,25 @@ class Presence:
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Presence):
             return False
+        if self._key is not None and other._key is not None:
+            return self._key == other._key
         return self.client_status == other.client_status and self.activities == other.activities
 
     def __ne__(self, other: Any) -> bool:
-        if not isinstance(other, Presence):
-            return True
-        return self.client_status != other.client_status or self.activities != other.activities
+        return not self.__eq__(other)
 
-    def _update(self, data: gw.BasePresenceUpdate, state: ConnectionState, /) -> None:
-        self.client_status._update(data['status'], data.get('client_status'))
-        self.activities = tuple(create_activity(d, state) for d in data['activities'])
+    @staticmethod
+    def _make_key(data: gw.BasePresenceUpdate, /) -> Tuple[Any, ...]:
+        client_status = data.get('client_status') or {}
+        activities = data['activities']
+        return (
+            data['status'],
+            client_status.get('desktop'),
+            client_status.get('mobile'),
+            client_status.get('web'),
+            client_status.get('embedded'),
+            utils._to_json(activities) if activities else '',
+        )
 
     @classmethod
     def _offline(cls) -> Self:
@@ -945,6 +967,7 @@ class Presence:
             self = cls.__new__(cls)  # bypass __init__
             self.client_status = ClientStatus()
             self.activities = ()
+            self._key = cls._make_key({'status': 'offline', 'activities': []})  # type: ignore
             cls._OFFLINE = self
 
         return cls._OFFLINE
@@ -954,6 +977,7 @@ class Presence:
         self = cls.__new__(cls)  # bypass __init__
         self.client_status = ClientStatus._copy(presence.client_status)
         self.activities = presence.activities
+        self._key = presence._key
         return self
 
 
@@ -962,9 +986,7 @@ class FakeClientPresence(Presence):
 
     def __init__(self, state: ConnectionState, /) -> None:
         self._state = state
-
-    def _update(self, data: gw.PresenceUpdateEvent, state: ConnectionState, /) -> None:
-        return
+        self._key = None
 
     @property
     def client_status(self) -> ClientStatus:
@@ -985,7 +1007,79 @@ async def logging_coroutine(coroutine: Coroutine[Any, Any, T], *, info: str) ->
         _log.exception('Exception occurred during %s.', info)
 
 
+class CacheStats(NamedTuple):
+    """The size of an internal cache, as reported by :meth:`Client.cache_stats`.
+
+    .. versionadded:: 2.1
+
+    Attributes
+    -----------
+    count: :class:`int`
+        The number of objects in the cache.
+    size: :class:`int`
+        The approximate memory usage of the cache in bytes.
+    """
+
+    count: int
+    size: int
+
+
+_attribute_cache: Dict[type, Tuple[str, ...]] = {}
+_sized_types = (str, bytes, int, float, datetime.datetime, list, tuple, dict, set, frozenset)
+
+
+def _attribute_names(cls: type) -> Tuple[str, ...]:
+    try:
+        return _attribute_cache[cls]
+    except KeyError:
+        pass
+
+    names = {}
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot not in ('__dict__', '__weakref__'):
+                names[slot] = None
+
+    _attribute_cache[cls] = ret = tuple(names)
+    return ret
+
+
+def _object_size(obj: Any) -> int:
+    # A shallow estimate: the object itself plus any plain values it holds directly.
+    # Other library objects are referenced, not owned, and are counted by their own cache.
+    size = sys.getsizeof(obj)
+    values = [getattr(obj, name, None) for name in _attribute_names(type(obj))]
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is not None:
+        size += sys.getsizeof(attrs)
+        values.extend(attrs.values())
+
+    for value in values:
+        if isinstance(value, _sized_types):
+            size += sys.getsizeof(value)
+    return size
+
+
+def _measure_cache(cache: Any, values: Iterable[Any], count: int, sample: Optional[int]) -> CacheStats:
+    size = sys.getsizeof(cache)
+    measured = total = 0
+    for value in itertools.islice(values, sample):
+        total += _object_size(value)
+        measured += 1
+
+    if measured:
+        size += total * count // measured
+    return CacheStats(count, size)
+
+
 class ConnectionState:
+    CACHE_POLICY_NAMES: ClassVar[Tuple[str, ...]] = ('presences', 'read_states', 'call_messages', 'interactions')
+    # The number of READY entries (read states, relationships, ...) to parse before yielding to the event loop
+    READY_CHUNK_SIZE: ClassVar[int] = 250
+
     def __init__(
         self,
         *,
@@ -1061,11 +1155,24 @@ class ConnectionState:
         self._chunk_guilds: bool = chunk_guilds if chunk_guilds is not MISSING else (subscribe_guilds and cache_flags.joined)
         self._subscribe_guilds: bool = subscribe_guilds
         self.member_cache_flags: MemberCacheFlags = cache_flags
+        self.compact_member_threshold: Optional[int] = options.get('compact_member_threshold', None)
         self._activities: List[ActivityPayload] = activities
         self._status: Optional[str] = status
         self._afk: bool = options.get('afk', False)
         self._idle_since: int = since
         self.overriden_rtc_regions: Optional[List[str]] = options.get('preferred_rtc_regions', None)
+        self._reconcile_ready: bool = options.get('reconcile_ready', False)
+        self._defer_ready_sections: bool = options.get('defer_ready_sections', False)
+        self._reconciling: bool = False
+        self.gateway_stats: GatewayStats = GatewayStats()
+
+        cache_policies = options.get('cache_policies') or {}
+        for name, policy in cache_policies.items():
+            if name not in self.CACHE_POLICY_NAMES:
+                raise ValueError(f'unknown cache {name!r} in cache_policies')
+            if not isinstance(policy, CachePolicy):
+                raise TypeError(f'cache_policies values must be CachePolicy not {type(policy)!r}')
+        self._cache_policies: Dict[str, CachePolicy] = dict(cache_policies)
 
         if cache_flags._empty:
             self.store_user = self.create_user
@@ -1081,8 +1188,9 @@ class ConnectionState:
     def clear(self, *, full: bool = False) -> None:
         self.user: Optional[ClientUser] = None
         self._users: weakref.WeakValueDictionary[int, User] = weakref.WeakValueDictionary()
+        self._user_names: Optional[NameIndex] = None
         self.settings: Optional[UserSettings] = None
-        self.consents: Optional[TrackingSettings] = None
+        self._consents: Optional[TrackingSettings] = None
         self.connections: Dict[str, Connection] = {}
         self.pending_payments: Dict[int, Payment] = {}
         self.analytics_token: Optional[str] = None
@@ -1097,27 +1205,31 @@ class ConnectionState:
         self._emojis: Dict[int, Emoji] = {}
         self._stickers: Dict[int, GuildSticker] = {}
         self._guilds: Dict[int, Guild] = {}
-        self.tutorial: Tutorial = Tutorial.default(self)
+        self._tutorial: Tutorial = Tutorial.default(self)
 
-        self._read_states: Dict[int, Dict[int, ReadState]] = {}
+        self._read_states: Dict[int, MutableMapping[int, ReadState]] = {}
         self.read_state_version: int = 0
 
         self.guild_settings: Dict[Optional[int], GuildSettings] = {}
         self.guild_settings_version: int = 0
 
         self._calls: Dict[int, Call] = {}
-        self._call_message_cache: Dict[int, Message] = {}
+        self._call_message_cache: MutableMapping[int, Message] = self._create_cache('call_messages')
         self._voice_clients: Dict[int, VoiceProtocol] = {}
         self._voice_states: Dict[int, VoiceState] = {}
 
-        self._interaction_cache: Dict[Union[int, str], Tuple[int, Optional[str], MessageableChannel]] = {}
+        self._interaction_cache: MutableMapping[
+            Union[int, str], Tuple[int, Optional[str], MessageableChannel]
+        ] = self._create_cache('interactions')
         self._interactions: OrderedDict[Union[int, str], Interaction] = OrderedDict()  # LRU of max size 15
         self._relationships: Dict[int, Relationship] = {}
         self._private_channels: Dict[int, PrivateChannel] = {}
         self._private_channels_by_user: Dict[int, DMChannel] = {}
 
-        self._guild_presences: Dict[int, Dict[int, Presence]] = {}
-        self._presences: Dict[int, Presence] = {}
+        self._guild_presences: Dict[int, MutableMapping[int, Presence]] = {}
+        self._presences: MutableMapping[int, Presence] = self._create_cache('presences')
+        # Content key -> Presence, shared by every guild the user is in
+        self._presence_pool: weakref.WeakValueDictionary[Tuple[Any, ...], Presence] = weakref.WeakValueDictionary()
         self._sessions: Dict[str, Session] = {}
 
         if self.max_messages is not None:
@@ -1125,8 +1237,9 @@ class ConnectionState:
         else:
             self._messages: Optional[Deque[Message]] = None
 
-        self.experiments: Dict[int, UserExperiment] = {}
-        self.guild_experiments: Dict[int, GuildExperiment] = {}
+        self._experiments: Dict[int, UserExperiment] = {}
+        self._guild_experiments: Dict[int, GuildExperiment] = {}
+        self._deferred_sections: Dict[str, Any] = {}
 
         if full:
             self.subscriptions: GuildSubscriptions = GuildSubscriptions(self)
@@ -1163,6 +1276,125 @@ class ConnectionState:
     async def async_setup(self) -> None:
         pass
 
+    @property
+    def consents(self) -> Optional[TrackingSettings]:
+        self._load_deferred('consents')
+        return self._consents
+
+    @property
+    def tutorial(self) -> Tutorial:
+        self._load_deferred('tutorial')
+        return self._tutorial
+
+    @property
+    def experiments(self) -> Dict[int, UserExperiment]:
+        self._load_deferred('experiments')
+        return self._experiments
+
+    @property
+    def guild_experiments(self) -> Dict[int, GuildExperiment]:
+        self._load_deferred('guild_experiments')
+        return self._guild_experiments
+
+    def _load_deferred(self, section: str) -> None:
+        try:
+            data = self._deferred_sections.pop(section)
+        except KeyError:
+            return
+
+        try:
+            self._parse_ready_section(section, data)
+        except Exception:
+            _log.exception('Failed to parse deferred READY section %s.', section)
+
+    def _parse_ready_section(self, section: str, data: Any) -> None:
+        if section == 'consents':
+            self._consents = TrackingSettings(data=data, state=self)
+        elif section == 'tutorial':
+            self._tutorial = Tutorial(state=self, data=data)
+        elif section == 'experiments':
+            self._experiments = {exp[0]: UserExperiment(state=self, data=exp) for exp in data}
+        elif section == 'guild_experiments':
+            self._guild_experiments = {exp[0]: GuildExperiment(state=self, data=exp) for exp in data}
+
+    def _create_cache(self, name: str) -> MutableMapping[Any, Any]:
+        policy = self._cache_policies.get(name)
+        if policy is None:
+            return {}
+        return policy.create_cache()
+
+    def cache_stats(self, *, sample: Optional[int] = 100) -> Dict[str, CacheStats]:
+        def nested(caches: Iterable[MutableMapping[Any, Any]]) -> Tuple[List[MutableMapping[Any, Any]], int]:
+            caches = list(caches)
+            return caches, sum(len(cache) for cache in caches)
+
+        def measure(cache: Any, values: Optional[Iterable[Any]] = None, count: Optional[int] = None) -> CacheStats:
+            if values is None:
+                values = cache.values()
+            return _measure_cache(cache, values, len(cache) if count is None else count, sample)
+
+        presences, presence_count = nested(self._guild_presences.values())
+        read_states, read_state_count = nested(self._read_states.values())
+        messages = self._messages if self._messages is not None else ()
+
+        stats = {
+            'users': measure(self._users),
+            'guilds': measure(self._guilds),
+            'emojis': measure(self._emojis),
+            'stickers': measure(self._stickers),
+            'messages': measure(messages, messages),
+            'presences': measure(self._presences),
+            'guild_presences': measure(
+                self._guild_presences, itertools.chain.from_iterable(p.values() for p in presences), presence_count
+            ),
+            'read_states': measure(
+                self._read_states, itertools.chain.from_iterable(r.values() for r in read_states), read_state_count
+            ),
+            'guild_settings': measure(self.guild_settings),
+            'experiments': measure(self._experiments),
+            'guild_experiments': measure(self._guild_experiments),
+            'private_channels': measure(self._private_channels),
+            'relationships': measure(self._relationships),
+            'calls': measure(self._calls),
+            'call_messages': measure(self._call_message_cache),
+            'voice_states': measure(self._voice_states),
+            'interactions': measure(self._interaction_cache),
+        }
+
+        # Per-guild caches are summed over every guild
+        for name, caches in (
+            ('members', [guild._members for guild in self._guilds.values()]),
+            ('channels', [guild._channels for guild in self._guilds.values()]),
+            ('threads', [guild._threads for guild in self._guilds.values()]),
+            ('roles', [guild._roles for guild in self._guilds.values()]),
+        ):
+            count = size = 0
+            for cache in caches:
+                entry = self._measure_guild_cache(cache, sample)
+                count += entry.count
+                size += entry.size
+            stats[name] = CacheStats(count, size)
+
+        return stats
+
+    def guild_cache_stats(self, guild: Guild, *, sample: Optional[int] = 100) -> Dict[str, CacheStats]:
+        presences = self._guild_presences.get(guild.id, {})
+        return {
+            'members': self._measure_guild_cache(guild._members, sample),
+            'channels': self._measure_guild_cache(guild._channels, sample),
+            'threads': self._measure_guild_cache(guild._threads, sample),
+            'roles': self._measure_guild_cache(guild._roles, sample),
+            'voice_states': self._measure_guild_cache(guild._voice_states, sample),
+            'presences': self._measure_guild_cache(presences, sample),
+        }
+
+    @staticmethod
+    def _measure_guild_cache(cache: Any, sample: Optional[int]) -> CacheStats:
+        if isinstance(cache, (dict, BoundedCache)):
+            return _measure_cache(cache, cache.values(), len(cache), sample)
+        # Compact stores know their own footprint, and sampling them would materialise members
+        return CacheStats(len(cache), sys.getsizeof(cache))
+
     @property
     def session_id(self) -> Optional[str]:
         if self.ws:
@@ -1246,6 +1478,10 @@ class ConnectionState:
             user = User(state=self, data=data)
             if cache:
                 self._users[user_id] = user
+                if self._user_names is not None:
+                    # A collected user may still have an entry, which would keep its old place in the order
+                    self._user_names.discard(user_id)
+                    self._user_names.add(user)
             return user
 
     def create_user(self, data: Union[UserPayload, PartialUserPayload], cache: bool = False) -> User:
@@ -1257,6 +1493,49 @@ class ConnectionState:
     def get_user(self, id: int) -> Optional[User]:
         return self._users.get(id)
 
+    def _get_user_named(self, name: str, /) -> Optional[User]:
+        users = self._users
+        index = self._user_names
+        # Users are only weakly referenced so collected ones are never removed from
+        # the index; rebuild it once they make up most of it
+        if index is None or len(index) > 2 * len(users) + 1000:
+            index = self._user_names = NameIndex('name', 'global_name', objects=list(users.values()))
+
+        username, _, discriminator = name.rpartition('#')
+
+        # If # isn't found then "discriminator" actually has the username
+        if not username:
+            discriminator, username = username, discriminator
+
+        if discriminator == '0' or (len(discriminator) == 4 and discriminator.isdigit()):
+            attrs: Tuple[str, ...] = ('name',)
+            lookup = username
+            pred = lambda u: u.name == username and u.discriminator == discriminator
+        else:
+            attrs = ('name', 'global_name')
+            lookup = name
+            pred = lambda u: u.name == name or u.global_name == name
+
+        # Same approach as Guild.get_member_named, collected users are skipped
+        for user_id in index.find(attrs, lookup):
+            user = users.get(user_id)
+            if user is not None and pred(user):
+                return user
+        return None
+
+    def _update_user_names(self, user: Union[User, ClientUser], /) -> None:
+        # Called when a cached user's name or global name changes, members share
+        # the user so the member indexes need updating too
+        index = self._user_names
+        if index is not None and user.id in index:
+            index.add(user)
+
+        for guild in self._guilds.values():
+            if guild._member_names is not None:
+                member = guild._members.get(user.id)
+                if member is not None:
+                    guild._update_member_names(member)
+
     def store_emoji(self, guild: Guild, data: EmojiPayload) -> Emoji:
         # The id will be present here
         emoji_id = int(data['id'])  # type: ignore
@@ -1369,6 +1648,23 @@ class ConnectionState:
         self._add_guild(guild)
         return guild
 
+    async def _reconcile_guilds(self, guilds: List[GuildPayload]) -> None:
+        old_guilds, self._guilds = self._guilds, {}
+        for guild_data in guilds:
+            guild = old_guilds.pop(int(guild_data['id']), None)
+            if guild is not None:
+                guild._reconcile(guild_data)
+                self._add_guild(guild)
+            else:
+                self._add_guild_from_data(guild_data)
+            await asyncio.sleep(0)
+
+        if old_guilds:
+            # We left (or were removed from) these guilds while disconnected
+            _log.debug('Dropping %d guilds that are no longer present after reconnecting.', len(old_guilds))
+
+        self._reconciling = False
+
     def _guild_needs_chunking(self, guild: Guild) -> bool:
         return self._chunk_guilds and not guild.chunked and not guild.unavailable
 
@@ -1572,10 +1868,28 @@ class ConnectionState:
             manager.blocked = False
             self._ready_task = None
 
-    def parse_ready(self, data: gw.ReadyEvent) -> None:
+    def _can_reconcile(self, data: gw.ReadyEvent) -> bool:
+        # Only a re-IDENTIFY of the same account can reuse the existing cache
+        return self._reconcile_ready and self.user is not None and self.user.id == int(data['user']['id'])
+
+    async def parse_ready(self, data: gw.ReadyEvent) -> None:
         if self._ready_task is not None:
             self._ready_task.cancel()
-        self.clear()
+
+        if self._can_reconcile(data):
+            # The session could not be resumed, but the new READY mostly describes what is already cached
+            # Guilds are updated in place in READY_SUPPLEMENTAL rather than rebuilt, which keeps
+            # existing references (and the message cache) valid
+            guilds, users, messages = self._guilds, self._users, self._messages
+            self.clear()
+            self._guilds, self._users = guilds, users
+            if messages is not None and self._messages is not None:
+                self._messages = messages
+            self._reconciling = True
+            self.gateway_stats.reconciled_readies += 1
+        else:
+            self.clear()
+            self._reconciling = False
         self._ready_data = data
 
         # Clear the ACK token
@@ -1587,28 +1901,40 @@ class ConnectionState:
 
         # Read state parsing
         read_states = data.get('read_state', {})
-        for read_state in read_states.get('entries', []):
+        for index, read_state in enumerate(read_states.get('entries', []), 1):
             item = ReadState(state=self, data=read_state)
             self.store_read_state(item)
+            if not index % self.READY_CHUNK_SIZE:
+                await asyncio.sleep(0)
         self.read_state_version = read_states.get('version', 0)
 
         # Guild settings parsing
         guild_settings = data.get('user_guild_settings', {})
-        self.guild_settings = {
-            utils._get_as_snowflake(entry, 'guild_id'): GuildSettings(data=entry, state=self)
-            for entry in guild_settings.get('entries', [])
-        }
+        for index, entry in enumerate(guild_settings.get('entries', []), 1):
+            self.guild_settings[utils._get_as_snowflake(entry, 'guild_id')] = GuildSettings(data=entry, state=self)
+            if not index % self.READY_CHUNK_SIZE:
+                await asyncio.sleep(0)
         self.guild_settings_version = guild_settings.get('version', 0)
 
-        # Experiments
-        self.experiments = {exp[0]: UserExperiment(state=self, data=exp) for exp in data.get('experiments', [])}
-        self.guild_experiments = {exp[0]: GuildExperiment(state=self, data=exp) for exp in data.get('guild_experiments', [])}
+        # Non-essential sections
+        sections = {
+            'experiments': data.get('experiments', []),
+            'guild_experiments': data.get('guild_experiments', []),
+            'consents': data.get('consents', {}),
+        }
+        if data.get('tutorial'):
+            sections['tutorial'] = data['tutorial']
+        if self._defer_ready_sections:
+            self._deferred_sections = sections
+        else:
+            for section, section_data in sections.items():
+                self._parse_ready_section(section, section_data)
+            await asyncio.sleep(0)
 
         # Extras
         self.analytics_token = data.get('analytics_token')
         self.preferred_rtc_regions = data.get('geo_ordered_rtc_regions', ['us-central'])
         self.settings = UserSettings(self, data.get('user_settings_proto') or '')
-        self.consents = TrackingSettings(data=data.get('consents', {}), state=self)
         self.country_code = data.get('country_code', 'US')
         self.api_code_version = data.get('api_code_version', 1)
         self.session_type = data.get('session_type', 'normal')
@@ -1624,13 +1950,10 @@ class ConnectionState:
         if 'auth_token' in data:
             self.http._token(data['auth_token'])
 
-        if 'tutorial' in data and data['tutorial']:
-            self.tutorial = Tutorial(state=self, data=data['tutorial'])
-
         # Before parsing the rest, we wait for READY_SUPPLEMENTAL
         # This has voice state objects as well as an initial member cache
 
-    def parse_ready_supplemental(self, extra_data: gw.ReadySupplementalEvent) -> None:
+    async def parse_ready_supplemental(self, extra_data: gw.ReadySupplementalEvent) -> None:
         data = self._ready_data
 
         # Temp user parsing
@@ -1672,12 +1995,18 @@ class ConnectionState:
                     if member:
                         voice_state['member'] = member
 
-        # Guild parsing
-        for guild_data in data.get('guilds', []):
-            self._add_guild_from_data(guild_data)
+        # Guild parsing, yielding after every guild as large guilds take a while to build
+        if self._reconciling:
+            await self._reconcile_guilds(data.get('guilds', []))
+        else:
+            for guild_data in data.get('guilds', []):
+                self._add_guild_from_data(guild_data)
+                await asyncio.sleep(0)
 
         # Relationship parsing
-        for relationship in data.get('relationships', []):
+        for index, relationship in enumerate(data.get('relationships', []), 1):
+            if not index % self.READY_CHUNK_SIZE:
+                await asyncio.sleep(0)
             try:
                 r_id = int(relationship['id'])
             except KeyError:
@@ -1693,7 +2022,10 @@ class ConnectionState:
             self.store_presence(user_id, self.create_presence(presence))
 
         # Private channel parsing
-        for pm in data.get('private_channels', []) + extra_data.get('lazy_private_channels', []):
+        private_channels = data.get('private_channels', []) + extra_data.get('lazy_private_channels', [])
+        for index, pm in enumerate(private_channels, 1):
+            if not index % self.READY_CHUNK_SIZE:
+                await asyncio.sleep(0)
             factory, _ = _private_channel_factory(pm['type'])
             if 'recipients' not in pm:
                 pm['recipients'] = [temp_users[int(u_id)] for u_id in pm.pop('recipient_ids')]  # type: ignore
@@ -1929,13 +2261,16 @@ class ConnectionState:
         user = data['user']
         user_id = int(user['id'])
 
-        presence = self.get_presence(user_id, guild_id)
-        if presence is not None:
+        old_presence = self.get_presence(user_id, guild_id)
+        if isinstance(old_presence, FakeClientPresence):
+            # Our own presence is derived from our sessions, so it has to be snapshotted
+            presence = old_presence
             old_presence = Presence._copy(presence)
-            presence._update(data, self)
         else:
-            old_presence = Presence._offline()
+            # Presences are interned and immutable, so swapping the reference is enough
             presence = self.store_presence(user_id, self.create_presence(data), guild_id)
+            if old_presence is None:
+                old_presence = Presence._offline()
 
         if not guild:
             try:
@@ -1980,6 +2315,8 @@ class ConnectionState:
         user: ClientUser = self.user  # type: ignore
         old_user = copy.copy(user)
         user._full_update(data)
+        if (old_user.name, old_user.global_name) != (user.name, user.global_name):
+            self._update_user_names(user)
         self.dispatch('user_update', old_user, user)
 
     def parse_user_note_update(self, data: gw.UserNoteUpdateEvent) -> None:
@@ -2235,6 +2572,8 @@ class ConnectionState:
             if channel is not None:
                 old_channel = copy.copy(channel)
                 channel._update(guild, data)  # type: ignore # the data payload varies based on the channel type
+                if old_channel.name != channel.name:
+                    guild._channel_names = None
                 self.dispatch('guild_channel_update', old_channel, channel)
             else:
                 _log.debug('CHANNEL_UPDATE referencing an unknown channel ID: %s. Discarding.', channel_id)
@@ -3047,6 +3386,8 @@ class ConnectionState:
             if role is not None:
                 old_role = copy.copy(role)
                 role._update(role_data)
+                if old_role.name != role.name:
+                    guild._role_names = None
                 self.dispatch('guild_role_update', old_role, role)
         else:
             _log.debug('GUILD_ROLE_UPDATE referencing an unknown guild ID: %s. Discarding.', data['guild_id'])
@@ -3614,7 +3955,12 @@ class ConnectionState:
         return FakeClientPresence(self)
 
     def create_presence(self, data: gw.BasePresenceUpdate) -> Presence:
-        return Presence(data, self)
+        key = Presence._make_key(data)
+        try:
+            return self._presence_pool[key]
+        except KeyError:
+            presence = self._presence_pool[key] = Presence(data, self, key)
+            return presence
 
     def create_offline_presence(self) -> Presence:
         return Presence._offline()
@@ -3652,7 +3998,7 @@ class ConnectionState:
         if guild_id is not None:
             guild = self._guild_presences.get(guild_id)
             if guild is None:
-                guild = self._guild_presences[guild_id] = {}
+                guild = self._guild_presences[guild_id] = self._create_cache('presences')
             guild[user_id] = presence
         else:
             self._presences[user_id] = presence
@@ -3689,7 +4035,7 @@ class ConnectionState:
         try:
             group = self._read_states[read_state.type.value]
         except KeyError:
-            group = self._read_states[read_state.type.value] = {}
+            group = self._read_states[read_state.type.value] = self._create_cache('read_states')
         group[read_state.id] = read_state
 
     @utils.cached_property
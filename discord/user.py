@@ -1085,6 +1085,8 @@ class User(BaseUser, discord.abc.Connectable, discord.abc.Messageable):
                 self._primary_guild,
                 self._display_name_style,
             ) = modified
+            if to_return.name != self.name or to_return.global_name != self.global_name:
+                self._state._update_user_names(self)
             # Signal to dispatch user_update
             return to_return, self
 
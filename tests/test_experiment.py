@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.experiment
+
+"""
+
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from discord.experiment import GuildExperiment
+from discord.utils import murmurhash32
+
+
+def make_guild(id: int, features=()) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=id,
+        features=list(features),
+        member_count=10,
+        vanity_url_code=None,
+        hub_type=None,
+        created_at=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+
+
+def test_guild_experiment_bucket_cache(mocker):
+    name = '2021-01_test_experiment'
+    population = [
+        [[1, [{'s': 0, 'e': 9999}]]],
+        [[1604612045, [[1183251248, ['COMMUNITY']]]]],
+    ]
+    data = [murmurhash32(name, signed=False), name, 1, [population], [], [], None, None, 0, 0]
+    experiment = GuildExperiment(state=None, data=data)  # type: ignore
+
+    guild = make_guild(1)
+    compute = mocker.spy(GuildExperiment, '_compute_bucket')
+    assert experiment.bucket_for(guild) == -1  # type: ignore
+    assert experiment.bucket_for(guild) == -1  # type: ignore
+    assert compute.call_count == 1
+
+    # Changing the guild's features invalidates the cached bucket
+    guild.features.append('COMMUNITY')
+    assert experiment.bucket_for(guild) == 1  # type: ignore
+    assert compute.call_count == 2
+
+    guilds = [guild, make_guild(2), make_guild(3, ['COMMUNITY'])]
+    assert experiment.buckets_for(guilds) == {1: 1, 2: -1, 3: 1}  # type: ignore
+
+
+def test_guild_experiment_buckets_for_nameless_override():
+    data = [1234, None, 1, [], [{'b': 2, 'k': ['1']}], [], None, None, 0, 0]
+    experiment = GuildExperiment(state=None, data=data)  # type: ignore
+
+    # Overrides resolve guilds without the experiment name, just like bucket_for
+    assert experiment.bucket_for(make_guild(1)) == 2  # type: ignore
+    assert experiment.buckets_for([make_guild(1)]) == {1: 2}  # type: ignore
+    with pytest.raises(ValueError):
+        experiment.buckets_for([make_guild(1), make_guild(2)])  # type: ignore
+
+
+def test_guild_experiment_buckets_for_batches(mocker):
+    name = '2021-01_test_experiment'
+    population = [[[1, [{'s': 0, 'e': 9999}]]], []]
+    data = [murmurhash32(name, signed=False), name, 1, [population], [], [], None, None, 0, 0]
+    experiment = GuildExperiment(state=None, data=data)  # type: ignore
+
+    utcnow = mocker.patch('discord.experiment.utcnow', return_value=datetime.datetime.now(datetime.timezone.utc))
+    guilds = [make_guild(id) for id in range(1, 601)]
+    assert set(experiment.buckets_for(guilds).values()) == {1}  # type: ignore
+    assert utcnow.call_count == 1
+
+    # The bucket cache is bounded
+    assert len(experiment._bucket_cache) == 512
@@ -0,0 +1,123 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Literal, Optional, Union
+
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands.view import StringView
+
+
+class Counter(commands.Converter[int]):
+    def __init__(self) -> None:
+        self.seen = 0
+
+    async def convert(self, ctx: commands.Context, argument: str) -> int:
+        if not argument.isdigit():
+            raise commands.BadArgument(argument)
+        self.seen += 1
+        return self.seen
+
+
+async def parse(command: commands.Command, content: str) -> commands.Context:
+    message = SimpleNamespace(content=content, attachments=[], _state=None)
+    ctx = commands.Context(prefix='!', view=StringView(content), bot=None, message=message)  # type: ignore
+    await command._parse_arguments(ctx)
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_parse_arguments_plan():
+    @commands.command()
+    async def cmd(
+        ctx,
+        number: Union[int, float],
+        mode: Literal[1, '2', 2],
+        counts: commands.Greedy[Counter],
+        maybe: Optional[int] = None,
+        *,
+        rest: str,
+    ):
+        ...
+
+    ctx = await parse(cmd, '1.5 2 7 8 9 hello world ')
+    assert ctx.args[1:] == [1.5, '2', [1, 2, 3], None]
+    assert ctx.kwargs == {'rest': 'hello world'}
+
+    # Greedy converters get a fresh instance every invocation
+    ctx = await parse(cmd, '1 1 7 5 x rest')
+    assert ctx.args[1:] == [1, 1, [1, 2], None]
+    assert ctx.kwargs == {'rest': 'x rest'}
+
+    with pytest.raises(commands.BadUnionArgument):
+        await parse(cmd, 'x 1 rest')
+    with pytest.raises(commands.BadLiteralArgument):
+        await parse(cmd, '1 3 rest')
+    with pytest.raises(commands.MissingRequiredArgument):
+        await parse(cmd, '1 1')
+
+
+@pytest.mark.asyncio
+async def test_parse_arguments_recompiled():
+    @commands.command(rest_is_raw=True)
+    async def cmd(ctx, *values: int):
+        ...
+
+    ctx = await parse(cmd, '1 2 3')
+    assert ctx.args[1:] == [1, 2, 3]
+
+    async def other(ctx, value: int, *, text: str):
+        ...
+
+    cmd.update(name='other')
+    cmd.callback = other
+    ctx = await parse(cmd, '4  some  text')
+    assert ctx.args[1:] == [4]
+    assert ctx.kwargs == {'text': '  some  text'}
+
+    # Assigning params recompiles the plan
+    params = cmd.params.copy()
+    del params['text']
+    cmd.params = params
+    ctx = await parse(cmd, '5 ignored')
+    assert ctx.args[1:] == [5]
+    assert ctx.kwargs == {}
+
+
+@pytest.mark.asyncio
+async def test_run_converters():
+    ctx = SimpleNamespace(view=StringView('x'))
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+
+    assert await commands.run_converters(ctx, Union[int, str], '5', param) == 5  # type: ignore
+    assert await commands.run_converters(ctx, Literal['a', 2], '2', param) == 2  # type: ignore
+    assert await commands.run_converters(ctx, Counter, '3', param) == 1  # type: ignore
+    with pytest.raises(commands.BadArgument):
+        await commands.run_converters(ctx, int, 'x', param)  # type: ignore
+    with pytest.raises(commands.BadLiteralArgument):
+        await commands.run_converters(ctx, Literal['a', 2], 'b', param)  # type: ignore
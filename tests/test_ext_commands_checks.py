@@ -0,0 +1,109 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from discord.ext import commands
+
+
+def make_context(bot, *, author_id=2, channel_id=10):
+    return SimpleNamespace(
+        bot=bot,
+        command=None,
+        author=SimpleNamespace(id=author_id),
+        channel=SimpleNamespace(id=channel_id),
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_check():
+    calls = []
+
+    async def predicate(ctx):
+        calls.append(ctx.author.id)
+        if ctx.author.id == 3:
+            raise commands.MissingPermissions(['manage_guild'])
+        return True
+
+    async def callback(ctx):
+        pass
+
+    command = commands.Command(callback, name='test')
+    commands.check(predicate, cache_ttl=60)(command)
+    bot = commands.Bot(command_prefix='!')
+
+    assert await command.can_run(make_context(bot))  # type: ignore
+    assert await command.can_run(make_context(bot))  # type: ignore
+    assert calls == [2]
+
+    for _ in range(2):
+        with pytest.raises(commands.MissingPermissions):
+            await command.can_run(make_context(bot, author_id=3))  # type: ignore
+    assert calls == [2, 3]
+
+    assert await command.can_run(make_context(bot, channel_id=11))  # type: ignore
+    assert calls == [2, 3, 2]
+
+
+@pytest.mark.parametrize('concurrent', [False, True])
+@pytest.mark.asyncio
+async def test_concurrent_checks(concurrent):
+    bot = commands.Bot(command_prefix='!', concurrent_checks=concurrent)
+    running = []
+    peak = 0
+
+    def make_check(result):
+        async def predicate(ctx):
+            nonlocal peak
+            running.append(result)
+            peak = max(peak, len(running))
+            await asyncio.sleep(0)
+            running.remove(result)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return predicate
+
+    async def callback(ctx):
+        pass
+
+    command = commands.Command(callback, name='test')
+    command.checks = [make_check(True), make_check(commands.NotOwner()), make_check(False)]
+    with pytest.raises(commands.NotOwner):
+        await command.can_run(make_context(bot))  # type: ignore
+
+    command.checks = [make_check(True), make_check(False), make_check(commands.NotOwner())]
+    assert not await command.can_run(make_context(bot))  # type: ignore
+
+    bot.add_check(make_check(False))
+    with pytest.raises(commands.CheckFailure, match='global check'):
+        await command.can_run(make_context(bot))  # type: ignore
+
+    assert peak == (4 if concurrent else 1)
@@ -0,0 +1,176 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from discord.ext import commands
+
+
+def test_cooldown_mapping_expiry():
+    mapping = commands.CooldownMapping.from_cooldown(1, 10, lambda key: key)
+
+    for key in range(100):
+        assert mapping.update_rate_limit(key, 1000.0) is None
+    assert mapping.update_rate_limit(5, 1001.0) == 9.0
+    assert len(mapping._cache) == 100
+
+    # key 50 keeps being used, so it outlives the others
+    mapping.update_rate_limit(50, 1008.0)
+    mapping.get_bucket(0, 1010.5)
+    assert set(mapping._cache) == {0, 5, 50}
+
+    mapping.get_bucket(1, 1017.0)
+    assert set(mapping._cache) == {1, 50}
+    mapping.get_bucket(1, 1020.0)
+    assert set(mapping._cache) == {1}
+
+    copy = mapping.copy()
+    copy.get_bucket(2, 1030.0)
+    assert set(copy._cache) == {2}
+    assert set(mapping._cache) == {1}
+
+
+@pytest.mark.parametrize('shared', [False, True])
+def test_cooldown_storage(tmp_path, shared):
+    def make_storage():
+        if shared:
+            return commands.SQLiteStorage(str(tmp_path / 'cooldowns.db'))
+        return storage
+
+    storage = commands.MemoryStorage()
+    first = commands.CooldownMapping.from_cooldown(2, 10, lambda key: key, storage=make_storage())
+    second = commands.CooldownMapping.from_cooldown(2, 10, lambda key: key, storage=make_storage())
+
+    assert first.update_rate_limit('a', 1000.0) is None
+    assert second.update_rate_limit('a', 1001.0) is None
+    assert first.update_rate_limit('a', 1002.0) == 8.0
+    assert second.update_rate_limit('b', 1002.0) is None
+    assert second.get_bucket('a', 1003.0).get_tokens(1003.0) == 0
+
+    # the state outlives the local handles
+    first._cache.clear()
+    assert first.update_rate_limit('a', 1004.0) == 6.0
+    assert second.update_rate_limit('a', 1010.5) is None
+
+    second.get_bucket('a').reset()
+    assert first.get_bucket('a', 1011.0).get_tokens(1011.0) == 2
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_batches_updates(tmp_path, monkeypatch):
+    storage = commands.SQLiteStorage(str(tmp_path / 'cooldowns.db'))
+    mapping = commands.CooldownMapping.from_cooldown(2, 10, lambda key: key, storage=storage)
+    batches = []
+    write_batch = storage._write_batch
+
+    def record(batch):
+        batches.append(len(batch))
+        return write_batch(batch)
+
+    monkeypatch.setattr(storage, '_write_batch', record)
+
+    buckets = [mapping.get_bucket(key, 1000.0) for key in ('a', 'a', 'a', 'b')]
+    results = await asyncio.gather(*(bucket._update_rate_limit_async(1000.0) for bucket in buckets))  # type: ignore
+    assert results == [None, None, 10.0, None]
+    # all the checks went through a single transaction
+    assert batches == [4]
+    assert buckets[0].get_tokens(1000.0) == 0
+
+    buckets[0].reset()
+    assert buckets[0].get_tokens(1000.0) == 2
+    assert await buckets[0]._update_rate_limit_async(1001.0) is None  # type: ignore
+    # the reset is written along with the next check
+    assert batches == [4, 2]
+    storage.close()
+
+
+def test_cooldown_storage_keys():
+    storage = commands.MemoryStorage()
+    mapping = commands.CooldownMapping.from_cooldown(1, 10, commands.BucketType.member, storage=storage)
+    message = SimpleNamespace(guild=SimpleNamespace(id=1), author=SimpleNamespace(id=2))
+
+    mapping.update_rate_limit(message, 1000.0)  # type: ignore
+    assert list(storage._cooldowns) == ['1:2']
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_storage(tmp_path):
+    path = str(tmp_path / 'concurrency.db')
+    first = commands.MaxConcurrency(1, per=commands.BucketType.default, wait=False, storage=commands.SQLiteStorage(path))
+    second = first.copy()
+    second.storage = commands.SQLiteStorage(path)
+
+    await first.acquire(None)  # type: ignore
+    with pytest.raises(commands.MaxConcurrencyReached):
+        await second.acquire(None)  # type: ignore
+
+    # releasing a slot that wasn't acquired by this storage does nothing
+    await second.release(None)  # type: ignore
+    with pytest.raises(commands.MaxConcurrencyReached):
+        await second.acquire(None)  # type: ignore
+
+    await first.release(None)  # type: ignore
+    await second.acquire(None)  # type: ignore
+    first.storage.close()  # type: ignore
+    second.storage.close()  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_renews_leases(tmp_path):
+    path = str(tmp_path / 'concurrency.db')
+    first = commands.SQLiteStorage(path, lease=0.3)
+    second = commands.SQLiteStorage(path, lease=0.3)
+
+    assert await first.acquire('key', 1, wait=False)
+    await asyncio.sleep(0.5)
+    # the slot outlived its lease because it kept being renewed
+    assert not await second.acquire('key', 1, wait=False)
+
+    await first.release('key')
+    assert await second.acquire('key', 1, wait=False)
+    await second.release('key')
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_storage_concurrency():
+    storage = commands.MemoryStorage()
+
+    assert await storage.acquire('a', 2, wait=False)
+    assert await storage.acquire('a', 2, wait=False)
+    assert not await storage.acquire('a', 2, wait=False)
+    with pytest.raises(ValueError):
+        await storage.acquire('a', 1, wait=False)
+
+    await storage.release('a')
+    await storage.release('a')
+    # idle keys are dropped
+    assert storage._semaphores == {}
+    assert await storage.acquire('a', 1, wait=False)
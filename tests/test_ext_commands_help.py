@@ -0,0 +1,145 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import discord
+from discord.ext import commands
+
+
+class CountingHelpCommand(commands.DefaultHelpCommand):
+    renders = 0
+
+    def get_ending_note(self) -> str:
+        CountingHelpCommand.renders += 1
+        return super().get_ending_note()
+
+
+def make_context(bot, sent):
+    async def send(content):
+        sent.append(content)
+
+    return SimpleNamespace(
+        bot=bot,
+        command=None,
+        guild=None,
+        clean_prefix='!',
+        invoked_with='help',
+        author=SimpleNamespace(id=2),
+        channel=SimpleNamespace(id=10, send=send),
+    )
+
+
+async def send_help(bot, sent):
+    help_command = bot.help_command.copy()
+    help_command.context = make_context(bot, sent)
+    await help_command.send_bot_help(help_command.get_bot_mapping())
+
+
+@pytest.mark.asyncio
+async def test_help_page_cache():
+    CountingHelpCommand.renders = 0
+    help_command = CountingHelpCommand(page_cache=discord.CachePolicy(max_size=16), max_concurrent_checks=2)
+    bot = commands.Bot(command_prefix='!', help_command=help_command)
+    running = 0
+    peak = 0
+
+    async def slow_check(ctx):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return ctx.command.name != 'hidden'
+
+    for name in ('first', 'second', 'hidden'):
+
+        async def callback(ctx):
+            pass
+
+        bot.add_command(commands.check(slow_check)(commands.Command(callback, name=name)))
+
+    sent = []
+    await send_help(bot, sent)
+    await send_help(bot, sent)
+
+    # the checks of different commands ran concurrently, each on its own context
+    assert peak == 2
+    assert CountingHelpCommand.renders == 1
+    assert len(sent) == 2 and sent[0] == sent[1]
+    assert 'second' in sent[0] and 'hidden' not in sent[0]
+
+    async def third(ctx):
+        pass
+
+    bot.add_command(commands.Command(third, name='third'))
+    await send_help(bot, sent)
+    assert CountingHelpCommand.renders == 2
+    assert 'third' in sent[2]
+
+
+class AuthorHelpCommand(commands.DefaultHelpCommand):
+    def get_ending_note(self) -> str:
+        return f'Requested by {self.context.author.id}'
+
+    def get_page_cache_key(self):
+        return (*super().get_page_cache_key(), self.context.author.id)
+
+
+@pytest.mark.asyncio
+async def test_help_page_cache_key_and_sequential_checks():
+    bot = commands.Bot(command_prefix='!', help_command=AuthorHelpCommand(page_cache=discord.CachePolicy(max_size=16)))
+    running = 0
+    peak = 0
+
+    async def slow_check(ctx):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return True
+
+    for name in ('first', 'second'):
+
+        async def callback(ctx):
+            pass
+
+        bot.add_command(commands.check(slow_check)(commands.Command(callback, name=name)))
+
+    sent = []
+    await send_help(bot, sent)
+    help_command = bot.help_command.copy()
+    help_command.context = make_context(bot, sent)
+    help_command.context.author = SimpleNamespace(id=3)
+    await help_command.send_bot_help(help_command.get_bot_mapping())
+
+    # checks are verified one command at a time unless max_concurrent_checks is raised
+    assert peak == 1
+    assert 'Requested by 2' in sent[0] and 'Requested by 3' in sent[1]
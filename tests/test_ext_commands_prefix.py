@@ -0,0 +1,201 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import discord
+
+from discord.ext import commands
+from discord.ext.commands import bot as bot_module
+
+
+def make_bot(command_prefix, **options) -> commands.Bot:
+    bot = commands.Bot(command_prefix=command_prefix, **options)
+    bot._connection.user = SimpleNamespace(id=1)  # type: ignore
+    return bot
+
+
+def make_message(content: str, *, guild_id=None, channel_id=10):
+    guild = SimpleNamespace(id=guild_id) if guild_id is not None else None
+    return SimpleNamespace(
+        content=content,
+        _state=None,
+        author=SimpleNamespace(id=2, bot=False),
+        guild=guild,
+        channel=SimpleNamespace(id=channel_id),
+    )
+
+
+def test_prefix_matcher_priority():
+    matcher = commands.PrefixMatcher('!', '!?', '<@1> ', '')
+
+    assert matcher.match('!?help') == '!'
+    assert matcher.match('<@1> help') == '<@1> '
+    assert matcher.match('<@2> help') == ''
+    assert list(matcher) == ['!', '!?', '<@1> ', '']
+
+    matcher = commands.PrefixMatcher('!?', '!')
+    assert matcher.match('!?help') == '!?'
+    assert matcher.match('!help') == '!'
+    assert matcher.match('?help') is None
+    assert matcher.match('') is None
+
+    with pytest.raises(TypeError):
+        commands.PrefixMatcher('!', 1)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_get_context_prefix():
+    bot = make_bot(['?', '!'], strip_after_prefix=True)
+
+    @bot.command()
+    async def ping(ctx):
+        ...
+
+    ctx = await bot.get_context(make_message('! ping'))  # type: ignore
+    assert ctx.prefix == '!'
+    assert ctx.invoked_with == 'ping'
+    assert ctx.command is ping
+
+    ctx = await bot.get_context(make_message('hello'))  # type: ignore
+    assert ctx.prefix is None
+    assert ctx.command is None
+
+    bot.command_prefix = [1]  # type: ignore
+    with pytest.raises(TypeError):
+        await bot.get_context(make_message('hello'))  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_process_commands_rejects_early(mocker):
+    bot = make_bot('!')
+    make_context = mocker.spy(bot, '_make_context')
+    invoke = mocker.patch.object(bot, 'invoke')
+
+    await bot.process_commands(make_message('just chatting'))  # type: ignore
+    make_context.assert_not_called()
+    invoke.assert_not_called()
+
+    await bot.process_commands(make_message('!help'))  # type: ignore
+    make_context.assert_called_once()
+    invoke.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_callable_prefix_matcher_ttl():
+    calls = []
+
+    def get_prefix(bot, message):
+        calls.append(message)
+        return commands.PrefixMatcher('?', ttl=60)
+
+    bot = make_bot(get_prefix)
+
+    for _ in range(3):
+        ctx = await bot.get_context(make_message('?ping', guild_id=5))  # type: ignore
+        assert ctx.prefix == '?'
+    assert len(calls) == 1
+
+    await bot.get_context(make_message('?ping', guild_id=6))  # type: ignore
+    assert len(calls) == 2
+    assert await bot.get_prefix(make_message('?ping')) == ['?']  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_shared_prefix_matcher_ttl_starts_when_cached(monkeypatch):
+    matcher = commands.PrefixMatcher('?', ttl=60)
+    calls = []
+
+    def get_prefix(bot, message):
+        calls.append(message)
+        return matcher
+
+    now = 1000.0
+    monkeypatch.setattr(bot_module, 'time', SimpleNamespace(monotonic=lambda: now))
+    bot = make_bot(get_prefix)
+
+    # The matcher was created long before the bot first cached it.
+    now += 3600
+    await bot.get_context(make_message('?ping', guild_id=5))  # type: ignore
+    await bot.get_context(make_message('?ping', guild_id=5))  # type: ignore
+    assert len(calls) == 1
+
+    now += 61
+    await bot.get_context(make_message('?ping', guild_id=5))  # type: ignore
+    assert len(calls) == 2
+
+    # Returning the same instance again gets a fresh deadline.
+    now += 30
+    await bot.get_context(make_message('?ping', guild_id=5))  # type: ignore
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_prefix_cache_invalidation():
+    prefixes = {5: '?', 6: '$'}
+    calls = []
+
+    async def get_prefix(bot, message):
+        calls.append(message.guild.id)
+        return commands.when_mentioned_or(prefixes[message.guild.id])(bot, message)
+
+    bot = make_bot(get_prefix, prefix_cache=discord.CachePolicy(max_size=1))
+
+    for _ in range(3):
+        ctx = await bot.get_context(make_message('?ping', guild_id=5))  # type: ignore
+        assert ctx.prefix == '?'
+    ctx = await bot.get_context(make_message('<@1> ping', guild_id=5))  # type: ignore
+    assert ctx.prefix == '<@1> '
+    assert calls == [5]
+
+    # the cache only holds one guild
+    await bot.get_context(make_message('$ping', guild_id=6))  # type: ignore
+    await bot.get_context(make_message('?ping', guild_id=5))  # type: ignore
+    assert calls == [5, 6, 5]
+
+    prefixes[5] = '!'
+    ctx = await bot.get_context(make_message('!ping', guild_id=5))  # type: ignore
+    assert ctx.prefix is None
+
+    bot.invalidate_prefix(SimpleNamespace(id=5))  # type: ignore
+    ctx = await bot.get_context(make_message('!ping', guild_id=5))  # type: ignore
+    assert ctx.prefix == '!'
+    assert calls == [5, 6, 5, 5]
+
+    with pytest.raises(TypeError):
+        make_bot('!', prefix_cache=10)
+
+
+def test_when_mentioned_or_composed_once():
+    bot = make_bot('!')
+    get_prefix = commands.when_mentioned_or('!', '?')
+
+    first = get_prefix(bot, None)
+    assert first == ['<@1> ', '<@!1> ', '!', '?']
+    first.append('$')
+    assert get_prefix(bot, None) == ['<@1> ', '<@!1> ', '!', '?']
@@ -178,3 +178,170 @@ def test_task_date_resolve(dt, key, expected):
     actual = tasks.resolve_datetime(dt.replace(tzinfo=tz))
     expected = expected.replace(tzinfo=tz)
     assert actual == expected
+
+
+@pytest.mark.asyncio
+async def test_scheduler_drives_loops():
+    scheduler = tasks.Scheduler(resolution=0.05)
+    runs = [0] * 50
+
+    def make_loop(index):
+        async def inner():
+            runs[index] += 1
+
+        return tasks.loop(seconds=0.05, count=3, scheduler=scheduler)(inner)
+
+    ticks = 0
+    wake = scheduler._wake
+
+    def counting_wake():
+        nonlocal ticks
+        ticks += 1
+        wake()
+
+    scheduler._wake = counting_wake  # type: ignore
+    loops = [make_loop(index) for index in range(50)]
+    await asyncio.wait_for(asyncio.gather(*(loop.start() for loop in loops)), timeout=5)
+
+    assert runs == [3] * 50
+    # relative loops sleep after every iteration, and loops due in the same tick are woken together
+    assert scheduler.wakeups == 150
+    assert ticks < 10
+    assert scheduler._timer is None and scheduler.pending == 0
+    assert scheduler.max_lag < 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_overrun():
+    scheduler = tasks.Scheduler()
+
+    async def inner():
+        await asyncio.sleep(0.05)
+
+    loop = tasks.loop(seconds=0.01, count=2, scheduler=scheduler)(inner)
+    await asyncio.wait_for(loop.start(), timeout=5)
+    assert scheduler.overruns == 2
+
+
+def test_scheduler_reused_across_event_loops():
+    scheduler = tasks.Scheduler()
+
+    @tasks.loop(seconds=60, scheduler=scheduler)
+    async def slow():
+        pass
+
+    async def run():
+        slow.start()
+        await asyncio.sleep(0.05)
+        assert scheduler.pending == 1
+
+    # The event loop is closed while the loop sleeps, leaving its cancelled sleep behind
+    asyncio.run(run())
+    asyncio.run(run())
+    slow.cancel()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_discards_cancelled_sleeps():
+    scheduler = tasks.Scheduler()
+
+    @tasks.loop(seconds=60, scheduler=scheduler)
+    async def first():
+        pass
+
+    @tasks.loop(seconds=120, scheduler=scheduler)
+    async def second():
+        pass
+
+    first.start()
+    second.start()
+    await asyncio.sleep(0.05)
+    assert len(scheduler._heap) == 2
+    timer = scheduler._timer
+
+    # Cancelling a sleep that isn't due next leaves its entry to be skipped later
+    second.cancel()
+    await asyncio.sleep(0.05)
+    assert len(scheduler._heap) == 2 and scheduler._timer is timer and scheduler.pending == 1
+
+    first.cancel()
+    await asyncio.sleep(0.05)
+    assert scheduler._heap == [] and scheduler._timer is None
+
+
+@pytest.mark.asyncio
+async def test_loop_overrun_skip():
+    durations = [0.25, 0.0, 0.0]
+
+    async def inner():
+        await asyncio.sleep(durations[loop.current_loop])
+
+    loop = tasks.loop(seconds=0.1, count=3, overrun='skip')(inner)
+    start = asyncio.get_running_loop().time()
+    await asyncio.wait_for(loop.start(), timeout=5)
+    elapsed = asyncio.get_running_loop().time() - start
+
+    # the iterations due at 0.1s and 0.2s are skipped, the loop resumes on the 0.1s grid
+    assert loop.stats.iterations == 3
+    assert loop.stats.overruns == 1
+    assert loop.stats.skipped == 2
+    assert 0.5 <= elapsed < 0.8
+    assert loop.stats.max_duration >= 0.25
+
+
+@pytest.mark.asyncio
+async def test_loop_overrun_concurrent():
+    running = 0
+    peak = 0
+
+    async def inner():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.15)
+        running -= 1
+
+    loop = tasks.loop(seconds=0.05, count=4, overrun='concurrent', max_concurrent=2)(inner)
+    await asyncio.wait_for(loop.start(), timeout=5)
+
+    assert peak == 2
+    assert running == 0
+    assert loop.stats.iterations == 4
+
+
+@pytest.mark.asyncio
+async def test_loop_concurrent_error():
+    async def inner():
+        raise RuntimeError('failed')
+
+    loop = tasks.loop(seconds=0.01, count=2, overrun='concurrent')(inner)
+    errors = []
+
+    @loop.error
+    async def on_error(exc):
+        errors.append(exc)
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(loop.start(), timeout=5)
+    assert len(errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_loop_timeout():
+    async def inner():
+        if loop.current_loop == 0:
+            await asyncio.sleep(10)
+
+    loop = tasks.loop(seconds=0, count=2, timeout=0.05)(inner)
+    await asyncio.wait_for(loop.start(), timeout=5)
+
+    assert loop.stats.timeouts == 1
+    assert loop.stats.iterations == 2
+
+
+def test_loop_invalid_overrun():
+    async def inner():
+        pass
+
+    with pytest.raises(ValueError):
+        tasks.loop(seconds=1, overrun='queue')(inner)  # type: ignore
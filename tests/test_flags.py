@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.flags and discord.enums fast paths
+
+"""
+
+from discord.enums import MessageType, try_enum
+from discord.flags import MessageFlags, SystemChannelFlags
+from discord.permissions import Permissions
+
+
+def test_flag_iteration_skips_aliases():
+    flags = MessageFlags._from_value(MessageFlags.ephemeral.flag)
+    items = dict(flags)
+    assert items['ephemeral'] is True
+    assert not any(value for name, value in items.items() if name != 'ephemeral')
+    assert 'view_channel' not in dict(Permissions.none())
+
+
+def test_flag_inversion():
+    assert (~Permissions.text()).value & Permissions.text().value == 0
+    assert ~~Permissions.text() == Permissions.text()
+
+    flags = SystemChannelFlags()
+    assert not any(value for _, value in flags)
+    flags.join_notifications = True
+    assert (~flags).value == SystemChannelFlags.join_notifications.flag
+
+
+def test_unknown_enum_values_are_shared():
+    unknown = try_enum(MessageType, 999)
+    assert unknown.name == 'unknown_999'
+    assert try_enum(MessageType, 999) is unknown
+    assert try_enum(MessageType, '999') is not unknown
+    assert try_enum(MessageType, 0) is MessageType.default
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.http
+
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from discord.http import HTTPClient, Ratelimit
+
+
+@pytest.mark.asyncio
+async def test_ratelimit_snapshot_roundtrip():
+    ratelimit = Ratelimit(None, 1)
+    ratelimit.limit = 5
+    ratelimit.remaining = 2
+    ratelimit.reset_after = 10.0
+    ratelimit.expires = ratelimit._loop.time() + 10.0
+
+    restored = Ratelimit(None, 1)
+    restored.restore(ratelimit.snapshot())
+    assert restored.limit == 5
+    assert restored.remaining == 2
+    assert restored.expires is not None
+    assert 9.0 < restored.reset_after <= 10.0
+
+    # An elapsed window restores to a full bucket
+    snapshot = ratelimit.snapshot()
+    snapshot['reset'] -= 20.0
+    restored = Ratelimit(None, 1)
+    restored.restore(snapshot)
+    assert restored.remaining == 5
+    assert restored.expires is None
+
+
+@pytest.mark.asyncio
+async def test_ratelimit_cache_persistence(tmp_path):
+    path = os.fspath(tmp_path / 'ratelimits.json')
+    loop = asyncio.get_running_loop()
+
+    http = HTTPClient(loop=loop)
+    http._bucket_hashes['GET /users/{user_id}'] = 'abcdef'
+    ratelimit = http.get_ratelimit('abcdef:')
+    ratelimit.limit = 10
+    await http.save_ratelimits(path)
+
+    http = HTTPClient(loop=loop)
+    await http.load_ratelimits(path)
+    assert http._bucket_hashes == {'GET /users/{user_id}': 'abcdef'}
+    assert http._buckets['abcdef:'].limit == 10
+
+    # Stale entries are discarded
+    http = HTTPClient(loop=loop, ratelimit_cache_ttl=-1.0)
+    await http.load_ratelimits(path)
+    assert not http._bucket_hashes
+    assert not http._buckets
+
+    # Missing files are ignored
+    http = HTTPClient(loop=loop)
+    await http.load_ratelimits(os.fspath(tmp_path / 'missing.json'))
+    assert not http._buckets
+
+
+@pytest.mark.asyncio
+async def test_ratelimit_cache_merges_processes(tmp_path):
+    path = os.fspath(tmp_path / 'ratelimits.json')
+    loop = asyncio.get_running_loop()
+
+    first = HTTPClient(loop=loop)
+    first._bucket_hashes['GET /users/{user_id}'] = 'abcdef'
+    first.get_ratelimit('abcdef:').limit = 10
+    first.get_ratelimit('shared:').limit = 1
+
+    second = HTTPClient(loop=loop)
+    second._bucket_hashes['GET /guilds/{guild_id}'] = '123456'
+    second.get_ratelimit('123456:').limit = 20
+    second.get_ratelimit('shared:').limit = 2
+
+    await first.save_ratelimits(path)
+    await second.save_ratelimits(path)
+
+    http = HTTPClient(loop=loop)
+    await http.load_ratelimits(path)
+    assert http._bucket_hashes == {'GET /users/{user_id}': 'abcdef', 'GET /guilds/{guild_id}': '123456'}
+    assert http._buckets['abcdef:'].limit == 10
+    assert http._buckets['123456:'].limit == 20
+    # The most recently used entry of a shared bucket wins
+    assert http._buckets['shared:'].limit == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_requests(mocker):
+    from discord.http import Route
+
+    http = HTTPClient(loop=asyncio.get_running_loop(), coalesce_requests=True, request_cache_ttl=60.0)
+    calls = 0
+
+    async def _request(route, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {'id': '1', 'params': kwargs.get('params')}
+
+    mocker.patch.object(http, '_request', _request)
+
+    route = Route('GET', '/users/{user_id}', user_id=1)
+    first, second = await asyncio.gather(http.request(route), http.request(route))
+    assert calls == 1
+    assert first == second
+    assert first is not second
+
+    # Served from the response cache
+    await http.request(Route('GET', '/users/{user_id}', user_id=1))
+    assert calls == 1
+
+    # Different parameters and non-GET requests are not shared
+    await http.request(route, params={'with_mutual_guilds': 'true'})
+    await asyncio.gather(*(http.request(Route('POST', '/users/{user_id}', user_id=1)) for _ in range(2)))
+    assert calls == 4
+
+
+@pytest.mark.asyncio
+async def test_coalesced_requests_copy_only_for_extra_callers(mocker):
+    from discord.http import Route
+
+    http = HTTPClient(loop=asyncio.get_running_loop(), coalesce_requests=True)
+    responses = []
+
+    async def _request(route, **kwargs):
+        await asyncio.sleep(0.01)
+        responses.append({'id': '1'})
+        return responses[-1]
+
+    mocker.patch.object(http, '_request', _request)
+    route = Route('GET', '/users/{user_id}', user_id=1)
+
+    # A lone caller gets the response itself
+    assert await http.request(route) is responses[0]
+
+    results = await asyncio.gather(*(http.request(route) for _ in range(3)))
+    assert sum(result is responses[1] for result in results) == 1
+    assert all(result == responses[1] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_inactive_ratelimits_are_evicted():
+    loop = asyncio.get_running_loop()
+    http = HTTPClient(loop=loop)
+
+    stale = http.get_ratelimit('stale:')
+    busy = http.get_ratelimit('busy:')
+    stale._last_request -= Ratelimit.INACTIVITY_TIMEOUT
+    busy._last_request -= Ratelimit.INACTIVITY_TIMEOUT
+    busy.outgoing = 1
+    http._bucket_deadlines = [(stale.inactive_at(), 'stale:'), (busy.inactive_at(), 'busy:')]
+
+    http.get_ratelimit('fresh:')
+    assert 'stale:' not in http._buckets
+    assert 'busy:' in http._buckets
+    assert 'fresh:' in http._buckets
+
+    stats = http.ratelimit_stats()
+    assert stats['buckets'] == 2
+    assert stats['scheduled_evictions'] == 2
+
+
+@pytest.mark.asyncio
+async def test_connection_stats():
+    from curl_cffi.requests import Response
+    from discord.http import CurlInfo
+
+    http = HTTPClient(loop=asyncio.get_running_loop())
+    for connects, version in ((1, 3), (0, 3), (0, 2)):
+        response = Response()
+        response.infos[CurlInfo.NUM_CONNECTS] = connects
+        response.http_version = version
+        http._record_connection(response)
+
+    stats = http.connection_stats()
+    assert stats['requests'] == 3
+    assert stats['new_connections'] == 1
+    assert stats['reused_connections'] == 2
+    assert stats['http_versions'] == {'2': 2, '1.1': 1}
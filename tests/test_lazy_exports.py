@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for the lazily loaded names of the discord package
+
+"""
+
+import importlib
+import subprocess
+import sys
+import types
+
+import discord
+
+
+def public_names(module: types.ModuleType):
+    try:
+        return set(module.__all__)
+    except AttributeError:
+        # Packages re-exporting their submodules with star imports
+        return {k for k, v in vars(module).items() if not k.startswith('_') and not isinstance(v, types.ModuleType)}
+
+
+def test_lazy_exports_match_modules():
+    for module, names in discord._lazy_exports.items():
+        assert set(names) == public_names(importlib.import_module(f'discord.{module}')), module
+
+
+def test_lazy_exports_resolve():
+    for name, module in discord._lazy_names.items():
+        assert getattr(discord, name) is getattr(importlib.import_module(f'discord.{module}'), name)
+    assert discord.utils is importlib.import_module('discord.utils')
+
+
+def test_import_is_lazy():
+    code = 'import sys, discord; print("discord.client" in sys.modules, discord.Client.__name__)'
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    assert output.split() == ['False', 'Client']
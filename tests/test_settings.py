@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.settings
+
+"""
+
+import base64
+from types import SimpleNamespace
+
+import pytest
+from discord_protos import PreloadedUserSettings
+
+from discord.enums import Theme
+from discord.settings import UserSettings
+from discord.utils import MISSING
+
+
+def encode(**fields) -> str:
+    return base64.b64encode(PreloadedUserSettings(**fields).SerializeToString()).decode('ascii')
+
+
+def test_user_settings_decode_lazily():
+    data = encode(versions={'client_version': 17, 'data_version': 5})
+    settings = UserSettings(None, data)  # type: ignore
+    assert settings._settings is None
+    assert settings.to_base64() == data
+
+    # Partial updates are queued until the settings are decoded
+    settings._update(encode(versions={'data_version': 6}), partial=True)
+    copy = UserSettings._copy(settings)
+    assert settings._settings is None and copy._settings is None
+    assert settings.data_version == 6
+    assert settings.client_version == 17
+    assert copy == settings
+
+    settings._update(encode(versions={'data_version': 7}), partial=True)
+    assert settings.data_version == 7
+    assert copy.data_version == 6
+
+
+def make_settings(data: str, sent: list) -> UserSettings:
+    async def edit_proto_settings(type, payload, required_data_version):
+        sent.append(payload)
+        return {'settings': payload}
+
+    state = SimpleNamespace(http=SimpleNamespace(edit_proto_settings=edit_proto_settings))
+    return UserSettings(state, data)  # type: ignore
+
+
+def decode(data: str) -> PreloadedUserSettings:
+    message = PreloadedUserSettings()
+    message.ParseFromString(base64.b64decode(data))
+    return message
+
+
+@pytest.mark.asyncio
+async def test_user_settings_edit_patches_sections():
+    sent = []
+    settings = make_settings(
+        encode(
+            appearance={'theme': 2, 'developer_mode': True, 'client_theme_settings': {'primary_color': {'value': 5}}},
+            text_and_images={'render_embeds': {'value': False}},
+        ),
+        sent,
+    )
+
+    new = await settings.edit(client_theme=(10,), developer_mode=MISSING)
+    patch = decode(sent[0])
+
+    # Only the touched section is sent, with its other fields copied from the current settings
+    assert patch.HasField('appearance') and not patch.HasField('text_and_images')
+    assert patch.appearance.theme == 2
+    assert patch.appearance.client_theme_settings.primary_color.value == 10
+    assert not patch.appearance.developer_mode
+
+    assert new.theme is Theme.light
+    assert new.client_theme[0] == 10
+    assert new.developer_mode is False
+
+    # The edited instance is left untouched
+    assert settings.developer_mode is True
+    assert settings.client_theme[0] == 5
+    assert settings.render_embeds is False
+
+
+@pytest.mark.asyncio
+async def test_user_settings_edit_resets_nested_field():
+    sent = []
+    settings = make_settings(
+        encode(appearance={'theme': 2, 'client_theme_settings': {'primary_color': {'value': 5}}}),
+        sent,
+    )
+
+    await settings.edit(client_theme=MISSING)
+    patch = decode(sent[0])
+    assert not patch.appearance.HasField('client_theme_settings')
+    assert patch.appearance.theme == 2
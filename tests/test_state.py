@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.state
+
+"""
+
+import asyncio
+
+import pytest
+
+from discord.role import Role
+from discord.state import ConnectionState, Presence
+
+
+def make_state(**options) -> ConnectionState:
+    state = ConnectionState(dispatch=lambda *args: None, handlers={}, hooks={}, http=None, client=None, **options)  # type: ignore
+    state.loop = asyncio.get_running_loop()
+    return state
+
+
+@pytest.mark.asyncio
+async def test_presences_are_interned():
+    state = make_state()
+    data = {
+        'status': 'online',
+        'client_status': {'desktop': 'online'},
+        'activities': [{'type': 0, 'name': 'Game'}],
+    }
+
+    first = state.store_presence(1, state.create_presence(data), 10)
+    second = state.store_presence(1, state.create_presence(dict(data)), 11)
+    assert first is second
+    assert state.get_presence(1, 10) is state.get_presence(1, 11)
+
+    idle = state.create_presence({**data, 'status': 'idle'})
+    assert idle is not first
+    assert idle != first
+    assert Presence._offline() != first
+
+    # Offline presences without activities are not stored
+    state.store_presence(1, state.create_presence({'status': 'offline', 'activities': []}), 10)
+    assert state.get_presence(1, 10) is None
+
+
+@pytest.mark.asyncio
+async def test_compact_member_store():
+    from discord.guild import Guild
+    from discord.member import CompactMemberStore
+
+    state = make_state(compact_member_threshold=2)
+    members = [
+        {
+            'user': {'id': str(i), 'username': f'user{i}', 'discriminator': '0', 'avatar': None},
+            'roles': ['3', '1'],
+            'joined_at': '2021-01-01T00:00:00+00:00',
+            'nick': 'nick' if i % 2 else None,
+        }
+        for i in range(1, 6)
+    ]
+    guild = Guild(data={'id': '100', 'member_count': 5, 'members': members}, state=state)  # type: ignore
+    assert isinstance(guild._members, CompactMemberStore)
+    assert len(guild.members) == 5
+
+    member = guild.get_member(3)
+    assert member is not None
+    assert member is guild.get_member(3)
+    assert member.nick == 'nick'
+    assert list(member._roles) == [1, 3]
+    assert member.joined_at is not None and member.joined_at.year == 2021
+
+    # Updates are written back to the store
+    member._update({'user': members[2]['user'], 'roles': ['7'], 'nick': 'changed'})  # type: ignore
+    del member
+    member = guild.get_member(3)
+    assert member is not None
+    assert member.nick == 'changed'
+    assert list(member._roles) == [7]
+
+    guild._remove_member(guild.get_member(1))  # type: ignore
+    assert guild.get_member(1) is None
+    assert sorted(m.id for m in guild.members) == [2, 3, 4, 5]
+    assert guild.get_member(5).nick == 'nick'  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_compact_member_store_presence():
+    import gc
+
+    from discord.enums import Status
+    from discord.guild import Guild
+
+    state = make_state(compact_member_threshold=2)
+    members = [
+        {
+            'user': {'id': str(i), 'username': f'user{i}', 'discriminator': '0', 'avatar': None},
+            'roles': [],
+            'joined_at': '2021-01-01T00:00:00+00:00',
+        }
+        for i in range(1, 4)
+    ]
+    guild = Guild(data={'id': '100', 'member_count': 3, 'members': members}, state=state)  # type: ignore
+    state._add_guild(guild)
+
+    state.parse_presence_update(
+        {'guild_id': '100', 'user': {'id': '2'}, 'status': 'online', 'client_status': {'desktop': 'online'}, 'activities': []}  # type: ignore
+    )
+    gc.collect()
+    assert guild.get_member(2).status is Status.online  # type: ignore
+
+    # Presences and attributes set directly on a view are written back to the store
+    member = guild.get_member(3)
+    assert member is not None
+    member._presence_update({'status': 'idle', 'client_status': {'desktop': 'idle'}, 'activities': []}, ())  # type: ignore
+    member.nick = 'direct'
+    del member
+    gc.collect()
+    member = guild.get_member(3)
+    assert member is not None
+    assert member.status is Status.idle
+    assert member.nick == 'direct'
+
+
+@pytest.mark.asyncio
+async def test_cache_stats():
+    from discord.guild import Guild
+
+    state = make_state()
+    members = [
+        {'user': {'id': str(i), 'username': f'user{i}', 'discriminator': '0', 'avatar': None}, 'roles': []}
+        for i in range(1, 11)
+    ]
+    guild = Guild(data={'id': '100', 'member_count': 10, 'members': members}, state=state)  # type: ignore
+    state._add_guild(guild)
+
+    stats = state.cache_stats(sample=3)
+    assert stats['guilds'].count == 1
+    assert stats['members'].count == 10
+    assert stats['users'].count == 10
+    assert stats['members'].size > 0
+    assert stats['messages'].count == 0
+
+    assert state.guild_cache_stats(guild)['members'].count == 10
+    exact = state.cache_stats(sample=None)['members']
+    assert exact.count == 10
+
+    state.compact_member_threshold = 0
+    compact = Guild(data={'id': '101', 'member_count': 10, 'members': members}, state=state)  # type: ignore
+    compact_stats = state.guild_cache_stats(compact)['members']
+    assert compact_stats.count == 10
+    assert compact_stats.size > 0
+
+
+@pytest.mark.asyncio
+async def test_cache_policies(mocker):
+    from discord.cache import BoundedCache, CachePolicy
+
+    with pytest.raises(ValueError):
+        make_state(cache_policies={'messages': CachePolicy(max_size=1)})
+
+    state = make_state(cache_policies={'presences': CachePolicy(max_size=2), 'interactions': CachePolicy(ttl=10)})
+    assert isinstance(state._presences, BoundedCache)
+    assert type(state._read_states) is dict
+
+    data = {'status': 'online', 'client_status': {'desktop': 'online'}, 'activities': []}
+    for user_id in (1, 2, 3):
+        state.store_presence(user_id, state.create_presence(data))
+        if user_id == 2:
+            # Reading user 1 makes user 2 the least recently used
+            assert state.get_presence(1) is not None
+    assert state.get_presence(2) is None
+    assert state.get_presence(1) is not None and state.get_presence(3) is not None
+
+    state.store_presence(1, state.create_presence(data), 100)
+    assert isinstance(state._guild_presences[100], BoundedCache)
+
+    monotonic = mocker.patch('discord.cache.time.monotonic', return_value=0.0)
+    state._interaction_cache['nonce'] = (2, 'test', None)  # type: ignore
+    assert 'nonce' in state._interaction_cache
+    monotonic.return_value = 10.0
+    assert state._interaction_cache.get('nonce') is None
+    assert len(state._interaction_cache) == 0
+
+
+def test_bounded_cache_skips_expired_entries(mocker):
+    from discord.cache import BoundedCache
+
+    monotonic = mocker.patch('discord.cache.time.monotonic', return_value=0.0)
+    cache = BoundedCache(ttl=10, lru=False)
+    cache['a'] = 1
+    monotonic.return_value = 5.0
+    cache['b'] = 2
+    monotonic.return_value = 10.0
+
+    assert len(cache) == 1
+    assert list(cache) == ['b']
+    assert list(reversed(cache)) == ['b']
+    assert list(cache.keys()) == ['b']
+    assert list(cache.values()) == [2]
+    assert list(cache.items()) == [('b', 2)]
+
+    monotonic.return_value = 15.0
+    assert list(cache.values()) == []
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_ready_deferred_sections():
+    state = make_state(defer_ready_sections=True)
+    state.http = type('FakeHTTP', (), {'ack_token': 'token'})()  # type: ignore
+    data = {
+        'user': {'id': '1', 'username': 'me', 'discriminator': '0', 'avatar': None},
+        'experiments': [[123, 0, 1, -1, 0, 0, 0, 0, 0, 0, 0]],
+        'read_state': {'entries': [{'id': str(i), 'last_message_id': '1'} for i in range(1, 600)], 'version': 3},
+        'consents': {},
+    }
+    await state.parse_ready(data)  # type: ignore
+    assert state.http.ack_token is None
+    assert len(state._read_states[0]) == 599
+    assert state.read_state_version == 3
+
+    assert not state._experiments
+    assert 123 in state.experiments
+    assert 'experiments' not in state._deferred_sections
+    assert state.consents is not None
+    assert not state._deferred_sections.keys() - {'guild_experiments'}
+
+
+@pytest.mark.asyncio
+async def test_name_indexes():
+    from discord.guild import Guild
+
+    state = make_state()
+    members = [
+        {
+            'user': {
+                'id': str(i),
+                'username': f'user{i}',
+                'global_name': f'Global {i}',
+                'discriminator': '0',
+                'avatar': None,
+            },
+            'roles': [],
+            'nick': 'nick' if i == 3 else None,
+        }
+        for i in range(1, 6)
+    ]
+    guild = Guild(data={'id': '100', 'member_count': 5, 'members': members}, state=state)  # type: ignore
+    state._add_guild(guild)
+
+    assert guild.get_member_named('user2').id == 2  # type: ignore
+    assert guild.get_member_named('user2#0').id == 2  # type: ignore
+    assert guild.get_member_named('Global 4').id == 4  # type: ignore
+    assert guild.get_member_named('nick').id == 3  # type: ignore
+    assert guild.get_member_named('user2#1234') is None
+    assert state._get_user_named('user5').id == 5  # type: ignore
+
+    # Renames arrive through member and user updates
+    member = guild.get_member(3)
+    member._update({'user': members[2]['user'], 'roles': [], 'nick': 'renamed'})  # type: ignore
+    assert guild.get_member_named('nick') is None
+    assert guild.get_member_named('renamed') is member
+
+    member._user._update_self({**members[2]['user'], 'username': 'newname'})  # type: ignore
+    assert guild.get_member_named('user3') is None
+    assert guild.get_member_named('newname') is member
+    assert state._get_user_named('user3') is None
+    assert state._get_user_named('newname') is member._user  # type: ignore
+
+    guild._remove_member(member)  # type: ignore
+    assert guild.get_member_named('renamed') is None
+    guild._add_member(member)  # type: ignore
+    assert guild.get_member_named('renamed') is member
+
+    # Channels and roles are reindexed when they change
+    guild._add_role(Role(guild=guild, state=state, data={'id': '7', 'name': 'mods'}))  # type: ignore
+    assert guild._get_role_named('mods').id == 7  # type: ignore
+    guild._remove_role(7)
+    assert guild._get_role_named('mods') is None
+
+
+@pytest.mark.asyncio
+async def test_name_index_collisions_and_renames():
+    from discord.guild import Guild
+
+    state = make_state()
+    users = [('1', 'alpha', 'beta'), ('2', 'gamma', 'alpha'), ('3', 'beta', None)]
+    members = [
+        {
+            'user': {'id': id, 'username': username, 'global_name': global_name, 'discriminator': '0', 'avatar': None},
+            'roles': [],
+            'nick': 'alpha' if id == '3' else None,
+        }
+        for id, username, global_name in users
+    ]
+    guild = Guild(data={'id': '100', 'member_count': 3, 'members': members}, state=state)  # type: ignore
+    state._add_guild(guild)
+
+    # Like a scan, the first member matching any of nick, global name or name wins
+    assert guild.get_member_named('alpha').id == 1  # type: ignore
+    assert guild.get_member_named('beta').id == 1  # type: ignore
+    assert state._get_user_named('alpha').id == 1  # type: ignore
+
+    # User renames update the member index of every guild
+    member = guild.get_member(2)
+    member._user._update_self({**members[1]['user'], 'username': 'delta'})  # type: ignore
+    assert guild.get_member_named('delta') is member
+    assert state._get_user_named('delta') is member._user  # type: ignore
+    assert guild.get_member_named('gamma') is None
+
+    # Renamed members keep their place in the order
+    first = guild.get_member(1)
+    first._user._update_self({**members[0]['user'], 'global_name': 'zeta'})  # type: ignore
+    assert guild.get_member_named('beta').id == 3  # type: ignore
+    first._user._update_self({**members[0]['user'], 'global_name': 'beta'})  # type: ignore
+    assert guild.get_member_named('beta') is first
@@ -67,6 +67,7 @@ def test_snowflake_time(snowflake: int, time_tuple: typing.Tuple[int, int, int,
     assert (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second) == time_tuple
 
     assert utils.time_snowflake(dt, high=False) <= snowflake <= utils.time_snowflake(dt, high=True)
+    assert utils.snowflake_timestamp(snowflake) == int(dt.timestamp() * 1000)
 
 
 @pytest.mark.asyncio